@@ -1,6 +1,11 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework.request import Request
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from config.metrics import JWT_VALIDATION
 
 
 class JWTCookieAuthentication(JWTAuthentication):
@@ -18,6 +23,10 @@ class JWTCookieAuthentication(JWTAuthentication):
 
         return access
 
+    def get_validated_token(self, raw_token: bytes):
+        with JWT_VALIDATION.time():
+            return super().get_validated_token(raw_token)
+
     def authenticate(self, request: Request):
         access = self.get_access_cookie(request)
         if access is None:  # header 확인
@@ -29,3 +38,59 @@ class JWTCookieAuthentication(JWTAuthentication):
             return None
 
         return self.get_user(validated_token), validated_token
+
+    async def aauthenticate(self, request):
+        """
+        async view 에서 사용하는 authenticate.
+        토큰 검증은 CPU 연산이므로 그대로 수행하고, 사용자 조회만 async ORM 으로 수행함.
+        """
+
+        access = self.get_access_cookie(request)
+        if access is None:  # header 확인
+            header = self.get_header(request)
+            if header is None:
+                return None
+
+            raw_token = self.get_raw_token(header)
+            if raw_token is None:
+                return None
+
+            validated_token = self.get_validated_token(raw_token)
+            return await self.aget_user(validated_token), validated_token
+
+        try:
+            validated_token = self.get_validated_token(access)
+        except InvalidToken:
+            return None
+
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        """
+        get_user 의 async 버전 (objects.get -> objects.aget)
+        """
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = await self.user_model.objects.aget(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
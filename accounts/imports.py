@@ -0,0 +1,165 @@
+"""
+사용자 NDJSON 일괄 가져오기 (manage.py import_users).
+
+각 줄({"username", "email", "fullname", "password"})은 UserSerializer 의 필드 검증만 수행하고,
+username 중복은 chunk 마다 한번의 쿼리로 확인함.
+비밀번호 hashing(PBKDF2)은 사용자 한명에 수백 ms 가 걸리는 CPU 연산이므로
+process pool 에서 병렬로 수행하여 core 수에 비례하여 처리량이 늘어나도록 하고,
+hashing 된 사용자는 chunk 별 transaction 에서 bulk_create 로 저장함.
+"""
+
+import math
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from rest_framework import serializers
+
+from accounts.models import User, VerificationMail
+from accounts.serializers import UserSerializer
+from accounts.tasks import send_pending_verification_mails
+from accounts.utils import make_verification_url
+from config.ndjson import Line, Progress, read_chunks
+from config.publisher import task_publisher
+
+
+class UserImportSerializer(UserSerializer):
+    # UniqueValidator 는 row 마다 조회하므로 username 중복은 chunk 단위로 확인
+    username = serializers.CharField(max_length=20)
+
+
+class UserImporter:
+    def __init__(
+        self,
+        batch_size: int,
+        processes: int,
+        active: bool = False,
+        send_verification: bool = False,
+    ):
+        self.serializer = UserImportSerializer()  # 필드를 한번만 생성하도록 재사용
+        self.batch_size = batch_size
+        self.processes = processes
+        self.active = active
+        self.send_verification = send_verification
+        self.executor = None
+
+        # 파일 안에서 중복된 username 확인 (이전 chunk 에서 저장한 username 은 DB 에서 확인됨)
+        self.usernames: set[str] = set()
+
+    def run(
+        self,
+        file: BinaryIO,
+        chunk_size: int,
+        on_progress: Callable[[Progress], None] | None = None,
+    ) -> Progress:
+        progress = Progress(offset=file.tell())
+
+        if self.processes > 1:
+            # spawn 방식의 process 에서도 hasher 설정을 읽을 수 있도록 Django 초기화
+            self.executor = ProcessPoolExecutor(
+                self.processes, initializer=django.setup
+            )
+
+        try:
+            for lines, next_offset in read_chunks(file, chunk_size):
+                progress.update(lines, self.import_chunk(lines), next_offset)
+
+                if on_progress is not None:
+                    on_progress(progress)
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(cancel_futures=True)
+                self.executor = None
+
+        return progress
+
+    def import_chunk(self, lines: list[Line]) -> int:
+        for line in lines:
+            if line.error is None:
+                self.validate(line)
+
+        valid = [line for line in lines if line.error is None]
+        existing = set(
+            User.objects.filter(
+                username__in=[line.data["username"] for line in valid]
+            ).values_list("username", flat=True)
+        )
+
+        users = []
+        for line in valid:
+            username = line.data["username"]
+            if username in existing or username in self.usernames:
+                line.error = {"username": "이미 존재하는 사용자입니다."}
+                continue
+
+            self.usernames.add(username)
+            users.append(
+                User(
+                    username=username,
+                    email=User.objects.normalize_email(line.data["email"]),
+                    fullname=line.data["fullname"],
+                    password=line.data["password"],  # hash_passwords 에서 변경
+                    is_active=self.active,
+                )
+            )
+
+        self.hash_passwords(users)
+
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=self.batch_size)
+            if self.send_verification and users:
+                self.create_verification_mails(users)
+
+        return len(users)
+
+    def validate(self, line: Line) -> None:
+        try:
+            line.data = self.serializer.run_validation(line.data)
+        except serializers.ValidationError as exc:
+            line.error = exc.detail
+
+    def hash_passwords(self, users: list[User]) -> None:
+        passwords = [user.password for user in users]
+
+        if self.executor is None:
+            hashed = map(make_password, passwords)
+        else:
+            # 작업 단위를 process 수의 몇 배로 나누어 전달 비용을 줄이면서 고르게 분배
+            chunksize = max(1, math.ceil(len(passwords) / (self.processes * 4)))
+            hashed = self.executor.map(make_password, passwords, chunksize=chunksize)
+
+        for user, password in zip(users, hashed):
+            user.password = password
+
+    def create_verification_mails(self, users: list[User]) -> None:
+        # bulk_create 에서 id 를 반환하지 않는 DB 는 username 으로 조회
+        if any(user.id is None for user in users):
+            ids = dict(
+                User.objects.filter(
+                    username__in=[user.username for user in users]
+                ).values_list("username", "id")
+            )
+            for user in users:
+                user.id = ids[user.username]
+
+        VerificationMail.objects.bulk_create(
+            [
+                VerificationMail(
+                    username=user.username,
+                    email=user.email,
+                    verification_url=make_verification_url(user),
+                )
+                for user in users
+            ],
+            batch_size=self.batch_size,
+        )
+
+        # chunk 의 메일을 batch 전송 task 하나로 발행 (UserSerializer 와 같은 방식)
+        transaction.on_commit(
+            lambda: task_publisher.publish(
+                send_pending_verification_mails, coalesce=True
+            )
+        )
@@ -0,0 +1,52 @@
+import os
+
+from django.conf import settings
+
+from accounts.imports import UserImporter
+from config.ndjson import ImportCommand
+
+
+class Command(ImportCommand):
+    help = (
+        "NDJSON 파일의 사용자를 일괄 저장합니다. (accounts.imports) "
+        "비밀번호 hashing 은 --processes 개의 process 에서 병렬로 수행합니다."
+    )
+    default_chunk_size = settings.USER_IMPORT_CHUNK_SIZE
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.USER_IMPORT_BATCH_SIZE,
+            help="한번의 INSERT 로 저장하는 row 수",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count(),
+            help="비밀번호를 hashing 하는 process 수 (기본값 CPU core 수)",
+        )
+
+        activation = parser.add_mutually_exclusive_group()
+        activation.add_argument(
+            "--active", action="store_true", help="email 인증 없이 활성화된 사용자로 저장"
+        )
+        activation.add_argument(
+            "--send-verification",
+            action="store_true",
+            help="저장한 사용자에게 email 인증 메일 전송",
+        )
+
+    def get_importer(
+        self, *, batch_size, processes, active, send_verification, **options
+    ):
+        return UserImporter(
+            batch_size,
+            max(processes, 1),
+            active=active,
+            send_verification=send_verification,
+        )
+
+    def get_name(self, **options) -> str:
+        return "users"
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-19 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_alter_user_is_active"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VerificationMail",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("username", models.CharField(max_length=20)),
+                ("email", models.EmailField(max_length=100, verbose_name="email")),
+                ("verification_url", models.CharField(max_length=255)),
+                (
+                    "created_date",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                ("claim_token", models.UUIDField(db_index=True, null=True)),
+                ("claimed_at", models.DateTimeField(null=True)),
+            ],
+        ),
+    ]
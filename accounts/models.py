@@ -1,9 +1,12 @@
+import uuid
+
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
     PermissionsMixin,
 )
 from django.db import models
+from django.utils import timezone
 
 
 # USER 생성 매니저
@@ -40,3 +43,54 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def __str__(self):
         return self.username
+
+
+class VerificationMailManager(models.Manager):
+    def claim(self, batch_size: int, claim_timeout) -> list["VerificationMail"]:
+        """
+        전송 대기중인 인증 메일을 최대 batch_size 개 선점(claim)하여 반환.
+        여러 worker 가 동시에 실행되어도 같은 메일을 중복 전송하지 않도록 claim_token 으로 선점하고,
+        claim_timeout 이 지나도록 전송되지 않은 메일은 다시 선점할 수 있음.
+        """
+
+        now = timezone.now()
+        claim_token = uuid.uuid4()
+
+        claimable = self.filter(
+            models.Q(claim_token__isnull=True)
+            | models.Q(claimed_at__lt=now - claim_timeout)
+        )
+        claimable_ids = list(
+            claimable.order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        claimable.filter(id__in=claimable_ids).update(
+            claim_token=claim_token, claimed_at=now
+        )
+
+        return list(self.filter(claim_token=claim_token).order_by("id"))
+
+    def release(self, mails: list["VerificationMail"]):
+        """
+        전송에 실패한 메일을 다시 전송할 수 있도록 선점 해제
+        """
+
+        self.filter(id__in=[mail.id for mail in mails]).update(
+            claim_token=None, claimed_at=None
+        )
+
+
+# 전송 대기중인 인증 메일 (accounts.tasks.send_pending_verification_mails 에서 전송)
+class VerificationMail(models.Model):
+    username = models.CharField(max_length=20)
+    email = models.EmailField(verbose_name="email", max_length=100)
+    verification_url = models.CharField(max_length=255)
+    created_date = models.DateTimeField("생성일", auto_now_add=True, null=False)
+
+    # 전송중인 worker 정보 (VerificationMailManager.claim)
+    claim_token = models.UUIDField(null=True, db_index=True)
+    claimed_at = models.DateTimeField(null=True)
+
+    objects = VerificationMailManager()
+
+    def __str__(self):
+        return f"{self.username} 님의 인증 메일"
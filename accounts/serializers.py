@@ -1,38 +1,50 @@
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.tokens import default_token_generator
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 
-from accounts.models import User
-from accounts.tasks import send_verification_mail
-from accounts.utils import decode_uid, encode_uid
+from accounts.models import User, VerificationMail
+from accounts.tasks import send_pending_verification_mails
+from accounts.utils import decode_uid, make_verification_url
+from config.publisher import task_publisher
+from config.serializers import UpdateChangedFieldsMixin
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(UpdateChangedFieldsMixin, serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
 
     class Meta:
         model = User
         fields = ("id", "email", "password", "username", "fullname")
 
+    # 사용자와 인증 메일 정보를 하나의 transaction 으로 저장
+    @transaction.atomic
     def create(self, validated_data):
         user = User.objects.create_user(**validated_data)
         self._send_verification_email(user)
         return user
 
-    # Celery-Worker로 Email 전송 Task 전달
+    # 인증 메일을 전송 대기 목록에 추가하고 Celery-Worker로 batch 전송 Task 전달
+    # Task 는 사용자 정보가 commit 된 이후에 request 처리와 별도로 발행
     def _send_verification_email(self, user):
-        uid = encode_uid(user.id)
-        token = default_token_generator.make_token(user)
-        verification_url = (
-            f"http://localhost:8000/api/v1/accounts/activate/{uid}/{token}"
+        VerificationMail.objects.create(
+            username=user.username,
+            email=user.email,
+            verification_url=make_verification_url(user),
+        )
+        transaction.on_commit(
+            lambda: task_publisher.publish(
+                send_pending_verification_mails, coalesce=True
+            )
         )
-        send_verification_mail.delay(user.username, user.email, verification_url)
 
-    # 비밀번호는 hashing하고 저장
+    # 비밀번호는 hashing하고 저장 (기존과 같은 비밀번호는 변경하지 않음)
     def update(self, instance, validated_data):
         if "password" in validated_data:
-            validated_data["password"] = make_password(validated_data["password"])
+            password = validated_data.pop("password")
+            if not instance.check_password(password):
+                validated_data["password"] = make_password(password)
 
         return super().update(instance, validated_data)
 
@@ -1,5 +1,8 @@
+from smtplib import SMTPException
+
 from celery import shared_task
-from django.core.mail import EmailMessage
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
 from django.db import transaction
 from django.utils import timezone
 from rest_framework_simplejwt.token_blacklist.models import (
@@ -7,9 +10,12 @@ from rest_framework_simplejwt.token_blacklist.models import (
     OutstandingToken,
 )
 
+from accounts.models import VerificationMail
+
 
 # 만료된 JWT를 작제하는 TASK
-@shared_task
+# 다시 실행되어도 결과가 같으므로 작업이 끝난 뒤 ack (acks_late)
+@shared_task(ignore_result=True, acks_late=True)
 @transaction.atomic
 def clean_expiry_token():
     now_date = timezone.now()
@@ -28,14 +34,61 @@ def clean_expiry_token():
             Outstand_instance.delete()
 
 
-# 인증 메일을 보내는 TASK
-@shared_task
-def send_verification_mail(username: str, email: str, verification_url: str):
+def build_verification_mail(
+    username: str, email: str, verification_url: str, connection=None
+) -> EmailMessage:
     message = f"""이메일 인증을 완료하려면 아래의 링크를 클릭하세요.\n
     URL : {verification_url}
     """
 
-    email = EmailMessage(
-        subject=f"{username}님의 이메일 인증 링크입니다.", body=message, to=[email]
+    return EmailMessage(
+        subject=f"{username}님의 이메일 인증 링크입니다.",
+        body=message,
+        to=[email],
+        connection=connection,
     )
-    email.send()
+
+
+# 인증 메일을 보내는 TASK
+@shared_task(ignore_result=True)
+def send_verification_mail(username: str, email: str, verification_url: str):
+    build_verification_mail(username, email, verification_url).send()
+
+
+# 전송 대기중인 인증 메일을 하나의 SMTP 연결로 batch 전송하는 TASK
+# 전송한 메일은 바로 삭제하고, 전송에 실패할 경우 아직 전송하지 않은 메일만 선점을 해제하여
+# 지수적으로 증가하는 간격으로 재시도 (이미 전송한 메일은 다시 전송하지 않음)
+@shared_task(
+    ignore_result=True,
+    autoretry_for=(SMTPException, OSError),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    max_retries=5,
+)
+def send_pending_verification_mails(batch_size: int | None = None) -> int:
+    batch_size = batch_size or settings.VERIFICATION_MAIL_BATCH_SIZE
+    claim_timeout = settings.VERIFICATION_MAIL_CLAIM_TIMEOUT
+
+    mails = VerificationMail.objects.claim(batch_size, claim_timeout)
+    if not mails:  # 전송할 메일이 없으면 SMTP 연결을 생성하지 않음
+        return 0
+
+    sent = 0
+    try:
+        with get_connection() as connection:
+            while mails:
+                mail = mails[0]
+                message = build_verification_mail(
+                    mail.username, mail.email, mail.verification_url, connection
+                )
+                sent += connection.send_messages([message])
+                mail.delete()
+                del mails[0]
+
+                if not mails:
+                    mails = VerificationMail.objects.claim(batch_size, claim_timeout)
+    except Exception:
+        VerificationMail.objects.release(mails)
+        raise
+
+    return sent
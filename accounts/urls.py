@@ -9,9 +9,13 @@ from accounts.views import (
 )
 
 urlpatterns = [
-    path("users", UserAPIView.as_view()),
-    path("login", LoginAPIView.as_view()),
-    path("logout", LogoutAPIView.as_view()),
-    path("refresh", CustomTokenRefreshView.as_view()),
-    path("activate/<str:uidb64>/<str:token>", EmailVerificationView.as_view()),
+    path("users", UserAPIView.as_view(), name="user"),
+    path("login", LoginAPIView.as_view(), name="login"),
+    path("logout", LogoutAPIView.as_view(), name="logout"),
+    path("refresh", CustomTokenRefreshView.as_view(), name="token-refresh"),
+    path(
+        "activate/<str:uidb64>/<str:token>",
+        EmailVerificationView.as_view(),
+        name="email-verification",
+    ),
 ]
@@ -1,3 +1,4 @@
+from django.contrib.auth.tokens import default_token_generator
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 
@@ -21,3 +22,13 @@ def decode_uid(uidb64) -> int | None:
 
     except (ValueError, TypeError):
         return None
+
+
+def make_verification_url(user) -> str:
+    """
+    사용자의 email 인증 링크 생성 (저장된 사용자의 id, 비밀번호 hash 가 필요함)
+    """
+
+    uid = encode_uid(user.id)
+    token = default_token_generator.make_token(user)
+    return f"http://localhost:8000/api/v1/accounts/activate/{uid}/{token}"
@@ -16,11 +16,12 @@ from accounts.authentication import JWTCookieAuthentication
 from accounts.mixin import JWTCookieHandlerMixin
 from accounts.permissions import IsPostOrIsAuthenticated
 from accounts.serializers import EmailVerificationSerializer, UserSerializer
+from config.idempotency import IDEMPOTENCY_KEY_PARAMETER, IdempotentCreateMixin
 
 
 @extend_schema(tags=["user"])
-@extend_schema_view(post=extend_schema(auth=[]))
-class UserAPIView(CreateAPIView, RetrieveUpdateDestroyAPIView):
+@extend_schema_view(post=extend_schema(auth=[], parameters=[IDEMPOTENCY_KEY_PARAMETER]))
+class UserAPIView(IdempotentCreateMixin, CreateAPIView, RetrieveUpdateDestroyAPIView):
     """
     request를 보낸 사용자 리소스에 대한 CRUD API
     """
@@ -35,8 +36,18 @@ class UserAPIView(CreateAPIView, RetrieveUpdateDestroyAPIView):
         response = super().delete(request, *args, **kwargs)
         return self.blacklisted_token(response)
 
+    changed_fields: list[str] | None = None
+
+    def perform_update(self, serializer):
+        serializer.save()
+        self.changed_fields = serializer.changed_fields
+
     def update(self, request, *args, **kwargs):
         response = super().update(request, *args, **kwargs)
+
+        # 바뀐 필드가 없으면 저장하지 않았으므로 로그인 상태를 유지
+        if not self.changed_fields:
+            return response
         return self.blacklisted_token(response)
 
     def blacklisted_token(self, response: Response) -> Response:
@@ -120,8 +131,9 @@ class EmailVerificationView(APIView):
         serializer.is_valid(raise_exception=True)
 
         user = serializer.validated_data["user"]
-        user.is_active = True
-        user.save()
+        if not user.is_active:
+            user.is_active = True
+            user.save(update_fields=["is_active"])
 
         return Response(
             {"detail": f"{user.username}님의 이메일 인증이 완료되었습니다."}, status=status.HTTP_200_OK
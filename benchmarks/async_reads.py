@@ -0,0 +1,90 @@
+"""
+게시글 조회 API 의 sync(DRF) view 와 async view 를 ASGI handler 위에서 동시 요청으로 비교.
+
+두 view 모두 AsyncClient(ASGI handler) 로 요청하므로,
+sync view 는 sync_to_async 로 감싸진 스레드에서, async view 는 event loop 에서 실행됨.
+Django 4.2 의 async ORM 은 내부적으로 sync_to_async 로 쿼리를 실행하므로
+DB 처리량 자체보다는 요청당 스레드 점유 여부의 차이를 확인하는 용도임.
+
+실행 예시:
+```bash
+$ python3 -m benchmarks.async_reads --requests 500 --concurrency 50
+```
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.utils import print_report, seed_boards, setup_django, test_database
+
+setup_django()
+
+from django.test import AsyncClient, override_settings  # noqa: E402
+from django.urls import path  # noqa: E402
+
+from boards.views import (  # noqa: E402
+    PostDetailAPIView,
+    PostListCreateAPIView,
+    async_read_view,
+    post_detail_async_view,
+    post_list_async_view,
+)
+
+urlpatterns = [
+    path("sync/posts", PostListCreateAPIView.as_view()),
+    path("sync/posts/<int:pk>", PostDetailAPIView.as_view()),
+    path(
+        "async/posts",
+        async_read_view(post_list_async_view, PostListCreateAPIView.as_view()),
+    ),
+    path(
+        "async/posts/<int:pk>",
+        async_read_view(post_detail_async_view, PostDetailAPIView.as_view()),
+    ),
+]
+
+
+async def run(paths: list[str], concurrency: int) -> tuple[float, list[float]]:
+    client = AsyncClient()
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def request(url):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(url)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.status_code
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request(url) for url in paths))
+    return time.perf_counter() - started, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    with test_database(), override_settings(ROOT_URLCONF=__name__):
+        _, posts = seed_boards()
+
+        for mode in ("sync", "async"):
+            list_paths = [f"/{mode}/posts"] * args.requests
+            detail_paths = [
+                f"/{mode}/posts/{posts[i % len(posts)].pk}"
+                for i in range(args.requests)
+            ]
+
+            print_report(
+                f"{mode} list", *asyncio.run(run(list_paths, args.concurrency))
+            )
+            print_report(
+                f"{mode} detail", *asyncio.run(run(detail_paths, args.concurrency))
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+API 요청에 대한 middleware 처리 비용을 기존 전체 middleware 와 PathScopedMiddleware 로 비교.
+
+view 처리 비용을 제외하기 위해 아무 작업도 하지 않는 view 를 /api/v1/ 아래에 등록하고,
+BaseHandler 로 middleware chain 만 실행해 요청당 소요 시간을 측정함.
+
+실행 예시:
+```bash
+$ python3 -m benchmarks.middleware_overhead --requests 20000
+```
+"""
+
+import argparse
+import time
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from django.core.handlers.base import BaseHandler  # noqa: E402
+from django.http import HttpResponse  # noqa: E402
+from django.test import RequestFactory, override_settings  # noqa: E402
+from django.urls import path  # noqa: E402
+
+SCOPED_MIDDLEWARE = "config.middleware.PathScopedMiddleware"
+
+
+def get_full_middleware() -> list[str]:
+    """
+    현재 settings.MIDDLEWARE 에서 PathScopedMiddleware 를 PATH_SCOPED_MIDDLEWARE 로 펼친 설정
+    (PathScopedMiddleware 를 적용하지 않은 경우). 나머지 middleware 는 양쪽이 같음.
+    """
+
+    full = []
+    for middleware in settings.MIDDLEWARE:
+        if middleware == SCOPED_MIDDLEWARE:
+            full.extend(settings.PATH_SCOPED_MIDDLEWARE)
+        else:
+            full.append(middleware)
+    return full
+
+
+def ping(request):
+    return HttpResponse(b"{}", content_type="application/json")
+
+
+urlpatterns = [path("api/v1/ping", ping)]
+
+
+def measure(middleware: list[str], requests: int) -> float:
+    with override_settings(MIDDLEWARE=middleware, ROOT_URLCONF=__name__):
+        handler = BaseHandler()
+        handler.load_middleware()
+
+        request_factory = RequestFactory()
+        request_list = [request_factory.get("/api/v1/ping") for _ in range(requests)]
+
+        started = time.perf_counter()
+        for request in request_list:
+            handler.get_response(request)
+        return (time.perf_counter() - started) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=10000)
+    args = parser.parse_args()
+
+    full = measure(get_full_middleware(), args.requests)
+    scoped = measure(settings.MIDDLEWARE, args.requests)
+
+    print(f"full middleware   : {full * 1e6:8.1f}us / request")
+    print(f"scoped middleware : {scoped * 1e6:8.1f}us / request")
+    print(f"saved             : {(full - scoped) * 1e6:8.1f}us / request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+benchmark 스크립트에서 공통으로 사용하는 유틸리티.
+
+실행 예시:
+```bash
+$ python3 -m benchmarks.async_reads
+```
+"""
+
+import os
+import statistics
+from contextlib import contextmanager
+
+import django
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """
+    실제 DB 를 건드리지 않도록 테스트 DB 를 생성하고, 종료시 삭제
+    """
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, serialize=False)
+
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def seed_boards(posts: int = 100, comments_per_post: int = 10):
+    """
+    benchmark 용 사용자, 게시글, 댓글을 bulk_create 로 생성
+    """
+
+    from accounts.models import User
+    from boards.models import CommentModel, PostModel
+
+    user = User.objects.create_user(
+        username="benchmark",
+        password="password",
+        email="benchmark@example.com",
+        fullname="benchmark",
+        is_active=True,
+    )
+
+    post_list = PostModel.objects.bulk_create(
+        PostModel(owner=user, title=f"title-{i}", contents="contents" * 20)
+        for i in range(posts)
+    )
+    CommentModel.objects.bulk_create(
+        CommentModel(owner=user, post=post, contents="comment" * 10)
+        for post in post_list
+        for _ in range(comments_per_post)
+    )
+
+    return user, post_list
+
+
+def print_report(name: str, elapsed: float, latencies: list[float]):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+
+    print(
+        f"{name:<24} total={elapsed * 1000:9.1f}ms "
+        f"rps={len(latencies) / elapsed:9.1f} "
+        f"p50={statistics.median(latencies) * 1000:7.2f}ms "
+        f"p95={p95 * 1000:7.2f}ms"
+    )
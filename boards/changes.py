@@ -0,0 +1,90 @@
+"""
+게시글, 댓글 변경 피드 (GET /api/v1/boards/changes).
+
+게시글, 댓글은 (updated_date, id), 삭제 기록(BoardTombstone)은 (deleted_date, id) 순서로
+마지막으로 전달한 위치 이후의 변경을 반환함. 위치는 서명된 token 으로 전달하여 client 가 변경할 수 없음.
+"""
+
+from datetime import datetime
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+
+from boards.models import BoardTombstone, CommentModel, PostModel
+
+TOKEN_SALT = "boards.changes"
+
+# stream 이름: (queryset, 변경 시각 필드)
+STREAMS = {
+    "posts": (PostModel.objects.select_related("owner"), "updated_date"),
+    "comments": (CommentModel.objects.select_related("owner"), "updated_date"),
+    "deleted": (BoardTombstone.objects.all(), "deleted_date"),
+}
+
+
+class TokenExpired(Exception):
+    """
+    삭제 기록 보관 기간이 지난 token (전체 동기화가 필요함)
+    """
+
+
+def encode_token(position: dict) -> str:
+    return signing.dumps(position, salt=TOKEN_SALT, compress=True)
+
+
+def decode_token(token: str | None) -> dict:
+    """
+    token 을 stream 별 위치로 변환. token 이 없으면 처음부터 조회.
+    """
+
+    if not token:
+        return {"issued": None}
+
+    position = signing.loads(token, salt=TOKEN_SALT)  # BadSignature
+
+    issued = datetime.fromisoformat(position["issued"])
+    if issued < timezone.now() - settings.BOARD_TOMBSTONE_RETENTION:
+        raise TokenExpired
+
+    return position
+
+
+def get_changes(position: dict, limit: int) -> dict:
+    """
+    stream 별로 position 이후의 변경을 최대 limit 개 조회.
+
+    commit 이 늦은 transaction 의 변경을 건너뛰지 않도록
+    BOARD_CHANGES_SETTLE_TIME 이 지나지 않은 변경은 다음 조회에서 반환함.
+    """
+
+    until = timezone.now() - settings.BOARD_CHANGES_SETTLE_TIME
+    fetch_size = limit + 1  # 다음 변경이 있는지 확인하기 위해 하나 더 조회
+    changes = {"has_more": False}
+    next_position = {"issued": until.isoformat()}
+
+    for name, (queryset, field) in STREAMS.items():
+        queryset = queryset.filter(**{f"{field}__lt": until})
+
+        cursor = position.get(name)
+        if cursor is not None:
+            changed_date, pk = datetime.fromisoformat(cursor[0]), cursor[1]
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": changed_date})
+                | Q(**{field: changed_date, "id__gt": pk})
+            )
+
+        rows = list(queryset.order_by(field, "id")[:fetch_size])
+        if len(rows) > limit:
+            changes["has_more"] = True
+            rows = rows[:limit]
+
+        if rows:
+            cursor = [getattr(rows[-1], field).isoformat(), rows[-1].id]
+
+        changes[name] = rows
+        next_position[name] = cursor
+
+    changes["next"] = encode_token(next_position)
+    return changes
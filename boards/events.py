@@ -0,0 +1,67 @@
+"""
+게시글, 댓글 변경 이벤트 (transactional outbox).
+
+view 에서 변경과 같은 transaction 안에서 BoardEvent 를 저장하고, commit 이후
+boards.tasks.process_board_events 가 게시글 별 순서대로 settings.BOARD_EVENT_HANDLERS 에 전달함.
+cache 무효화, 카운터, 알림 등 쓰기 이후의 작업은 handler 로 추가.
+"""
+
+from django.db import transaction
+
+from boards.models import BoardEvent, CommentModel, PostModel
+from boards.serializers import CommentSerializer
+from boards.streams import comment_hub
+from config import metrics
+from config.publisher import task_publisher
+
+
+def record_board_event(instance: PostModel | CommentModel, action: str) -> BoardEvent:
+    """
+    게시글, 댓글 변경 이벤트를 outbox 에 저장 (변경과 같은 transaction 안에서 호출)
+    """
+
+    if isinstance(instance, PostModel):
+        model, post_id = "post", instance.id
+    else:
+        model, post_id = "comment", instance.post_id
+
+    event = BoardEvent.objects.create(
+        post_id=post_id, model=model, object_id=instance.id, action=action
+    )
+
+    from boards.tasks import process_board_events
+
+    transaction.on_commit(
+        lambda: task_publisher.publish(process_board_events, coalesce=True)
+    )
+    return event
+
+
+# handler: 게시글 id 와 해당 게시글의 이벤트 목록(생성 순서)을 인자로 받음
+def record_event_metrics(post_id: int, events: list[BoardEvent]):
+    for event in events:
+        metrics.BOARD_EVENTS.labels(event.model, event.action).inc()
+
+
+def publish_comment_events(post_id: int, events: list[BoardEvent]):
+    """
+    새 댓글을 댓글 stream(boards.streams) 구독자들에게 발행.
+    프로세스 안에서만 전달하는 backend 는 댓글을 생성한 요청에서 발행하므로(boards.signals) 제외.
+    발행에 실패하면 예외가 전달되어 이벤트 처리를 재시도하며, 중복 전달된 댓글은 stream 에서 id 로 제외됨.
+    """
+
+    if comment_hub.backend.in_process:
+        return
+
+    comment_ids = [
+        event.object_id
+        for event in events
+        if event.model == "comment" and event.action == BoardEvent.Action.CREATED
+    ]
+    if not comment_ids:
+        return
+
+    # 처리 전에 삭제된 댓글은 조회되지 않으므로 발행하지 않음
+    comments = CommentModel.objects.filter(id__in=comment_ids).select_related("owner")
+    for comment in comments.order_by("id"):
+        comment_hub.publish(post_id, CommentSerializer(comment).data)
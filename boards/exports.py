@@ -0,0 +1,153 @@
+"""
+게시글, 댓글 전체 내보내기 (GET /api/v1/boards/export/<model>.<format>, manage.py export_boards).
+
+id 순서로 BOARD_EXPORT_BATCH_SIZE 개씩 keyset(id > 마지막 id) 조회하고, 조회한 batch 단위로 변환하여
+전달하므로 전체 row 수와 관계없이 메모리 사용량이 일정하고 OFFSET 으로 앞의 row 를 다시 읽지 않음.
+"""
+
+import csv
+import json
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from boards.models import CommentModel, PostModel
+
+# 내보내기 이름: (model, [(열 이름, values_list 조회 경로)]), 첫번째 열은 keyset 기준인 id
+EXPORTS = {
+    "posts": (
+        PostModel,
+        [
+            ("id", "id"),
+            ("owner", "owner__username"),
+            ("title", "title"),
+            ("contents", "contents"),
+            ("created_date", "created_date"),
+            ("updated_date", "updated_date"),
+            ("version", "version"),
+        ],
+    ),
+    "comments": (
+        CommentModel,
+        [
+            ("id", "id"),
+            ("post", "post_id"),
+            ("owner", "owner__username"),
+            ("contents", "contents"),
+            ("created_date", "created_date"),
+            ("updated_date", "updated_date"),
+            ("version", "version"),
+        ],
+    ),
+}
+
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def iter_batches(name: str, batch_size: int | None = None) -> Iterator[list[tuple]]:
+    """
+    id 순서로 batch_size 개씩 keyset pagination 하여 row(tuple) 목록을 반환
+    """
+
+    model, columns = EXPORTS[name]
+    batch_size = batch_size or settings.BOARD_EXPORT_BATCH_SIZE
+    lookups = [lookup for _, lookup in columns]
+
+    last_id = 0
+    while True:
+        queryset = (
+            model.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list(*lookups)[:batch_size]
+        )
+        batch = list(queryset.iterator(chunk_size=batch_size))
+        if batch:
+            yield batch
+
+        if len(batch) < batch_size:
+            return
+
+        last_id = batch[-1][0]
+
+
+class ExportJSONEncoder(json.JSONEncoder):
+    # DjangoJSONEncoder 는 millisecond 까지만 출력하므로 가져오기(boards.imports)에서
+    # 그대로 복원할 수 있도록 microsecond 까지 출력 (CSV 와 같은 형식)
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+
+        return super().default(o)
+
+
+def export_ndjson(name: str, batch_size: int | None = None) -> Iterator[str]:
+    _, columns = EXPORTS[name]
+    names = [column for column, _ in columns]
+    encoder = ExportJSONEncoder(ensure_ascii=False)
+
+    for batch in iter_batches(name, batch_size):
+        yield "".join(encoder.encode(dict(zip(names, row))) + "\n" for row in batch)
+
+
+def export_csv(name: str, batch_size: int | None = None) -> Iterator[str]:
+    _, columns = EXPORTS[name]
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    writer.writerow([column for column, _ in columns])
+    yield flush()
+
+    for batch in iter_batches(name, batch_size):
+        writer.writerows(
+            [
+                value.isoformat() if isinstance(value, datetime) else value
+                for value in row
+            ]
+            for row in batch
+        )
+        yield flush()
+
+
+EXPORTERS = {
+    "ndjson": export_ndjson,
+    "csv": export_csv,
+}
+
+
+def export(name: str, file_format: str, batch_size: int | None = None) -> Iterator[str]:
+    """
+    내보내기 결과를 batch 단위의 문자열로 반환 (StreamingHttpResponse, 파일 출력에 사용)
+    """
+
+    return EXPORTERS[file_format](name, batch_size)
+
+
+async def aexport(
+    name: str, file_format: str, batch_size: int | None = None
+) -> AsyncIterator[str]:
+    """
+    export 의 async 버전 (ASGI 의 StreamingHttpResponse 에 사용).
+    ASGI 는 sync iterator 를 끝까지 읽은 다음 전달하므로, batch 마다 조회, 변환을 sync_to_async 로 실행하여
+    메모리에 모으지 않고 하나씩 전달함.
+    """
+
+    chunks = export(name, file_format, batch_size)
+    next_chunk = sync_to_async(next)
+
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close)()
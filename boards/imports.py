@@ -0,0 +1,203 @@
+"""
+게시글, 댓글 NDJSON 일괄 가져오기 (manage.py import_boards).
+
+내보내기(boards.exports)와 같은 형식의 NDJSON 을 한 줄씩 읽어 chunk 단위로 처리함.
+각 줄은 기존 serializer 의 필드 검증만 수행하고(view, request 없이),
+작성자는 username 으로 chunk 마다 한번에 조회하며, chunk 별 transaction 에서 batch 단위의 INSERT 로 저장함.
+chunk 가 commit 될 때마다 다음에 읽을 byte 위치(offset)를 전달하여 중단된 경우 이어서 가져올 수 있음 (config.ndjson).
+
+- id 가 있는 row 는 id 를 유지하며, 이미 있거나 chunk 안에서 중복된 id 의 row 는 건너뜀 (다시 실행해도 중복되지 않음).
+- created_date 가 있는 row 는 작성일을 유지함. updated_date 는 변경 피드(boards.changes)에서
+  가져온 게시글, 댓글을 조회할 수 있도록 가져온 시각으로 저장함.
+- 변경 이벤트(BoardEvent), 댓글 stream 은 발행하지 않음.
+"""
+
+from collections.abc import Callable
+from contextlib import contextmanager
+from typing import BinaryIO
+
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from rest_framework import serializers
+
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+from boards.serializers import CommentSerializer, PostBaseSerializer
+from config.ndjson import Line, Progress, read_chunks
+
+
+class PostImportSerializer(PostBaseSerializer):
+    id = serializers.IntegerField(required=False, min_value=1)
+    owner = serializers.CharField(max_length=20)  # username
+    created_date = serializers.DateTimeField(required=False)
+
+    class Meta(PostBaseSerializer.Meta):
+        fields = ["id", "owner", "title", "contents", "created_date"]
+
+
+class CommentImportSerializer(CommentSerializer):
+    id = serializers.IntegerField(required=False, min_value=1)
+    owner = serializers.CharField(max_length=20)  # username
+    post = serializers.IntegerField(min_value=1)  # chunk 단위로 존재 여부 확인
+    created_date = serializers.DateTimeField(required=False)
+
+    class Meta(CommentSerializer.Meta):
+        fields = ["id", "post", "owner", "contents", "created_date"]
+
+
+# 가져오기 이름: (model, serializer)
+IMPORTS = {
+    "posts": (PostModel, PostImportSerializer),
+    "comments": (CommentModel, CommentImportSerializer),
+}
+
+
+class OwnerCache:
+    """
+    username 으로 작성자 id 를 조회. 처음 보는 username 만 한번의 쿼리로 조회하며,
+    존재하지 않는 username 도 저장하여 다시 조회하지 않음.
+    """
+
+    def __init__(self):
+        self.ids: dict[str, int | None] = {}
+
+    def resolve(self, usernames) -> None:
+        missing = {username for username in usernames if username not in self.ids}
+        if not missing:
+            return
+
+        self.ids.update(dict.fromkeys(missing))
+        self.ids.update(
+            User.objects.filter(username__in=missing).values_list("username", "id")
+        )
+
+    def get(self, username: str) -> int | None:
+        return self.ids.get(username)
+
+
+class BoardImporter:
+    def __init__(self, name: str, batch_size: int):
+        self.model, serializer_class = IMPORTS[name]
+        self.serializer = serializer_class()  # 필드를 한번만 생성하도록 재사용
+        self.batch_size = batch_size
+        self.owners = OwnerCache()
+
+    def run(
+        self,
+        file: BinaryIO,
+        chunk_size: int,
+        on_progress: Callable[[Progress], None] | None = None,
+    ) -> Progress:
+        progress = Progress(offset=file.tell())
+
+        for lines, next_offset in read_chunks(file, chunk_size):
+            progress.update(lines, self.import_chunk(lines), next_offset)
+
+            if on_progress is not None:
+                on_progress(progress)
+
+        return progress
+
+    def import_chunk(self, lines: list[Line]) -> int:
+        for line in lines:
+            if line.error is None:
+                self.validate(line)
+
+        valid = [line for line in lines if line.error is None]
+        self.owners.resolve(line.data["owner"] for line in valid)
+        existing_posts = self.get_existing_posts(valid)
+
+        rows = []
+        for line in valid:
+            owner_id = self.owners.get(line.data.pop("owner"))
+            if owner_id is None:
+                line.error = {"owner": "존재하지 않는 사용자입니다."}
+            elif existing_posts is not None and line.data["post"] not in existing_posts:
+                line.error = {"post": "존재하지 않는 게시글입니다."}
+            else:
+                rows.append((line, self.build(line.data, owner_id)))
+
+        with transaction.atomic():
+            return self.save(rows)
+
+    def validate(self, line: Line) -> None:
+        try:
+            line.data = self.serializer.run_validation(line.data)
+        except serializers.ValidationError as exc:
+            line.error = exc.detail
+
+    def get_existing_posts(self, lines: list[Line]) -> set[int] | None:
+        if self.model is not CommentModel:
+            return None
+
+        post_ids = {line.data["post"] for line in lines}
+        return set(
+            PostModel.objects.filter(id__in=post_ids).values_list("id", flat=True)
+        )
+
+    def build(self, data: dict, owner_id: int):
+        if "post" in data:
+            data["post_id"] = data.pop("post")
+
+        return self.model(owner_id=owner_id, **data)
+
+    def save(self, rows: list[tuple[Line, object]]) -> int:
+        if not rows:
+            return 0
+
+        # 이미 있는 id (중단 이후 다시 실행한 경우) 와 chunk 안에서 중복된 id 의 row 는 건너뜀
+        explicit_ids = [obj.pk for _, obj in rows if obj.pk is not None]
+        seen_ids = set(
+            self.model.objects.filter(pk__in=explicit_ids).values_list("pk", flat=True)
+        )
+
+        objs = []
+        for line, obj in rows:
+            if obj.pk is None:
+                objs.append(obj)
+            elif obj.pk in seen_ids:
+                line.error = {"id": "이미 존재하는 id 입니다."}
+            else:
+                seen_ids.add(obj.pk)
+                objs.append(obj)
+
+        # id 를 지정한 row 를 먼저 저장하고 sequence 를 재설정해야
+        # 이후 자동으로 생성되는 id 가 방금 저장한 id 와 겹치지 않음
+        self.insert([obj for obj in objs if obj.pk is not None])
+        if explicit_ids:
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(no_style(), [self.model]):
+                    cursor.execute(sql)
+
+        self.insert([obj for obj in objs if obj.pk is None])
+
+        return len(objs)
+
+    def insert(self, objs: list) -> None:
+        # 작성일을 다시 저장하지 않도록 한번의 INSERT 로 지정된 작성일을 저장
+        with keep_created_date(self.model):
+            self.model.objects.bulk_create(objs, batch_size=self.batch_size)
+
+
+@contextmanager
+def keep_created_date(model):
+    """
+    가져오는 동안 created_date 의 auto_now_add 를 우회하여 bulk_create 가 지정된 작성일을 그대로 저장.
+    작성일이 없는 row 는 기존과 같이 현재 시각으로 저장됨.
+    field 객체를 변경하므로 가져오기 명령어에서만 사용.
+    """
+
+    field = model._meta.get_field("created_date")
+    auto_now_add_pre_save = field.pre_save
+
+    def pre_save(instance, add):
+        value = getattr(instance, field.attname)
+        if value is not None:
+            return value
+        return auto_now_add_pre_save(instance, add)
+
+    field.pre_save = pre_save
+    try:
+        yield
+    finally:
+        del field.pre_save
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from boards import exports
+
+
+class Command(BaseCommand):
+    help = "전체 게시글 또는 댓글을 NDJSON, CSV 로 내보냅니다. (boards.exports)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=list(exports.EXPORTS))
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=list(exports.EXPORTERS),
+            default="ndjson",
+        )
+        parser.add_argument("--output", help="저장할 파일 경로 (없으면 표준 출력)")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="한번에 조회하는 row 수 (기본값 BOARD_EXPORT_BATCH_SIZE)",
+        )
+
+    def handle(self, *args, model, file_format, output, batch_size, **options):
+        chunks = exports.export(model, file_format, batch_size)
+
+        if output is None:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(output, "w", encoding="utf-8", newline="") as file:
+            for chunk in chunks:
+                file.write(chunk)
+
+        self.stderr.write(f"{model} 를 {output} 에 저장했습니다.")
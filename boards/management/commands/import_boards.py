@@ -0,0 +1,28 @@
+from django.conf import settings
+
+from boards import imports
+from config.ndjson import ImportCommand
+
+
+class Command(ImportCommand):
+    help = (
+        "NDJSON 파일의 게시글 또는 댓글을 일괄 저장합니다. (boards.imports) "
+        "중단된 경우 마지막으로 출력된 offset 을 --offset 으로 지정하여 이어서 가져올 수 있습니다."
+    )
+    default_chunk_size = settings.BOARD_IMPORT_CHUNK_SIZE
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=list(imports.IMPORTS))
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.BOARD_IMPORT_BATCH_SIZE,
+            help="한번의 INSERT 로 저장하는 row 수",
+        )
+
+    def get_importer(self, *, model, batch_size, **options):
+        return imports.BoardImporter(model, batch_size)
+
+    def get_name(self, *, model, **options) -> str:
+        return model
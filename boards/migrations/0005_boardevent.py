@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-19 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("boards", "0004_alter_commentmodel_owner_alter_commentmodel_post_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BoardEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("post_id", models.BigIntegerField(db_index=True)),
+                ("model", models.CharField(max_length=20)),
+                ("object_id", models.BigIntegerField()),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("updated", "Updated"),
+                            ("deleted", "Deleted"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "created_date",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                ("claim_token", models.UUIDField(db_index=True, null=True)),
+                ("claimed_at", models.DateTimeField(null=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-19 14:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("boards", "0005_boardevent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BoardTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=20)),
+                ("object_id", models.BigIntegerField()),
+                ("post_id", models.BigIntegerField()),
+                (
+                    "deleted_date",
+                    models.DateTimeField(auto_now_add=True, verbose_name="삭제일"),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="commentmodel",
+            index=models.Index(
+                fields=["updated_date", "id"], name="boards_comm_updated_44c145_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="postmodel",
+            index=models.Index(
+                fields=["updated_date", "id"], name="boards_post_updated_031fc4_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="boardtombstone",
+            index=models.Index(
+                fields=["deleted_date", "id"], name="boards_boar_deleted_2b9d35_idx"
+            ),
+        ),
+    ]
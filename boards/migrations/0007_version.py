@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-19 14:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("boards", "0006_boardtombstone"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="commentmodel",
+            name="version",
+            field=models.PositiveIntegerField(default=1, verbose_name="버전"),
+        ),
+        migrations.AddField(
+            model_name="postmodel",
+            name="version",
+            field=models.PositiveIntegerField(default=1, verbose_name="버전"),
+        ),
+    ]
@@ -1,4 +1,7 @@
+import uuid
+
 from django.db import models
+from django.utils import timezone
 
 from accounts.models import User
 
@@ -11,12 +14,14 @@ class PostModel(models.Model):
     contents = models.TextField()
     created_date = models.DateTimeField("작성일", auto_now_add=True, null=False)
     updated_date = models.DateTimeField("마지막 수정일", auto_now=True, null=False)
+    version = models.PositiveIntegerField("버전", default=1)  # 수정시 1 증가 (If-Match)
 
     def __str__(self) -> str:
         return self.title
 
     class Meta:
         ordering = ["-id"]
+        indexes = [models.Index(fields=["updated_date", "id"])]  # 변경 피드
 
 
 # 댓글 모델
@@ -29,9 +34,87 @@ class CommentModel(models.Model):
     contents = models.TextField(null=False)
     created_date = models.DateTimeField("작성일", auto_now_add=True, null=False)
     updated_date = models.DateTimeField("마지막 수정일", auto_now=True, null=False)
+    version = models.PositiveIntegerField("버전", default=1)  # 수정시 1 증가 (If-Match)
 
     def __str__(self) -> str:
         return f"{self.owner} 님의 댓글"
 
     class Meta:
         ordering = ["-id"]
+        indexes = [models.Index(fields=["updated_date", "id"])]  # 변경 피드
+
+
+class BoardEventManager(models.Manager):
+    def claim(self, batch_size: int, claim_timeout) -> list["BoardEvent"]:
+        """
+        처리 대기중인 이벤트를 최대 batch_size 개 선점(claim)하여 반환.
+        게시글 별 처리 순서를 지키기 위해 다른 worker 가 처리중인 게시글의 이벤트는 선점하지 않고,
+        claim_timeout 이 지나도록 처리되지 않은 이벤트는 다시 선점할 수 있음.
+        """
+
+        now = timezone.now()
+        claim_token = uuid.uuid4()
+        expired = models.Q(claimed_at__lt=now - claim_timeout)
+
+        in_progress_posts = (
+            self.filter(claim_token__isnull=False).exclude(expired).values("post_id")
+        )
+        claimable = self.filter(models.Q(claim_token__isnull=True) | expired).exclude(
+            post_id__in=in_progress_posts
+        )
+        claimable_ids = list(
+            claimable.order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        claimable.filter(id__in=claimable_ids).update(
+            claim_token=claim_token, claimed_at=now
+        )
+
+        return list(self.filter(claim_token=claim_token).order_by("id"))
+
+    def release(self, events: list["BoardEvent"]):
+        """
+        처리에 실패한 이벤트를 다시 처리할 수 있도록 선점 해제
+        """
+
+        self.filter(id__in=[event.id for event in events]).update(
+            claim_token=None, claimed_at=None
+        )
+
+
+# 게시글, 댓글 변경 이벤트 outbox (boards.events 참고)
+# 변경과 같은 transaction 에서 저장되고 boards.tasks.process_board_events 에서 처리됨
+class BoardEvent(models.Model):
+    class Action(models.TextChoices):
+        CREATED = "created"
+        UPDATED = "updated"
+        DELETED = "deleted"
+
+    # 게시글, 댓글이 삭제되어도 이벤트를 처리할 수 있도록 FK 가 아닌 id 로 저장
+    post_id = models.BigIntegerField(db_index=True)
+    model = models.CharField(max_length=20)  # post, comment
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=Action.choices)
+    created_date = models.DateTimeField("생성일", auto_now_add=True, null=False)
+
+    # 처리중인 worker 정보 (BoardEventManager.claim)
+    claim_token = models.UUIDField(null=True, db_index=True)
+    claimed_at = models.DateTimeField(null=True)
+
+    objects = BoardEventManager()
+
+    def __str__(self) -> str:
+        return f"{self.model} {self.object_id} {self.action}"
+
+
+# 삭제된 게시글, 댓글 기록 (변경 피드 boards.changes 에서 사용, boards.signals 에서 저장)
+class BoardTombstone(models.Model):
+    model = models.CharField(max_length=20)  # post, comment
+    object_id = models.BigIntegerField()
+    post_id = models.BigIntegerField()
+    deleted_date = models.DateTimeField("삭제일", auto_now_add=True, null=False)
+
+    def __str__(self) -> str:
+        return f"{self.model} {self.object_id} 삭제"
+
+    class Meta:
+        indexes = [models.Index(fields=["deleted_date", "id"])]
@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from rest_framework.exceptions import NotFound
 from rest_framework.pagination import CursorPagination
 
@@ -12,3 +13,12 @@ class PostCursorPagination(CursorPagination):
         except ValueError:
             # 커서(cursor)가 유효하지 않습니다.
             raise NotFound(self.invalid_cursor_message)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        paginate_queryset 의 async 버전.
+        Django 4.2 의 async ORM 도 내부적으로 sync_to_async 로 쿼리를 실행하므로,
+        커서 계산을 복사하지 않고 paginate_queryset 을 그대로 sync_to_async 로 실행함.
+        """
+
+        return await sync_to_async(self.paginate_queryset)(queryset, request, view)
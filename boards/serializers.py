@@ -1,30 +1,50 @@
 from rest_framework import serializers
 
-from boards.models import CommentModel, PostModel
+from boards.models import BoardTombstone, CommentModel, PostModel
+from config.serializers import (
+    CachedListSerializer,
+    RepresentationCacheMixin,
+    VersionedUpdateMixin,
+)
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(
+    RepresentationCacheMixin, VersionedUpdateMixin, serializers.ModelSerializer
+):
     owner = serializers.ReadOnlyField(source="owner.username")
     post = serializers.PrimaryKeyRelatedField(queryset=PostModel.objects.all())
 
+    # 작성자의 username 은 댓글 수정 없이 바뀔 수 있으므로 cache 하지 않음
+    uncached_fields = ("owner",)
+
     class Meta:
         model = CommentModel
         fields = "__all__"
+        read_only_fields = ["version"]
+        list_serializer_class = CachedListSerializer
 
     def update(self, instance, validated_data):
         validated_data.pop("post", None)  # post 필드 수정 제한
         return super().update(instance, validated_data)
 
 
-class PostBaseSerializer(serializers.ModelSerializer):
+class PostBaseSerializer(
+    RepresentationCacheMixin, VersionedUpdateMixin, serializers.ModelSerializer
+):
     owner = serializers.ReadOnlyField(source="owner.username")
 
+    # 작성자의 username, 댓글은 게시글 수정 없이 바뀔 수 있으므로 cache 하지 않음
+    uncached_fields = ("owner", "comments")
+
     class Meta:
         model = PostModel
         fields = "__all__"
+        read_only_fields = ["version"]
+        list_serializer_class = CachedListSerializer
 
 
 class PostDetailSerializer(PostBaseSerializer):
+    # 댓글은 CommentSerializer 의 cache 를 사용
     comments = CommentSerializer(many=True, read_only=True, source="comment")  # 역참조
 
 
@@ -32,4 +52,27 @@ class PostListSerializer(PostBaseSerializer):
     comments = serializers.SerializerMethodField(read_only=True)
 
     def get_comments(self, obj) -> int:
+        # queryset 에 annotate 된 댓글 수가 있으면 추가 쿼리 없이 사용
+        comments_count = getattr(obj, "comments_count", None)
+        if comments_count is not None:
+            return comments_count
+
         return obj.comment.count()  # 역참조
+
+
+class TombstoneSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source="object_id")
+    post = serializers.IntegerField(source="post_id")
+
+    class Meta:
+        model = BoardTombstone
+        fields = ["model", "id", "post", "deleted_date"]
+
+
+# 변경 피드 응답 (boards.changes)
+class BoardChangesSerializer(serializers.Serializer):
+    posts = PostBaseSerializer(many=True)
+    comments = CommentSerializer(many=True)
+    deleted = TombstoneSerializer(many=True)
+    next = serializers.CharField(help_text="다음 요청의 since 로 사용하는 token")
+    has_more = serializers.BooleanField(help_text="바로 조회할 수 있는 변경이 더 있는지 여부")
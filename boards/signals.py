@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from boards.models import BoardTombstone, CommentModel, PostModel
+from boards.streams import comment_hub, publish_comment
+
+
+# 새 댓글을 댓글 stream(SSE) 구독자들에게 발행
+# 여러 프로세스에 전달하는 backend 는 요청 처리 중에 broker 를 기다리지 않도록 outbox 에서 발행
+# (boards.events.publish_comment_events)
+@receiver(post_save, sender=CommentModel)
+def publish_new_comment(sender, instance, created, **kwargs):
+    if created and comment_hub.backend.in_process:
+        transaction.on_commit(lambda: publish_comment(instance))
+
+
+@receiver(post_delete, sender=PostModel)
+def record_post_tombstone(sender, instance, **kwargs):
+    BoardTombstone.objects.create(
+        model="post", object_id=instance.id, post_id=instance.id
+    )
+
+
+@receiver(post_delete, sender=CommentModel)
+def record_comment_tombstone(sender, instance, origin=None, **kwargs):
+    # 게시글 삭제로 함께 삭제된 댓글은 게시글의 tombstone 으로 알 수 있으므로 기록하지 않음
+    if isinstance(origin, PostModel) or getattr(origin, "model", None) is PostModel:
+        return
+
+    BoardTombstone.objects.create(
+        model="comment", object_id=instance.id, post_id=instance.post_id
+    )
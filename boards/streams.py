@@ -0,0 +1,217 @@
+"""
+게시글 별 새 댓글 stream (Server-Sent Events, boards.views.post_comments_stream_view).
+
+댓글이 생성되면(commit 이후) SSE 메시지로 변환하여 pub/sub backend(settings.BOARD_STREAM_BACKEND)에
+게시글 별 channel 로 발행함. 프로세스마다 하나의 CommentStreamHub 가 게시글 별로 backend 를 한번만 구독하고,
+같은 게시글을 구독하는 모든 연결(asyncio.Queue)에 메시지를 전달(fan-out)함.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+from kombu import Connection, Exchange, Queue
+from kombu.pools import producers
+
+logger = logging.getLogger(__name__)
+
+# 구독자의 queue 가 가득 찬 경우 전달하는 값 (연결을 종료하고 client 가 Last-Event-ID 로 재연결)
+OVERFLOW = object()
+
+
+def get_channel(post_id: int) -> str:
+    return f"comments.{post_id}"
+
+
+def format_event(event_id: int, event: str, data: dict) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class InMemoryBackend:
+    """
+    하나의 프로세스 안에서만 메시지를 전달하는 backend (개발, 테스트, 단일 프로세스 배포)
+    """
+
+    # 발행한 프로세스의 구독자에게만 전달되는지 여부
+    # True 이면 댓글을 생성한 요청에서 발행(boards.signals), False 이면 outbox 에서 발행(boards.events)
+    in_process = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks = defaultdict(set)
+
+    def publish(self, channel: str, message: dict):
+        with self._lock:
+            callbacks = list(self._callbacks.get(channel, ()))
+
+        for callback in callbacks:
+            callback(message)
+
+    def subscribe(self, channel: str, callback):
+        with self._lock:
+            self._callbacks[channel].add(callback)
+
+    def unsubscribe(self, channel: str, callback):
+        with self._lock:
+            self._callbacks[channel].discard(callback)
+            if not self._callbacks[channel]:
+                del self._callbacks[channel]
+
+
+class KombuBackend(InMemoryBackend):
+    """
+    broker(settings.CELERY_BROKER_URL)의 topic exchange 로 여러 프로세스 사이에 메시지를 전달하는 backend.
+    프로세스마다 하나의 consumer 스레드가 exclusive queue 로 모든 channel 의 메시지를 받아서
+    이 프로세스에서 구독중인 channel 에만 전달함.
+    """
+
+    exchange = Exchange("board-streams", type="topic", durable=False)
+    in_process = False
+
+    def __init__(self, url: str | None = None):
+        super().__init__()
+        self.url = url or settings.CELERY_BROKER_URL
+        self._consumer = None
+
+    def publish(self, channel: str, message: dict):
+        # 요청 스레드(on_commit)에서 호출되므로 broker 장애 시 무한히 대기하지 않도록
+        # 연결과 발행의 재시도 횟수를 모두 제한
+        retry_policy = settings.BOARD_STREAM_PUBLISH_RETRY_POLICY
+        connection = Connection(self.url, transport_options=retry_policy)
+
+        with producers[connection].acquire(block=True) as producer:
+            producer.publish(
+                message,
+                exchange=self.exchange,
+                routing_key=channel,
+                serializer="json",
+                declare=[self.exchange],
+                retry=True,
+                retry_policy=retry_policy,
+            )
+
+    def subscribe(self, channel: str, callback):
+        super().subscribe(channel, callback)
+
+        with self._lock:
+            if self._consumer is None:
+                self._consumer = threading.Thread(target=self._consume, daemon=True)
+                self._consumer.start()
+
+    def _consume(self):
+        while True:
+            try:
+                with Connection(self.url) as connection:
+                    queue = Queue(
+                        exchange=self.exchange,
+                        routing_key="comments.#",
+                        exclusive=True,
+                        auto_delete=True,
+                    )
+                    with connection.Consumer(
+                        queue, callbacks=[self._on_message], no_ack=True
+                    ):
+                        while True:
+                            try:
+                                connection.drain_events(timeout=1)
+                            except TimeoutError:
+                                pass
+            except Exception:
+                logger.exception("board stream consumer failed, reconnecting")
+                time.sleep(1)
+
+    def _on_message(self, body, message):
+        super().publish(message.delivery_info["routing_key"], body)
+
+
+class CommentStreamHub:
+    """
+    게시글 별 구독자(asyncio.Queue) 목록을 관리하고 backend 의 메시지를 구독자들에게 전달.
+    게시글의 첫 구독자가 생길 때 backend 를 구독하고, 마지막 구독자가 떠나면 구독을 해제함.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)  # post_id: {(event loop, queue)}
+        self._dispatchers = {}  # post_id: backend 에 등록한 callback
+
+    @cached_property
+    def backend(self):
+        return import_string(settings.BOARD_STREAM_BACKEND)()
+
+    def subscribe(self, post_id: int) -> asyncio.Queue:
+        subscriber = (
+            asyncio.get_running_loop(),
+            asyncio.Queue(maxsize=settings.BOARD_STREAM_QUEUE_SIZE),
+        )
+
+        with self._lock:
+            self._subscribers[post_id].add(subscriber)
+            if post_id in self._dispatchers:
+                return subscriber[1]
+
+            dispatcher = self._dispatchers[post_id] = lambda message: self._dispatch(
+                post_id, message
+            )
+
+        self.backend.subscribe(get_channel(post_id), dispatcher)
+        return subscriber[1]
+
+    def unsubscribe(self, post_id: int, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = self._subscribers[post_id]
+            subscribers.difference_update({s for s in subscribers if s[1] is queue})
+            if subscribers:
+                return
+
+            del self._subscribers[post_id]
+            dispatcher = self._dispatchers.pop(post_id)
+
+        self.backend.unsubscribe(get_channel(post_id), dispatcher)
+
+    def publish(self, post_id: int, message: dict):
+        self.backend.publish(get_channel(post_id), message)
+
+    def _dispatch(self, post_id: int, message: dict):
+        # backend 의 스레드에서 호출되므로 각 구독자의 event loop 에서 queue 에 추가
+        event = (message["id"], format_event(message["id"], "comment", message))
+
+        with self._lock:
+            subscribers = list(self._subscribers.get(post_id, ()))
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._put, queue, event)
+            except RuntimeError:  # 이미 종료된 event loop
+                pass
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event):
+        if queue.full():  # 메시지를 받지 못하는 느린 연결은 종료
+            while not queue.empty():
+                queue.get_nowait()
+            event = OVERFLOW
+
+        queue.put_nowait(event)
+
+
+comment_hub = CommentStreamHub()
+
+
+def publish_comment(comment):
+    """
+    새 댓글을 구독자들에게 발행 (댓글 생성이 commit 된 이후 호출)
+    """
+
+    from boards.serializers import CommentSerializer
+
+    try:
+        comment_hub.publish(comment.post_id, CommentSerializer(comment).data)
+    except Exception:  # 발행에 실패해도 댓글 생성 요청은 성공으로 처리
+        logger.exception("failed to publish comment %s", comment.id)
@@ -0,0 +1,69 @@
+from itertools import groupby
+
+from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from boards.models import BoardEvent, BoardTombstone
+
+
+def get_event_handlers() -> list:
+    return [import_string(path) for path in settings.BOARD_EVENT_HANDLERS]
+
+
+# outbox(BoardEvent)에 저장된 게시글, 댓글 변경 이벤트를 batch 로 처리하는 TASK
+# 게시글 별로 이벤트를 생성 순서대로 handler 에 전달하고, 처리한 이벤트는 삭제
+# 처리에 실패할 경우 남은 이벤트의 선점을 해제하고 지수적으로 증가하는 간격으로 재시도
+@shared_task(
+    ignore_result=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    max_retries=5,
+)
+def process_board_events(batch_size: int | None = None) -> int:
+    batch_size = batch_size or settings.BOARD_EVENT_BATCH_SIZE
+    claim_timeout = settings.BOARD_EVENT_CLAIM_TIMEOUT
+    handlers = get_event_handlers()
+
+    processed = 0
+    events = BoardEvent.objects.claim(batch_size, claim_timeout)
+    while events:
+        events.sort(key=lambda event: (event.post_id, event.id))
+        pending = events
+
+        for post_id, post_events in groupby(events, key=lambda e: e.post_id):
+            post_events = list(post_events)
+
+            try:
+                for handler in handlers:
+                    handler(post_id, post_events)
+            except Exception:
+                BoardEvent.objects.release(pending)
+                raise
+
+            BoardEvent.objects.filter(id__in=[e.id for e in post_events]).delete()
+            done = len(post_events)
+            pending = pending[done:]
+            processed += done
+
+        events = BoardEvent.objects.claim(batch_size, claim_timeout)
+
+    return processed
+
+
+# 보관 기간이 지난 삭제 기록(BoardTombstone)을 batch_size 개씩 나누어 삭제하는 TASK
+# 보관 기간보다 오래된 변경 피드 token 은 만료되므로(410) 삭제해도 누락되는 변경이 없음
+@shared_task(ignore_result=True, acks_late=True)
+def purge_board_tombstones(batch_size: int = 1000) -> int:
+    expires_before = timezone.now() - settings.BOARD_TOMBSTONE_RETENTION
+    expired = BoardTombstone.objects.filter(deleted_date__lt=expires_before)
+
+    deleted = 0
+    while True:
+        expired_ids = list(expired.values_list("id", flat=True)[:batch_size])
+        if not expired_ids:
+            return deleted
+
+        deleted += BoardTombstone.objects.filter(id__in=expired_ids).delete()[0]
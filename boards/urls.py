@@ -1,15 +1,41 @@
+from django.conf import settings
 from django.urls import path
 
 from boards.views import (
+    BoardChangesAPIView,
+    BoardExportAPIView,
     CommentCreateAPIView,
     CommentDetailAPIView,
     PostDetailAPIView,
     PostListCreateAPIView,
+    async_read_view,
+    post_comments_stream_view,
+    post_detail_async_view,
+    post_list_async_view,
 )
 
+post_list_view = PostListCreateAPIView.as_view()
+post_detail_view = PostDetailAPIView.as_view()
+
+# ASGI 로 배포할 경우 게시글 조회(GET)는 async view 로 처리
+if settings.BOARDS_ASYNC_READS:
+    post_list_view = async_read_view(post_list_async_view, post_list_view)
+    post_detail_view = async_read_view(post_detail_async_view, post_detail_view)
+
 urlpatterns = [
-    path("posts", PostListCreateAPIView.as_view()),
-    path("posts/<int:pk>", PostDetailAPIView.as_view()),
-    path("comments", CommentCreateAPIView.as_view()),
-    path("comments/<int:pk>", CommentDetailAPIView.as_view()),
+    path("posts", post_list_view, name="post-list"),
+    path("posts/<int:pk>", post_detail_view, name="post-detail"),
+    path(
+        "posts/<int:pk>/comments/stream",
+        post_comments_stream_view,
+        name="post-comments-stream",
+    ),
+    path("comments", CommentCreateAPIView.as_view(), name="comment-create"),
+    path("comments/<int:pk>", CommentDetailAPIView.as_view(), name="comment-detail"),
+    path("changes", BoardChangesAPIView.as_view(), name="board-changes"),
+    path(
+        "export/<str:model>.<str:file_format>",
+        BoardExportAPIView.as_view(),
+        name="board-export",
+    ),
 ]
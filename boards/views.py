@@ -1,65 +1,201 @@
-from drf_spectacular.utils import extend_schema, extend_schema_view
+import asyncio
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Prefetch
+from django.http import HttpResponse, StreamingHttpResponse
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
+from rest_framework import exceptions
 from rest_framework.generics import (
     CreateAPIView,
+    GenericAPIView,
     ListCreateAPIView,
     RetrieveUpdateDestroyAPIView,
 )
+from rest_framework.permissions import AllowAny, IsAdminUser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView, exception_handler
 
-from boards.models import CommentModel, PostModel
+from accounts.authentication import JWTCookieAuthentication
+from boards import changes, exports, streams
+from boards.events import record_board_event
+from boards.models import BoardEvent, CommentModel, PostModel
 from boards.paginations import PostCursorPagination
 from boards.permissions import IsOwnerOrReadOnly
 from boards.serializers import (
+    BoardChangesSerializer,
     CommentSerializer,
+    PostBaseSerializer,
     PostDetailSerializer,
     PostListSerializer,
 )
+from config.concurrency import IF_MATCH_PARAMETER, OptimisticConcurrencyMixin, make_etag
+from config.idempotency import IDEMPOTENCY_KEY_PARAMETER, IdempotentCreateMixin
+
+
+def parse_ids(value: str) -> list[int]:
+    """
+    ?ids=1,2,3 파라미터를 중복을 제거한 id 목록으로 변환
+    """
+
+    try:
+        ids = list(dict.fromkeys(int(pk) for pk in value.split(",") if pk))
+    except ValueError:
+        raise exceptions.ValidationError({"ids": "id 는 정수여야 합니다."})
+
+    if not ids:
+        raise exceptions.ValidationError({"ids": "조회할 id 를 입력해주세요."})
+    if len(ids) > settings.BOARDS_MULTI_GET_MAX_IDS:
+        raise exceptions.ValidationError(
+            {"ids": f"한번에 최대 {settings.BOARDS_MULTI_GET_MAX_IDS}개까지 조회할 수 있습니다."}
+        )
+
+    return ids
+
+
+class MultiGetMixin:
+    """
+    ?ids=1,2,3 으로 여러 객체를 하나의 쿼리(in_bulk)로 조회.
+    요청한 id 순서대로 반환하며, 존재하지 않는 id 는 제외함.
+    """
+
+    def multi_get(self, request):
+        ids = parse_ids(request.query_params["ids"])
+        objects = self.filter_queryset(self.get_queryset()).in_bulk(ids)
+
+        serializer = self.get_serializer(
+            [objects[pk] for pk in ids if pk in objects], many=True
+        )
+        return Response(serializer.data)
+
+
+IDS_PARAMETER = OpenApiParameter(
+    "ids", str, description="쉼표로 구분한 id 목록 (예: 1,2,3)", explode=False
+)
+
+
+class BoardEventMixin:
+    """
+    생성, 수정, 삭제와 같은 transaction 에서 변경 이벤트를 outbox 에 저장 (boards.events)
+    """
+
+    @transaction.atomic
+    def perform_create(self, serializer):
+        serializer.save(owner=self.request.user)
+        record_board_event(serializer.instance, BoardEvent.Action.CREATED)
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        serializer.save()
+
+        # 바뀐 필드가 없으면 저장하지 않았으므로 이벤트도 저장하지 않음
+        if serializer.changed_fields:
+            record_board_event(serializer.instance, BoardEvent.Action.UPDATED)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        record_board_event(instance, BoardEvent.Action.DELETED)
+        instance.delete()
 
 
 @extend_schema(tags=["post"])
-@extend_schema_view(get=extend_schema(auth=[]))
-class PostListCreateAPIView(ListCreateAPIView):
+@extend_schema_view(
+    get=extend_schema(auth=[], parameters=[IDS_PARAMETER]),
+    post=extend_schema(parameters=[IDEMPOTENCY_KEY_PARAMETER]),
+)
+class PostListCreateAPIView(
+    IdempotentCreateMixin, MultiGetMixin, BoardEventMixin, ListCreateAPIView
+):
     """
     게시물을 생성하고 조회하는 API
     """
 
-    queryset = PostModel.objects.all()
+    queryset = PostModel.objects.select_related("owner").annotate(
+        comments_count=Count("comment")
+    )
     serializer_class = PostListSerializer
     permission_classes = [IsOwnerOrReadOnly]
     pagination_class = PostCursorPagination
 
-    def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
+    def list(self, request, *args, **kwargs):
+        if "ids" in request.query_params:  # 여러 게시글 조회 (페이지네이션 없음)
+            return self.multi_get(request)
+
+        return super().list(request, *args, **kwargs)
+
+
+# 수정, 삭제 API 의 If-Match 헤더 (config.concurrency)
+IF_MATCH_SCHEMA = {
+    method: extend_schema(parameters=[IF_MATCH_PARAMETER])
+    for method in ("put", "patch", "delete")
+}
 
 
 @extend_schema(tags=["post"])
-@extend_schema_view(get=extend_schema(auth=[]))
-class PostDetailAPIView(RetrieveUpdateDestroyAPIView):
+@extend_schema_view(get=extend_schema(auth=[]), **IF_MATCH_SCHEMA)
+class PostDetailAPIView(
+    OptimisticConcurrencyMixin, BoardEventMixin, RetrieveUpdateDestroyAPIView
+):
     """
     특정 게시글을 조회, 수정, 삭제하는 API
     """
 
-    queryset = PostModel.objects.all()
+    queryset = PostModel.objects.select_related("owner")
     serializer_class = PostDetailSerializer
     permission_classes = [IsOwnerOrReadOnly]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # 조회할 때만 댓글(댓글 작성자)을 함께 조회 (post_detail_async_view 와 같은 쿼리)
+        # 수정, 삭제는 댓글을 사용하지 않으므로 prefetch 하지 않음
+        if self.request.method == "GET":
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "comment", queryset=CommentModel.objects.select_related("owner")
+                )
+            )
+        return queryset
+
 
 @extend_schema(tags=["comment"])
-class CommentCreateAPIView(CreateAPIView):
+@extend_schema_view(
+    get=extend_schema(
+        auth=[],
+        parameters=[IDS_PARAMETER],
+        responses=CommentSerializer(many=True),
+        description="id 목록(ids)으로 여러 댓글을 조회하는 API",
+    ),
+    post=extend_schema(parameters=[IDEMPOTENCY_KEY_PARAMETER]),
+)
+class CommentCreateAPIView(
+    IdempotentCreateMixin, MultiGetMixin, BoardEventMixin, CreateAPIView
+):
     """
-    댓글을 생성하는 API
+    댓글을 생성하고, 여러 댓글을 id 로 조회하는 API
     """
 
-    queryset = CommentModel.objects.all()
+    queryset = CommentModel.objects.select_related("owner")
     serializer_class = CommentSerializer
     permission_classes = [IsOwnerOrReadOnly]
 
-    def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
+    def get(self, request, *args, **kwargs):
+        if "ids" not in request.query_params:
+            raise exceptions.ValidationError({"ids": "조회할 id 를 입력해주세요."})
+
+        return self.multi_get(request)
 
 
 @extend_schema(tags=["comment"])
-@extend_schema_view(get=extend_schema(auth=[]))
-class CommentDetailAPIView(RetrieveUpdateDestroyAPIView):
+@extend_schema_view(get=extend_schema(auth=[]), **IF_MATCH_SCHEMA)
+class CommentDetailAPIView(
+    OptimisticConcurrencyMixin, BoardEventMixin, RetrieveUpdateDestroyAPIView
+):
     """
     댓글을 조회, 수정, 삭제하는 API
     """
@@ -67,3 +203,270 @@ class CommentDetailAPIView(RetrieveUpdateDestroyAPIView):
     queryset = CommentModel.objects.all()
     serializer_class = CommentSerializer
     permission_classes = [IsOwnerOrReadOnly]
+
+
+class ChangesExpired(exceptions.APIException):
+    status_code = 410
+    default_detail = "since token 이 만료되었습니다. 전체 데이터를 다시 동기화해야 합니다."
+    default_code = "changes_expired"
+
+
+@extend_schema(
+    tags=["changes"],
+    auth=[],
+    parameters=[
+        OpenApiParameter("since", str, description="이전 응답의 next token (없으면 처음부터 조회)")
+    ],
+)
+class BoardChangesAPIView(GenericAPIView):
+    """
+    since token 이후 생성, 수정, 삭제된 게시글과 댓글을 조회하는 API (변경 피드)
+    """
+
+    serializer_class = BoardChangesSerializer
+    permission_classes = [AllowAny]
+    pagination_class = None
+
+    def get(self, request, *args, **kwargs):
+        try:
+            position = changes.decode_token(request.query_params.get("since"))
+        except signing.BadSignature:
+            raise exceptions.ValidationError({"since": "유효하지 않은 token 입니다."})
+        except changes.TokenExpired:
+            raise ChangesExpired
+
+        feed = changes.get_changes(position, settings.BOARD_CHANGES_PAGE_SIZE)
+        return Response(self.get_serializer(feed).data)
+
+
+@extend_schema(
+    tags=["export"],
+    parameters=[
+        OpenApiParameter(
+            "model", str, OpenApiParameter.PATH, enum=list(exports.EXPORTS)
+        ),
+        OpenApiParameter(
+            "file_format", str, OpenApiParameter.PATH, enum=list(exports.EXPORTERS)
+        ),
+    ],
+    responses={(200, "application/x-ndjson"): str, (200, "text/csv"): str},
+)
+class BoardExportAPIView(APIView):
+    """
+    전체 게시글(posts) 또는 댓글(comments)을 NDJSON, CSV 로 내보내는 관리자 API (boards.exports).
+    조회한 batch 단위로 응답을 전달하므로 row 수와 관계없이 메모리 사용량이 일정함.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def perform_content_negotiation(self, request, force=False):
+        # 응답 형식은 URL 로 정하므로 Accept 헤더와 관계없이 오류 응답은 JSON 으로 반환
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, model, file_format):
+        if model not in exports.EXPORTS or file_format not in exports.EXPORTERS:
+            raise exceptions.NotFound
+
+        # ASGI 에서는 sync iterator 를 끝까지 읽은 다음 전달하므로 batch 단위로 전달하는 async iterator 사용
+        if isinstance(request._request, ASGIRequest):
+            chunks = exports.aexport(model, file_format)
+        else:
+            chunks = exports.export(model, file_format)
+
+        response = StreamingHttpResponse(
+            chunks, content_type=exports.CONTENT_TYPES[file_format]
+        )
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="{model}.{file_format}"'
+        return response
+
+
+# ASGI 환경에서 사용하는 async 조회 API
+# DRF generic view 는 sync 로만 동작하므로 GET 요청만 Django async view 로 처리함.
+def _render_json(data, status=200, headers=None) -> HttpResponse:
+    return HttpResponse(
+        JSONRenderer().render(data),
+        content_type="application/json",
+        status=status,
+        headers=headers,
+    )
+
+
+def _render_exception(exc: exceptions.APIException, headers=None) -> HttpResponse:
+    response = exception_handler(exc, {})
+    return _render_json(response.data, status=response.status_code, headers=headers)
+
+
+async def _aserialize(serializer):
+    # 직렬화 결과 cache(RepresentationCacheMixin)는 sync cache API 를 사용하므로
+    # event loop 를 막지 않도록 thread 에서 직렬화
+    return await sync_to_async(lambda: serializer.data)()
+
+
+async def _aauthenticate(request) -> HttpResponse | None:
+    """
+    JWTCookieAuthentication 을 async ORM 으로 수행하고, 실패할 경우 401 응답을 반환
+    """
+
+    authenticator = JWTCookieAuthentication()
+
+    try:
+        await authenticator.aauthenticate(request)
+    except exceptions.AuthenticationFailed as exc:
+        headers = {"WWW-Authenticate": authenticator.authenticate_header(request)}
+        return _render_exception(exc, headers=headers)
+
+    return None
+
+
+async def post_list_async_view(request):
+    """
+    게시물 목록을 조회하는 async API
+    """
+
+    if error_response := await _aauthenticate(request):
+        return error_response
+
+    request = Request(request)
+    queryset = PostModel.objects.select_related("owner").annotate(
+        comments_count=Count("comment")
+    )
+
+    if "ids" in request.query_params:  # 여러 게시글 조회 (MultiGetMixin 참고)
+        try:
+            ids = parse_ids(request.query_params["ids"])
+        except exceptions.ValidationError as exc:
+            return _render_exception(exc)
+
+        posts = await queryset.ain_bulk(ids)
+        serializer = PostListSerializer(
+            [posts[pk] for pk in ids if pk in posts], many=True
+        )
+        return _render_json(await _aserialize(serializer))
+
+    paginator = PostCursorPagination()
+    try:
+        page = await paginator.apaginate_queryset(queryset, request)
+    except exceptions.NotFound as exc:
+        return _render_exception(exc)
+
+    data = await _aserialize(PostListSerializer(page, many=True))
+    return _render_json(paginator.get_paginated_response(data).data)
+
+
+async def post_detail_async_view(request, pk):
+    """
+    특정 게시글을 조회하는 async API
+    """
+
+    if error_response := await _aauthenticate(request):
+        return error_response
+
+    try:
+        post = await PostModel.objects.select_related("owner").aget(pk=pk)
+    except PostModel.DoesNotExist:
+        return _render_exception(exceptions.NotFound())
+
+    # 역참조(comment)는 async 로 prefetch 할 수 없으므로 직접 조회
+    comments = [
+        comment
+        async for comment in CommentModel.objects.filter(post=post)
+        .select_related("owner")
+        .aiterator()
+    ]
+
+    data = await _aserialize(PostBaseSerializer(post))
+    data["comments"] = await _aserialize(CommentSerializer(comments, many=True))
+    return _render_json(data, headers={"ETag": make_etag(post.version)})
+
+
+class StreamNotSupported(exceptions.APIException):
+    status_code = 501
+    default_detail = "ASGI 서버에서만 댓글 stream 을 제공합니다."
+    default_code = "stream_not_supported"
+
+
+async def post_comments_stream_view(request, pk):
+    """
+    게시글의 새 댓글을 Server-Sent Events 로 전달하는 async API (ASGI 전용, boards.streams).
+
+    Last-Event-ID 헤더가 있으면 해당 댓글 이후의 댓글을 먼저 전달하고, 이후 생성되는 댓글을 전달함.
+    연결 종료를 감지할 수 없는 경우를 대비해 BOARD_STREAM_MAX_DURATION 이 지나면 stream 을 종료하며,
+    EventSource 는 자동으로 재연결함.
+    """
+
+    if request.method != "GET":
+        return _render_exception(exceptions.MethodNotAllowed(request.method))
+
+    # WSGI 는 async iterator 를 끝까지 읽은 다음 응답하므로 stream 을 전달할 수 없음
+    if not isinstance(request, ASGIRequest):
+        return _render_exception(StreamNotSupported())
+
+    if not await PostModel.objects.filter(pk=pk).aexists():
+        return _render_exception(exceptions.NotFound())
+
+    try:
+        last_event_id = int(request.headers.get("Last-Event-ID", ""))
+    except ValueError:
+        last_event_id = None
+
+    # 재연결 중 생성된 댓글을 놓치지 않도록 이전 댓글을 조회하기 전에 구독
+    queue = streams.comment_hub.subscribe(pk)
+
+    async def events():
+        sent_id = last_event_id
+        deadline = time.monotonic() + settings.BOARD_STREAM_MAX_DURATION
+
+        try:
+            yield f"retry: {settings.BOARD_STREAM_RETRY}\n\n"
+
+            if sent_id is not None:
+                comments = CommentModel.objects.filter(post_id=pk, id__gt=sent_id)
+                async for comment in comments.select_related("owner").order_by("id"):
+                    data = CommentSerializer(comment).data
+                    yield streams.format_event(comment.id, "comment", data)
+                    sent_id = comment.id
+
+            while (remaining := deadline - time.monotonic()) > 0:
+                timeout = min(settings.BOARD_STREAM_HEARTBEAT, remaining)
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"  # proxy 가 연결을 끊지 않도록 주기적으로 전송
+                    continue
+
+                if event is streams.OVERFLOW:
+                    return
+
+                event_id, message = event
+                if sent_id is None or event_id > sent_id:  # 이전 댓글 조회와 중복 제외
+                    yield message
+                    sent_id = event_id
+        finally:
+            streams.comment_hub.unsubscribe(pk, queue)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx buffering 비활성화
+    return response
+
+
+def async_read_view(async_view, sync_view):
+    """
+    GET 요청은 async view 로, 그 외의 요청은 기존 DRF view 로 전달하는 view 를 생성.
+    schema 생성(drf-spectacular)과 CSRF 처리를 위해 DRF view 의 속성을 그대로 유지함.
+    """
+
+    sync_view_async = sync_to_async(sync_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method == "GET":
+            return await async_view(request, *args, **kwargs)
+
+        return await sync_view_async(request, *args, **kwargs)
+
+    view.cls = sync_view.cls
+    view.initkwargs = sync_view.initkwargs
+    view.csrf_exempt = True
+    return view
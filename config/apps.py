@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class ConfigConfig(AppConfig):
+    name = "config"
+
+    def ready(self) -> None:
+        from django.db.backends.signals import connection_created
+
+        from config.slow_queries import install_slow_query_logger
+
+        connection_created.connect(install_slow_query_logger)
+
+        return super().ready()
@@ -1,8 +1,13 @@
 from __future__ import absolute_import, unicode_literals
 
 import os
+import time
+from datetime import datetime
 
-from celery import Celery
+from celery import Celery, signals
+
+from config import metrics
+from config.slow_queries import query_origin
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
@@ -14,3 +19,110 @@ app.autodiscover_tasks()
 @app.task(bind=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
+
+
+# task 실행 metrics (config.metrics)
+# 발행 시각을 header 에 저장하고, worker 에서 실행 전후 signal 로 대기 시간과 실행 시간을 기록
+_task_started = {}
+
+
+@signals.before_task_publish.connect
+def add_published_at_header(headers=None, **kwargs):
+    headers["published_at"] = time.time()
+
+
+@signals.task_prerun.connect
+def record_task_queue_wait(task_id=None, task=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+    published_at = getattr(task.request, "published_at", None)
+    if published_at is None:  # apply() 등 broker 를 거치지 않은 실행
+        return
+
+    # countdown, eta 가 지정된 task 는 실행 예정 시각부터 대기 시간을 계산
+    if task.request.eta:
+        published_at = max(
+            published_at, datetime.fromisoformat(task.request.eta).timestamp()
+        )
+
+    metrics.TASK_QUEUE_WAIT.labels(task.name).observe(
+        max(0, time.time() - published_at)
+    )
+
+
+@signals.task_postrun.connect
+def record_task_runtime(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is not None:
+        metrics.TASK_RUNTIME.labels(task.name, state).observe(
+            time.perf_counter() - started
+        )
+
+
+@signals.task_retry.connect
+def record_task_retry(sender=None, **kwargs):
+    metrics.TASK_RETRIES.labels(sender.name).inc()
+
+
+@signals.task_failure.connect
+def record_task_failure(sender=None, **kwargs):
+    metrics.TASK_FAILURES.labels(sender.name).inc()
+
+
+# 느린 쿼리 로그(config.slow_queries)에 쿼리를 실행한 task 이름을 기록
+@signals.task_prerun.connect
+def set_query_origin(task=None, **kwargs):
+    query_origin.set(f"task:{task.name}")
+
+
+@signals.task_postrun.connect
+def reset_query_origin(**kwargs):
+    query_origin.set(None)
+
+
+# 보관 기간이 지난 task 결과(TaskResult)를 삭제하는 TASK
+@app.task(ignore_result=True, acks_late=True)
+def purge_task_results(batch_size: int = 1000) -> int:
+    """
+    한번에 모두 삭제하면 DB lock 이 길어지므로 batch_size 개씩 나누어 삭제하고,
+    삭제한 row 의 개수를 반환.
+    """
+
+    from django.conf import settings
+    from django.utils import timezone
+    from django_celery_results.models import TaskResult
+
+    expires_before = timezone.now() - settings.TASK_RESULT_RETENTION
+    expired_results = TaskResult.objects.filter(date_done__lt=expires_before)
+
+    deleted = 0
+    while True:
+        expired_ids = list(
+            expired_results.order_by().values_list("id", flat=True)[:batch_size]
+        )
+        if not expired_ids:
+            return deleted
+
+        deleted += TaskResult.objects.filter(id__in=expired_ids).delete()[0]
+
+
+# 보관 기간이 지난 Idempotency-Key 응답(IdempotencyKey)을 batch_size 개씩 나누어 삭제하는 TASK
+@app.task(ignore_result=True, acks_late=True)
+def purge_idempotency_keys(batch_size: int = 1000) -> int:
+    from django.conf import settings
+    from django.utils import timezone
+
+    from config.models import IdempotencyKey
+
+    expires_before = timezone.now() - settings.IDEMPOTENCY_KEY_TTL
+    expired_keys = IdempotencyKey.objects.filter(created_date__lt=expires_before)
+
+    deleted = 0
+    while True:
+        expired_ids = list(
+            expired_keys.order_by().values_list("id", flat=True)[:batch_size]
+        )
+        if not expired_ids:
+            return deleted
+
+        deleted += IdempotencyKey.objects.filter(id__in=expired_ids).delete()[0]
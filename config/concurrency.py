@@ -0,0 +1,94 @@
+"""
+version 필드를 이용한 낙관적 동시성 제어 (If-Match).
+
+수정, 삭제 요청의 If-Match 헤더(조회 응답의 ETag)를 객체의 version 과 비교하고,
+저장은 UPDATE ... WHERE version = n 한번으로 수행하여 row lock 없이 동시 수정을 감지함.
+If-Match 헤더가 없는 요청은 기존과 같이 마지막 요청의 내용으로 저장함.
+"""
+
+from django.db import transaction
+from django.db.models import F
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import exceptions, status
+
+IF_MATCH_PARAMETER = OpenApiParameter(
+    "If-Match",
+    str,
+    OpenApiParameter.HEADER,
+    description="조회 응답의 ETag. 그 사이 다른 요청에서 수정되었다면 412 를 반환",
+)
+
+
+class PreconditionFailed(exceptions.APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "다른 요청에서 이미 수정되었습니다. 다시 조회한 후 요청해주세요."
+    default_code = "precondition_failed"
+
+
+def make_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def get_expected_version(request) -> int | None:
+    """
+    If-Match 헤더를 version 으로 변환. 헤더가 없거나 * 이면 None.
+    APICompressionMiddleware 가 압축한 응답의 ETag 는 weak ETag(W/"n") 이므로 함께 허용함.
+    """
+
+    value = request.headers.get("If-Match", "").strip()
+    if not value or value == "*":
+        return None
+
+    etag = value.removeprefix("W/")
+    if len(etag) < 3 or etag[0] != '"' or etag[-1] != '"' or not etag[1:-1].isdigit():
+        raise PreconditionFailed  # 어떤 version 과도 일치하지 않음
+
+    return int(etag[1:-1])
+
+
+class OptimisticConcurrencyMixin:
+    """
+    RetrieveUpdateDestroyAPIView 에 If-Match 처리를 추가하는 mixin.
+    serializer 는 config.serializers.VersionedUpdateMixin 을 사용해야 함.
+    """
+
+    def get_object(self):
+        obj = super().get_object()
+
+        # 바뀐 필드가 없어 저장하지 않는 요청, 검증에 실패하는 요청도 version 이 다르면 412
+        if self.request.method in ("PUT", "PATCH", "DELETE"):
+            expected_version = get_expected_version(self.request)
+            if expected_version is not None and obj.version != expected_version:
+                raise PreconditionFailed
+
+        return obj
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        response["ETag"] = make_etag(response.data["version"])
+        return response
+
+    def update(self, request, *args, **kwargs):
+        response = super().update(request, *args, **kwargs)
+        response["ETag"] = make_etag(response.data["version"])
+        return response
+
+    def perform_update(self, serializer):
+        # 조회 이후 다른 요청에서 수정되었다면 저장시 UPDATE 되는 row 가 없어 412
+        serializer.expected_version = get_expected_version(self.request)
+        super().perform_update(serializer)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        expected_version = get_expected_version(self.request)
+        if expected_version is not None:
+            # version 을 증가시켜 삭제 전 다른 요청의 수정을 막고, 이미 수정되었다면 412
+            updated = (
+                type(instance)
+                ._base_manager.filter(pk=instance.pk, version=expected_version)
+                .update(version=F("version") + 1)
+            )
+            if not updated:
+                raise PreconditionFailed
+
+        super().perform_destroy(instance)
@@ -0,0 +1,111 @@
+"""
+생성(POST) API 의 Idempotency-Key 처리.
+
+Idempotency-Key 헤더가 있는 요청의 성공 응답을 생성한 객체와 같은 transaction 에서 DB(IdempotencyKey)에
+저장하고, settings.IDEMPOTENCY_KEY_TTL 동안 같은 key 로 재시도한 요청에는 검증, 저장을 다시 수행하지 않고
+저장된 응답을 반환함. 요청을 처리하는 프로세스가 달라도 key 의 unique 제약으로 한번만 생성됨.
+"""
+
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import exceptions, status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from config.models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+IDEMPOTENCY_KEY_PARAMETER = OpenApiParameter(
+    IDEMPOTENCY_HEADER,
+    str,
+    OpenApiParameter.HEADER,
+    description="재시도시 같은 값을 보내면 처음 생성된 결과를 반환 (중복 생성 방지)",
+)
+
+
+class IdempotencyKeyInUse(exceptions.APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "같은 Idempotency-Key 의 요청이 처리중입니다."
+    default_code = "idempotency_key_in_use"
+
+
+class IdempotencyKeyReused(exceptions.APIException):
+    status_code = 422
+    default_detail = "Idempotency-Key 가 다른 요청에 이미 사용되었습니다."
+    default_code = "idempotency_key_reused"
+
+
+class IdempotentCreateMixin:
+    """
+    CreateAPIView 의 create 에 Idempotency-Key 처리를 추가하는 mixin.
+    key 는 사용자 별로 구분하고, 익명 요청은 요청 본문까지 포함하여 구분함.
+    """
+
+    def create(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return super().create(request, *args, **kwargs)
+
+        if not key or len(key) > 255:
+            raise exceptions.ValidationError({IDEMPOTENCY_HEADER: "1~255자의 값이어야 합니다."})
+
+        fingerprint = hashlib.sha256(request.body).hexdigest()
+        key_hash = self.get_idempotency_key_hash(request, key, fingerprint)
+
+        stored = IdempotencyKey.objects.filter(key=key_hash).first()
+        if stored is not None:
+            if stored.created_date >= self.get_expires_before():
+                return self.replay(stored, fingerprint)
+            stored.delete()  # 보관 기간이 지난 key 는 새로운 요청으로 처리
+
+        with transaction.atomic():
+            # 같은 key 의 요청이 동시에 처리중이면 먼저 저장한 요청이 끝날 때까지 unique 제약으로 대기하고,
+            # commit 된 경우 IntegrityError 이후 저장된 응답을 반환함
+            try:
+                with transaction.atomic():
+                    stored = IdempotencyKey.objects.create(
+                        key=key_hash, fingerprint=fingerprint
+                    )
+            except IntegrityError:
+                stored = IdempotencyKey.objects.filter(key=key_hash).first()
+                if stored is None:
+                    raise IdempotencyKeyInUse
+                return self.replay(stored, fingerprint)
+
+            # 생성에 실패하면(예외) transaction 과 함께 key 도 저장되지 않으므로 재시도시 다시 처리
+            response = super().create(request, *args, **kwargs)
+
+            # 직렬화 결과를 JSON 으로 변환하여 serializer 참조 없이 저장
+            stored.status = response.status_code
+            stored.headers = dict(response.items())
+            stored.data = json.loads(JSONRenderer().render(response.data))
+            stored.save(update_fields=["status", "headers", "data"])
+
+        return response
+
+    @staticmethod
+    def get_expires_before():
+        return timezone.now() - settings.IDEMPOTENCY_KEY_TTL
+
+    def get_idempotency_key_hash(self, request, key: str, fingerprint: str) -> str:
+        if request.user.is_authenticated:
+            scope = f"user:{request.user.pk}"
+        else:
+            scope = f"anonymous:{fingerprint}"
+
+        raw_key = "\n".join([scope, request.path, key])
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def replay(self, stored: IdempotencyKey, fingerprint: str) -> Response:
+        if stored.fingerprint != fingerprint:
+            raise IdempotencyKeyReused
+
+        headers = {**stored.headers, REPLAYED_HEADER: "true"}
+        return Response(stored.data, status=stored.status, headers=headers)
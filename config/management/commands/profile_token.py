@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from config.profiling import PROFILE_HEADER, make_token
+
+
+class Command(BaseCommand):
+    help = "요청을 프로파일링하기 위한 서명된 헤더 값을 출력합니다."
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{PROFILE_HEADER}: {make_token()}")
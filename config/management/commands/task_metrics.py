@@ -0,0 +1,56 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from config.metrics import get_registry
+
+
+class Command(BaseCommand):
+    help = "Celery task 별 실행 수, 대기 시간, 실행 시간, 재시도, 실패 수를 출력합니다."
+
+    def collect(self) -> dict[str, dict[str, float]]:
+        summary = defaultdict(lambda: defaultdict(float))
+
+        for family in get_registry().collect():
+            if not family.name.startswith("celery_task_"):
+                continue
+
+            for sample in family.samples:
+                task_summary = summary[sample.labels["task"]]
+
+                match sample.name:
+                    case "celery_task_queue_wait_seconds_sum":
+                        task_summary["wait_sum"] += sample.value
+                    case "celery_task_queue_wait_seconds_count":
+                        task_summary["wait_count"] += sample.value
+                    case "celery_task_runtime_seconds_sum":
+                        task_summary["runtime_sum"] += sample.value
+                    case "celery_task_runtime_seconds_count":
+                        task_summary["runs"] += sample.value
+                    case "celery_task_retries_total":
+                        task_summary["retries"] += sample.value
+                    case "celery_task_failures_total":
+                        task_summary["failures"] += sample.value
+
+        return summary
+
+    def handle(self, *args, **options):
+        summary = self.collect()
+        if not summary:
+            self.stdout.write("기록된 task metrics 가 없습니다.")
+            return
+
+        self.stdout.write(
+            f"{'task':<48} {'runs':>8} {'failures':>8} {'retries':>8} "
+            f"{'avg wait(s)':>12} {'avg runtime(s)':>15}"
+        )
+
+        for task_name, task_summary in sorted(summary.items()):
+            avg_wait = task_summary["wait_sum"] / (task_summary["wait_count"] or 1)
+            avg_runtime = task_summary["runtime_sum"] / (task_summary["runs"] or 1)
+
+            self.stdout.write(
+                f"{task_name:<48} {task_summary['runs']:>8.0f} "
+                f"{task_summary['failures']:>8.0f} {task_summary['retries']:>8.0f} "
+                f"{avg_wait:>12.3f} {avg_runtime:>15.3f}"
+            )
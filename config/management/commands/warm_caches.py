@@ -0,0 +1,226 @@
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count, Prefetch
+from django.http import Http404
+from django.urls import reverse
+
+from boards.models import CommentModel, PostModel
+from boards.paginations import PostCursorPagination
+from boards.serializers import PostBaseSerializer, PostDetailSerializer
+from config.views import load_schema_file
+
+
+class Command(BaseCommand):
+    help = (
+        "배포 이후 게시글 목록, 댓글이 많은 게시글의 직렬화 결과(RepresentationCacheMixin)와 "
+        "OpenAPI schema 를 미리 cache 합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", type=int, default=5, help="cache 할 게시글 목록 페이지 수")
+        parser.add_argument(
+            "--most-commented", type=int, default=20, help="cache 할 댓글이 많은 게시글 수"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="동시에 실행하는 작업 수 (최대 DB 연결 수)",
+        )
+        parser.add_argument(
+            "--base-url",
+            help="실행중인 서버 주소 (예: http://localhost:8000). "
+            "지정하면 목록 페이지와 schema 를 요청하여 서버 프로세스의 cache 도 채움",
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+
+        jobs = []
+        if self.is_shared_cache():
+            jobs += self.get_list_page_jobs(options["pages"])
+            jobs += self.get_most_commented_jobs(options["most_commented"])
+        elif options["base_url"]:
+            self.stderr.write(
+                "기본 cache 가 프로세스 안에만 저장되므로 직렬화 결과는 cache 하지 않고 서버에 요청하여 cache 합니다."
+            )
+        else:
+            raise CommandError(
+                "기본 cache 가 프로세스 안에만 저장되어(LocMemCache) 서버 프로세스의 cache 를 채울 수 없습니다. "
+                "공유 cache(Redis, Memcached)를 설정하거나 --base-url 을 지정하세요."
+            )
+
+        jobs += self.get_schema_jobs()
+        if options["base_url"]:
+            jobs += self.get_http_jobs(options["base_url"], options["pages"])
+
+        results = self.run(jobs, max(options["concurrency"], 1))
+
+        failures = 0
+        for (name, _), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                failures += 1
+                self.stderr.write(f"{name}: {result!r}")
+            else:
+                self.stdout.write(f"{name}: {result}")
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"{len(jobs) - failures}/{len(jobs)} 개의 작업을 {elapsed:.2f}초 동안 완료했습니다."
+        )
+
+    @staticmethod
+    def is_shared_cache() -> bool:
+        # LocMemCache, DummyCache 는 이 명령어의 프로세스에만 저장되어 서버 프로세스와 공유되지 않음
+        return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+    def run(self, jobs, concurrency: int) -> list:
+        if concurrency == 1:
+            return [self.run_job(job) for _, job in jobs]
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self.run_job, [job for _, job in jobs]))
+
+    @staticmethod
+    def run_job(job):
+        try:
+            return job()
+        except Exception as exc:
+            return exc
+        finally:
+            # 작업 thread 의 DB 연결은 재사용되지 않으므로 작업이 끝나면 닫음
+            if threading.current_thread() is not threading.main_thread():
+                connections.close_all()
+
+    def get_list_page_jobs(self, pages: int) -> list:
+        """
+        게시글 목록 페이지(PostCursorPagination)의 게시글을 페이지 단위로 직렬화
+        """
+
+        page_size = PostCursorPagination.page_size
+        limit = pages * page_size
+        ids = list(
+            PostModel.objects.order_by("-id").values_list("id", flat=True)[:limit]
+        )
+
+        jobs = []
+        for page, start in enumerate(range(0, len(ids), page_size), start=1):
+            end = start + page_size
+            jobs.append((f"게시글 목록 {page} 페이지", self.warm_posts(ids[start:end])))
+
+        return jobs
+
+    @staticmethod
+    def warm_posts(ids: list[int]):
+        def job():
+            posts = PostModel.objects.select_related("owner").in_bulk(ids)
+            PostBaseSerializer(list(posts.values()), many=True).data
+            return f"게시글 {len(posts)}개"
+
+        return job
+
+    def get_most_commented_jobs(self, limit: int) -> list:
+        """
+        댓글이 많은 게시글의 세부 정보(게시글, 댓글)를 직렬화
+        """
+
+        ids = list(
+            PostModel.objects.annotate(comments_count=Count("comment"))
+            .filter(comments_count__gt=0)
+            .order_by("-comments_count", "-id")
+            .values_list("id", flat=True)[:limit]
+        )
+
+        return [(f"게시글 {pk} 세부 정보", self.warm_post_detail(pk)) for pk in ids]
+
+    @staticmethod
+    def warm_post_detail(pk: int):
+        def job():
+            comments = CommentModel.objects.select_related("owner")
+            post = (
+                PostModel.objects.select_related("owner")
+                .prefetch_related(Prefetch("comment", queryset=comments))
+                .get(pk=pk)
+            )
+            data = PostDetailSerializer(post).data
+            return f"댓글 {len(data['comments'])}개"
+
+        return job
+
+    def get_schema_jobs(self) -> list:
+        """
+        미리 생성된 schema 파일 확인 (DEBUG 일 경우 요청마다 생성하므로 제외).
+        schema 는 서버 프로세스의 메모리에 저장되므로 --base-url 로 요청해야 서버의 cache 가 채워짐.
+        """
+
+        if settings.DEBUG:
+            return []
+
+        return [
+            (
+                f"schema {name}",
+                self.warm_schema_file(settings.OPENAPI_SCHEMA_DIR / name),
+            )
+            for name in ("openapi.json", "openapi.yaml")
+        ]
+
+    @staticmethod
+    def warm_schema_file(path):
+        def job():
+            try:
+                schema = load_schema_file(path)
+            except Http404:
+                raise FileNotFoundError(f"{path} (manage.py spectacular --file)")
+
+            return f"{len(schema.content)} bytes"
+
+        return job
+
+    def get_http_jobs(self, base_url: str, pages: int) -> list:
+        jobs = [("HTTP 게시글 목록", self.request_list_pages(base_url, pages))]
+        for name in ("schema-json", "swagger-yaml"):
+            jobs.append(
+                (f"HTTP {name}", self.request(urljoin(base_url, reverse(name))))
+            )
+
+        return jobs
+
+    @staticmethod
+    def request(url: str):
+        def job():
+            with urlopen(Request(url, headers={"Accept-Encoding": "gzip"}), timeout=10):
+                return url
+
+        return job
+
+    @staticmethod
+    def request_list_pages(base_url: str, pages: int):
+        def job():
+            # 다음 페이지 주소는 응답의 next 로만 알 수 있으므로 순서대로 요청
+            url = urljoin(base_url, reverse("post-list"))
+            requested = 0
+            while url and requested < pages:
+                request = Request(url, headers={"Accept-Encoding": "gzip"})
+                with urlopen(request, timeout=10) as response:
+                    body = response.read()
+                    if response.headers.get("Content-Encoding") == "gzip":
+                        body = gzip.decompress(body)
+
+                url = json.loads(body)["next"]
+                requested += 1
+
+            return f"{requested} 페이지"
+
+        return job
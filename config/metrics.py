@@ -0,0 +1,108 @@
+"""
+Prometheus 형식의 metrics.
+
+PROMETHEUS_MULTIPROC_DIR 환경 변수를 설정하면 prometheus_client 의 multiprocess 모드로 동작하여
+여러 프로세스(gunicorn worker, celery worker 등)에서 기록한 값을 합산해서 제공함.
+"""
+
+import os
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "요청 처리 시간",
+    ["view", "method"],
+)
+REQUESTS = Counter(
+    "http_requests",
+    "요청 수",
+    ["view", "method", "status"],
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "응답 크기",
+    ["view"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, float("inf")),
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "요청당 DB 쿼리 수",
+    ["view"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, float("inf")),
+)
+JWT_VALIDATION = Histogram(
+    "jwt_validation_duration_seconds",
+    "JWT 검증 시간 (JWTCookieAuthentication)",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, float("inf")),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests",
+    "cache 조회 수 (hit / miss)",
+    ["cache", "result"],
+)
+BOARD_EVENTS = Counter(
+    "board_events",
+    "처리한 게시글, 댓글 변경 이벤트 수 (boards.events)",
+    ["model", "action"],
+)
+
+TASK_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds",
+    "task 발행부터 실행 시작까지 걸린 시간",
+    ["task"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, float("inf")),
+)
+TASK_RUNTIME = Histogram(
+    "celery_task_runtime_seconds",
+    "task 실행 시간",
+    ["task", "state"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, float("inf")),
+)
+TASK_RETRIES = Counter(
+    "celery_task_retries",
+    "task 재시도 수",
+    ["task"],
+)
+TASK_FAILURES = Counter(
+    "celery_task_failures",
+    "task 실패 수",
+    ["task"],
+)
+
+
+def record_cache(cache_name: str, hit: bool, count: int = 1):
+    if count:
+        CACHE_REQUESTS.labels(cache_name, "hit" if hit else "miss").inc(count)
+
+
+def get_registry() -> CollectorRegistry:
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+
+    return REGISTRY
+
+
+def metrics_view(request):
+    """
+    내부(settings.METRICS_ALLOWED_IPS)에서만 조회할 수 있는 metrics API
+    """
+
+    if request.META.get("REMOTE_ADDR") not in settings.METRICS_ALLOWED_IPS:
+        raise Http404
+
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
@@ -0,0 +1,537 @@
+import asyncio
+import cProfile
+import gzip
+import hashlib
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.db import connection
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.module_loading import import_string
+
+from config import metrics, profiling
+from config.singleflight import ResponseSnapshot, SingleFlight
+from config.slow_queries import query_origin
+
+try:
+    import zstandard
+except ImportError:  # zstandard 가 설치되지 않은 경우 gzip 만 사용
+    zstandard = None
+
+
+class PathScopedMiddleware:
+    """
+    settings.PATH_SCOPED_MIDDLEWARE 의 middleware 들을 API 요청에는 적용하지 않는 middleware.
+
+    API(settings.API_PATH_PREFIX)는 JWT 쿠키로 인증하므로 session, csrf, messages 가 필요하지 않음.
+    admin, docs 등 나머지 요청에만 해당 middleware 들을 실행함.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        self.view_middleware = []
+        self.template_response_middleware = []
+        self.exception_middleware = []
+
+        # BaseHandler.load_middleware 와 동일한 방식으로 middleware chain 생성
+        handler = get_response
+        for middleware_path in reversed(settings.PATH_SCOPED_MIDDLEWARE):
+            mw_instance = import_string(middleware_path)(handler)
+
+            if hasattr(mw_instance, "process_view"):
+                self.view_middleware.insert(0, mw_instance.process_view)
+            if hasattr(mw_instance, "process_template_response"):
+                self.template_response_middleware.append(
+                    mw_instance.process_template_response
+                )
+            if hasattr(mw_instance, "process_exception"):
+                self.exception_middleware.append(mw_instance.process_exception)
+
+            handler = convert_exception_to_response(mw_instance)
+
+        self.scoped_handler = handler
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def is_api_request(self, request) -> bool:
+        return request.path_info.startswith(settings.API_PATH_PREFIX)
+
+    def __call__(self, request):
+        if self.is_api_request(request):
+            return self.get_response(request)
+
+        return self.scoped_handler(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.is_api_request(request):
+            return None
+
+        for process_view in self.view_middleware:
+            response = process_view(request, view_func, view_args, view_kwargs)
+            if response:
+                return response
+
+        return None
+
+    def process_template_response(self, request, response):
+        if self.is_api_request(request):
+            return response
+
+        for process_template_response in self.template_response_middleware:
+            response = process_template_response(request, response)
+
+        return response
+
+    def process_exception(self, request, exception):
+        if self.is_api_request(request):
+            return None
+
+        for process_exception in self.exception_middleware:
+            response = process_exception(request, exception)
+            if response:
+                return response
+
+        return None
+
+
+def get_compression_level(max_level: int) -> int:
+    """
+    사용 가능한 CPU 수에 따라 압축 레벨을 결정 (CPU 가 적을수록 빠른 압축 레벨 사용)
+    """
+
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpu_count = os.cpu_count() or 1
+
+    return max(1, min(max_level, cpu_count))
+
+
+def parse_accept_encoding(header: str) -> set[str]:
+    """
+    Accept-Encoding header 에서 허용된(q > 0) encoding 목록을 반환
+    """
+
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        params = params.strip()
+
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 0.0
+
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+
+    return accepted
+
+
+class APICompressionMiddleware(MiddlewareMixin):
+    """
+    API 응답을 압축하는 middleware.
+    zstandard 가 설치되어 있고 client 가 허용하면 더 빠른 zstd, 그 외에는 gzip 을 사용함.
+
+    settings.API_COMPRESSION_MIN_SIZE 보다 작은 응답은 압축하지 않고,
+    다시 요청될 수 있는 응답(익명 GET, 200, private 가 아닌 응답)의 압축 결과는
+    응답 내용의 hash 로 cache 에 저장해 같은 응답을 다시 압축하지 않음.
+    UpdateCacheMiddleware 등 response cache 는 이 middleware 보다 앞에 두어야
+    Vary: Accept-Encoding 에 따라 압축된 응답이 저장됨.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.min_size = settings.API_COMPRESSION_MIN_SIZE
+        self.cache_timeout = settings.API_COMPRESSION_CACHE_TIMEOUT
+        # 선호하는 encoding 순서
+        self.levels = {}
+        if zstandard is not None:
+            self.levels["zstd"] = get_compression_level(3)
+        self.levels["gzip"] = get_compression_level(6)
+
+    def select_encoding(self, request) -> str | None:
+        accepted = parse_accept_encoding(request.headers.get("Accept-Encoding", ""))
+
+        for encoding in self.levels:
+            if encoding in accepted:
+                return encoding
+
+        return None
+
+    def compress(self, content: bytes, encoding: str) -> bytes:
+        level = self.levels[encoding]
+
+        if encoding == "zstd":
+            return zstandard.ZstdCompressor(level=level).compress(content)
+
+        return gzip.compress(content, compresslevel=level, mtime=0)
+
+    def is_cacheable(self, request, response) -> bool:
+        """
+        같은 응답이 다시 요청될 수 있는 경우에만 압축 결과를 cache (그 외에는 cache 조회, 저장 비용만 발생)
+        """
+
+        if not self.cache_timeout:
+            return False
+        if request.method not in ("GET", "HEAD") or response.status_code != 200:
+            return False
+
+        cache_control = response.get("Cache-Control", "")
+        if "private" in cache_control or "no-store" in cache_control:
+            return False
+
+        # 인증된 요청의 응답은 사용자 별로 다름
+        return (
+            "access" not in request.COOKIES and "Authorization" not in request.headers
+        )
+
+    def get_compressed_content(self, content: bytes, encoding: str) -> bytes:
+        digest = hashlib.sha1(content).hexdigest()
+        cache_key = f"compressed:{encoding}:{self.levels[encoding]}:{digest}"
+
+        compressed = cache.get(cache_key)
+        metrics.record_cache("compression", compressed is not None)
+        if compressed is None:
+            compressed = self.compress(content, encoding)
+            cache.set(cache_key, compressed, self.cache_timeout)
+
+        return compressed
+
+    def process_response(self, request, response):
+        if not request.path_info.startswith(settings.API_PATH_PREFIX):
+            return response
+
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+
+        if len(response.content) < self.min_size:
+            return response
+
+        # 압축 여부와 관계없이 Accept-Encoding 에 따라 응답이 달라짐
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = self.select_encoding(request)
+        if encoding is None:
+            return response
+
+        if self.is_cacheable(request, response):
+            compressed = self.get_compressed_content(response.content, encoding)
+        else:
+            compressed = self.compress(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = encoding
+
+        # 압축된 응답은 byte 단위로 달라지므로 strong ETag 를 weak ETag 로 변경
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+
+        return response
+
+
+class QueryCounter:
+    """
+    connection.execute_wrapper 로 실행된 쿼리 수를 세는 wrapper
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class MetricsMiddleware:
+    """
+    요청 처리 시간, 응답 크기, DB 쿼리 수를 url name 별로 기록하는 middleware (config.metrics).
+    전체 처리 시간과 최종 응답 크기를 기록하기 위해 MIDDLEWARE 의 가장 앞에 두어야 함.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        query_counter = QueryCounter()
+        started = time.perf_counter()
+
+        with connection.execute_wrapper(query_counter):
+            response = self.get_response(request)
+
+        self.observe(request, response, time.perf_counter() - started)
+        metrics.DB_QUERIES.labels(self.get_view_name(request)).observe(
+            query_counter.count
+        )
+        return response
+
+    async def __acall__(self, request):
+        # async view 의 쿼리는 다른 스레드의 connection 에서 실행되므로 쿼리 수는 기록하지 않음
+        started = time.perf_counter()
+        response = await self.get_response(request)
+
+        self.observe(request, response, time.perf_counter() - started)
+        return response
+
+    def get_view_name(self, request) -> str:
+        if request.resolver_match is None:
+            return "<unmatched>"
+
+        return request.resolver_match.view_name
+
+    def observe(self, request, response, elapsed: float):
+        view_name = self.get_view_name(request)
+
+        metrics.REQUEST_LATENCY.labels(view_name, request.method).observe(elapsed)
+        metrics.REQUESTS.labels(view_name, request.method, response.status_code).inc()
+
+        if not response.streaming:
+            metrics.RESPONSE_SIZE.labels(view_name).observe(len(response.content))
+
+
+class QueryOriginMiddleware(MiddlewareMixin):
+    """
+    느린 쿼리 로그(config.slow_queries)에 쿼리를 실행한 view 의 url name 을 기록하기 위한 middleware
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        query_origin.set(f"view:{request.resolver_match.view_name}")
+
+    def process_response(self, request, response):
+        query_origin.set(None)
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    서명된 헤더 또는 샘플링 비율로 선택된 요청을 cProfile 로 프로파일링하는 middleware (config.profiling).
+    settings.PROFILING_ENABLED 가 아닐 경우 middleware chain 에서 제외되어 비용이 발생하지 않음.
+    """
+
+    sync_capable = True
+    async_capable = False
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        trigger = profiling.get_trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+
+        profiler.enable()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+
+        elapsed = time.perf_counter() - started
+        response["X-Profile-Id"] = profiling.write_profile(
+            profiler, request, response, elapsed, trigger
+        )
+        return response
+
+
+class SingleFlightMiddleware:
+    """
+    동시에 들어온 동일한 익명 GET API 요청을 하나로 합치는 middleware (config.singleflight).
+
+    같은 요청이 처리되는 동안 들어온 요청은 처리 결과를 기다렸다가 공유함.
+    settings.SINGLE_FLIGHT_CACHE_LOCK 을 사용하면 cache lock 으로 여러 프로세스 사이에서도 합침
+    (프로세스 사이에서 공유되는 cache backend 가 필요함).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    poll_interval = 0.01  # 다른 프로세스의 처리 결과를 확인하는 간격(초)
+
+    def __init__(self, get_response):
+        if not settings.SINGLE_FLIGHT_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.flights = SingleFlight()
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def get_key(self, request) -> str | None:
+        """
+        합칠 수 있는 요청인 경우 요청의 key 를 반환
+        """
+
+        if request.method not in ("GET", "HEAD"):
+            return None
+        if not request.path_info.startswith(settings.API_PATH_PREFIX):
+            return None
+        # 인증된 요청은 사용자에 따라 응답이 다르므로 합치지 않음
+        if "access" in request.COOKIES or "Authorization" in request.headers:
+            return None
+
+        # 페이지의 next, previous 는 요청의 host, scheme 으로 만든 절대 주소이므로 key 에 포함
+        key = "\n".join(
+            [
+                request.method,
+                request.scheme,
+                request.get_host(),
+                request.get_full_path(),
+                request.headers.get("Accept", ""),
+            ]
+        )
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        key = self.get_key(request)
+        if key is None:
+            return self.get_response(request)
+
+        result, is_leader = self.flights.do(
+            key, lambda: self.lead(request, key), settings.SINGLE_FLIGHT_TIMEOUT
+        )
+        response = self.get_shared_response(result, is_leader)
+        if response is None:
+            return self.get_response(request)
+
+        return response
+
+    async def __acall__(self, request):
+        key = self.get_key(request)
+        if key is None:
+            return await self.get_response(request)
+
+        result, is_leader = await self.flights.ado(
+            key, lambda: self.alead(request, key), settings.SINGLE_FLIGHT_TIMEOUT
+        )
+        response = self.get_shared_response(result, is_leader)
+        if response is None:
+            return await self.get_response(request)
+
+        return response
+
+    def get_shared_response(self, result, is_leader: bool):
+        """
+        leader 는 자신의 응답을, follower 는 공유된 결과로 만든 새로운 응답을 반환.
+        follower 가 결과를 받지 못한 경우(timeout, 공유할 수 없는 응답) None 을 반환하며 직접 처리함.
+        """
+
+        if result is None:
+            return None
+
+        response, snapshot = result
+        if is_leader and response is not None:
+            return response
+        if snapshot is not None:
+            return snapshot.to_response()
+
+        return None
+
+    def get_cache_keys(self, key: str) -> tuple[str, str]:
+        return f"singleflight:lock:{key}", f"singleflight:result:{key}"
+
+    def lead(self, request, key: str):
+        """
+        leader 로 요청을 처리하여 (응답, 공유할 결과)를 반환.
+        다른 프로세스에서 처리중인 경우 그 결과를 기다림 (SINGLE_FLIGHT_CACHE_LOCK).
+        """
+
+        lock_key, result_key = self.get_cache_keys(key)
+        locked = False
+
+        if settings.SINGLE_FLIGHT_CACHE_LOCK:
+            locked = cache.add(lock_key, 1, settings.SINGLE_FLIGHT_TIMEOUT)
+            if not locked:
+                snapshot = self.wait_for_result(lock_key, result_key)
+                metrics.record_cache("singleflight", snapshot is not None)
+                if snapshot is not None:
+                    return None, snapshot
+
+        try:
+            response = self.get_response(request)
+            snapshot = ResponseSnapshot.from_response(response)
+            if locked and snapshot is not None:
+                cache.set(result_key, snapshot, settings.SINGLE_FLIGHT_RESULT_TIMEOUT)
+        finally:
+            if locked:
+                cache.delete(lock_key)
+
+        return response, snapshot
+
+    async def alead(self, request, key: str):
+        lock_key, result_key = self.get_cache_keys(key)
+        locked = False
+
+        if settings.SINGLE_FLIGHT_CACHE_LOCK:
+            locked = await cache.aadd(lock_key, 1, settings.SINGLE_FLIGHT_TIMEOUT)
+            if not locked:
+                snapshot = await self.await_result(lock_key, result_key)
+                metrics.record_cache("singleflight", snapshot is not None)
+                if snapshot is not None:
+                    return None, snapshot
+
+        try:
+            response = await self.get_response(request)
+            snapshot = ResponseSnapshot.from_response(response)
+            if locked and snapshot is not None:
+                await cache.aset(
+                    result_key, snapshot, settings.SINGLE_FLIGHT_RESULT_TIMEOUT
+                )
+        finally:
+            if locked:
+                await cache.adelete(lock_key)
+
+        return response, snapshot
+
+    def wait_for_result(self, lock_key: str, result_key: str):
+        # lock 이 해제되었는데 결과가 없으면 다른 프로세스의 처리가 실패한 것으로 보고 직접 처리
+        deadline = time.monotonic() + settings.SINGLE_FLIGHT_TIMEOUT
+        while time.monotonic() < deadline:
+            snapshot = cache.get(result_key)
+            if snapshot is not None or lock_key not in cache:
+                return snapshot
+            time.sleep(self.poll_interval)
+
+        return None
+
+    async def await_result(self, lock_key: str, result_key: str):
+        deadline = time.monotonic() + settings.SINGLE_FLIGHT_TIMEOUT
+        while time.monotonic() < deadline:
+            snapshot = await cache.aget(result_key)
+            if snapshot is not None or not await cache.ahas_key(lock_key):
+                return snapshot
+            await asyncio.sleep(self.poll_interval)
+
+        return None
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-19 14:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=64, unique=True)),
+                ("fingerprint", models.CharField(max_length=64)),
+                ("status", models.PositiveSmallIntegerField(null=True)),
+                ("headers", models.JSONField(default=dict)),
+                ("data", models.JSONField(null=True)),
+                (
+                    "created_date",
+                    models.DateTimeField(
+                        auto_now_add=True, db_index=True, verbose_name="생성일"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import models
+
+
+# Idempotency-Key 로 처리한 생성 요청의 응답 (config.idempotency 참고)
+# 생성한 객체와 같은 transaction 에서 저장되므로, 여러 프로세스에서 같은 key 로 동시에 요청해도
+# unique 제약으로 한번만 생성됨
+class IdempotencyKey(models.Model):
+    key = models.CharField(max_length=64, unique=True)  # 사용자, 경로, key 의 sha256
+    fingerprint = models.CharField(max_length=64)  # 요청 본문의 sha256
+    status = models.PositiveSmallIntegerField(null=True)
+    headers = models.JSONField(default=dict)
+    data = models.JSONField(null=True)
+    created_date = models.DateTimeField("생성일", auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return self.key
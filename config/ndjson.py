@@ -0,0 +1,141 @@
+"""
+NDJSON 일괄 가져오기 명령어의 공통 처리 (manage.py import_boards, import_users).
+
+파일을 chunk 단위로 읽어 importer 에 전달하고, chunk 가 저장될 때마다 다음에 읽을 byte 위치(offset)와
+진행 상황을 출력하여 중단된 경우 --offset 으로 이어서 가져올 수 있음.
+"""
+
+import json
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+@dataclass
+class Line:
+    offset: int  # 줄이 시작하는 byte 위치
+    data: object = None
+    error: object = None
+
+
+@dataclass
+class Progress:
+    offset: int  # 다음에 읽을 byte 위치 (이어서 가져올 때 사용)
+    created: int = 0
+    skipped: int = 0
+    # 마지막 chunk 에서 저장하지 못한 row 의 (byte 위치, 오류)
+    errors: list[tuple[int, object]] = field(default_factory=list)
+
+    def update(self, lines: list[Line], created: int, next_offset: int) -> None:
+        self.offset = next_offset
+        self.created += created
+        self.skipped += len(lines) - created
+        self.errors = [(line.offset, line.error) for line in lines if line.error]
+
+
+def read_chunks(file: BinaryIO, chunk_size: int) -> Iterator[tuple[list[Line], int]]:
+    """
+    현재 위치부터 chunk_size 줄씩 읽어 (줄 목록, 다음에 읽을 byte 위치) 를 반환
+    """
+
+    while True:
+        lines = []
+        while len(lines) < chunk_size:
+            offset = file.tell()
+            raw = file.readline()
+            if not raw:
+                break
+            if not raw.strip():  # 빈 줄
+                continue
+
+            try:
+                data = json.loads(raw)
+            except ValueError as exc:
+                lines.append(Line(offset, error=f"JSON 형식 오류: {exc}"))
+                continue
+
+            if isinstance(data, dict):
+                lines.append(Line(offset, data=data))
+            else:
+                lines.append(Line(offset, error="JSON object 가 아닙니다."))
+
+        if not lines:
+            return
+
+        yield lines, file.tell()
+
+
+class ImportCommand(BaseCommand):
+    """
+    NDJSON 가져오기 명령어의 base class.
+    get_importer 는 run(file, chunk_size, on_progress) -> Progress 를 제공하는 객체를 반환해야 함.
+    """
+
+    default_chunk_size: int
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="가져올 NDJSON 파일 경로")
+        parser.add_argument(
+            "--offset", type=int, default=0, help="읽기 시작할 byte 위치 (이어서 가져오기)"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=self.default_chunk_size,
+            help="하나의 transaction 에서 처리하는 row 수",
+        )
+
+    def get_importer(self, **options):
+        raise NotImplementedError
+
+    def get_name(self, **options) -> str:
+        raise NotImplementedError
+
+    def handle(self, *args, path, offset, chunk_size, **options):
+        importer = self.get_importer(**options)
+
+        try:
+            file = open(path, "rb")
+        except OSError as exc:
+            raise CommandError(exc)
+
+        with file:
+            self.seek(file, offset)
+
+            self.total = os.fstat(file.fileno()).st_size
+            self.start = time.perf_counter()
+            progress = importer.run(file, chunk_size, on_progress=self.report)
+
+        self.stdout.write(
+            f"{self.get_name(**options)} {progress.created}개를 저장했습니다. "
+            f"(저장하지 못한 row {progress.skipped}개)"
+        )
+
+    def report(self, progress: Progress):
+        for error_offset, error in progress.errors:
+            error = json.dumps(error, ensure_ascii=False)
+            self.stderr.write(f"offset={error_offset} 저장하지 못함: {error}")
+
+        elapsed = time.perf_counter() - self.start
+        rate = (progress.created + progress.skipped) / (elapsed or 1)
+        percent = progress.offset / (self.total or 1) * 100
+        self.stderr.write(
+            f"offset={progress.offset} ({percent:.1f}%) "
+            f"created={progress.created} skipped={progress.skipped} "
+            f"{rate:.0f} rows/s"
+        )
+
+    @staticmethod
+    def seek(file, offset: int):
+        if offset < 0:
+            raise CommandError("offset 은 0 이상이어야 합니다.")
+
+        if offset:
+            # 줄의 시작 위치에서만 이어서 읽을 수 있음
+            file.seek(offset - 1)
+            if file.read(1) != b"\n":
+                raise CommandError(f"offset={offset} 은 줄의 시작 위치가 아닙니다.")
@@ -0,0 +1,83 @@
+"""
+요청 단위 프로파일링 (config.middleware.ProfilingMiddleware).
+
+서명된 X-Profile-Token 헤더가 있는 요청 또는 settings.PROFILING_SAMPLE_RATE 비율로 샘플링된 요청을
+cProfile 로 프로파일링하여 settings.PROFILING_SPOOL_DIR 에 저장함.
+"""
+
+import json
+import random
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from django.conf import settings
+from django.core import signing
+
+PROFILE_HEADER = "X-Profile-Token"
+
+signer = signing.TimestampSigner(salt="config.profiling")
+
+
+def make_token() -> str:
+    return signer.sign("profile")
+
+
+def is_valid_token(token: str) -> bool:
+    try:
+        signer.unsign(token, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except signing.BadSignature:  # 만료된 경우(SignatureExpired) 포함
+        return False
+
+    return True
+
+
+def get_trigger(request) -> str | None:
+    """
+    프로파일링할 요청인 경우 프로파일링 사유(header, sample)를 반환
+    """
+
+    token = request.headers.get(PROFILE_HEADER)
+    if token is not None and is_valid_token(token):
+        return "header"
+
+    sample_rate = settings.PROFILING_SAMPLE_RATE
+    if sample_rate and random.random() < sample_rate:
+        return "sample"
+
+    return None
+
+
+def write_profile(profiler, request, response, elapsed: float, trigger: str) -> str:
+    """
+    프로파일 결과(.prof)와 요청 정보(.json)를 spool 디렉토리에 저장하고 프로파일 id 를 반환
+    """
+
+    spool_dir = Path(settings.PROFILING_SPOOL_DIR)
+    spool_dir.mkdir(parents=True, exist_ok=True)
+
+    if request.resolver_match is None:
+        view_name = "<unmatched>"
+    else:
+        view_name = request.resolver_match.view_name
+
+    profile_id = "{}-{}-{}".format(
+        time.strftime("%Y%m%d%H%M%S"),
+        view_name.replace(":", "_").strip("<>"),
+        uuid4().hex[:8],
+    )
+
+    profiler.dump_stats(spool_dir / f"{profile_id}.prof")
+
+    metadata = {
+        "view": view_name,
+        "method": request.method,
+        "path": request.get_full_path(),
+        "status": response.status_code,
+        "duration": elapsed,
+        "trigger": trigger,
+        "timestamp": time.time(),
+    }
+    (spool_dir / f"{profile_id}.json").write_text(json.dumps(metadata))
+
+    return profile_id
@@ -0,0 +1,133 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+
+from config.celery import app
+
+logger = logging.getLogger(__name__)
+
+
+class TaskMessage(NamedTuple):
+    task: object
+    args: tuple
+    kwargs: dict
+    options: dict
+    coalesce_key: str | None
+
+
+class BufferedTaskPublisher:
+    """
+    Celery task 발행을 요청 처리 스레드에서 분리하는 publisher.
+
+    publish 는 메모리 queue 에 추가만 하고, background 스레드가 flush_interval 동안 모인
+    task 들을 하나의 broker 연결(producer)로 발행함. coalesce=True 로 발행한 task 는
+    같은 batch 안에서 task, 인자가 같으면 한번만 발행함.
+    """
+
+    def __init__(self, flush_interval: float, max_batch_size: int):
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+
+        atexit.register(self.flush)
+
+    def publish(self, task, args=(), kwargs=None, *, coalesce=False, **options):
+        message = self.make_message(task, args, kwargs, coalesce, options)
+        self._get_queue().put(message)
+
+    @staticmethod
+    def make_message(task, args=(), kwargs=None, coalesce=False, options=None):
+        kwargs = kwargs or {}
+        options = options or {}
+
+        coalesce_key = None
+        if coalesce:
+            coalesce_key = json.dumps(
+                [task.name, args, kwargs, options], sort_keys=True, default=str
+            )
+
+        return TaskMessage(task, tuple(args), kwargs, options, coalesce_key)
+
+    def flush(self):
+        """
+        queue 에 남아있는 task 를 현재 스레드에서 바로 발행 (종료시, 테스트 등)
+        """
+
+        if self._queue is None:
+            return
+
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if batch:
+            self._publish_batch(batch)
+
+    def _get_queue(self) -> queue.Queue:
+        # fork 된 프로세스(gunicorn worker 등)에서는 스레드를 새로 시작
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue()
+                    threading.Thread(
+                        target=self._run, args=(self._queue,), daemon=True
+                    ).start()
+                    self._pid = os.getpid()
+
+        return self._queue
+
+    def _run(self, message_queue: queue.Queue):
+        while True:
+            batch = [message_queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+
+                try:
+                    batch.append(message_queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            self._publish_batch(batch)
+
+    def _publish_batch(self, batch: list[TaskMessage]):
+        published = set()
+
+        try:
+            with app.producer_or_acquire() as producer:
+                for message in batch:
+                    if message.coalesce_key is not None:
+                        if message.coalesce_key in published:
+                            continue
+                        published.add(message.coalesce_key)
+
+                    message.task.apply_async(
+                        message.args,
+                        message.kwargs,
+                        producer=producer,
+                        **message.options,
+                    )
+        except Exception:
+            logger.exception("task 발행에 실패했습니다. (%d개)", len(batch))
+
+
+task_publisher = BufferedTaskPublisher(
+    flush_interval=settings.TASK_PUBLISHER_FLUSH_INTERVAL,
+    max_batch_size=settings.TASK_PUBLISHER_MAX_BATCH_SIZE,
+)
@@ -0,0 +1,216 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models import F
+from rest_framework import serializers
+from rest_framework.relations import PKOnlyObject
+from rest_framework.serializers import raise_errors_on_nested_writes
+from rest_framework.utils import model_meta
+
+from config import metrics
+from config.concurrency import PreconditionFailed
+
+
+class UpdateChangedFieldsMixin:
+    """
+    ModelSerializer 의 update 에서 값이 바뀐 필드만 저장 (save(update_fields=...)).
+    바뀐 필드가 없으면 저장하지 않으며(updated_date 등 auto_now 필드도 유지),
+    바뀐 필드 목록은 update 이후 changed_fields 로 확인할 수 있음.
+    """
+
+    changed_fields: list[str] | None = None
+
+    def update(self, instance, validated_data):
+        raise_errors_on_nested_writes("update", self, validated_data)
+        info = model_meta.get_field_info(instance)
+
+        self.changed_fields = []
+        many_to_many = []
+        for attr, value in validated_data.items():
+            if attr in info.relations and info.relations[attr].to_many:
+                many_to_many.append((attr, value))
+                continue
+
+            # FK 는 관련 객체를 조회하지 않도록 id 로 비교
+            field = instance._meta.get_field(attr)
+            current = getattr(instance, field.attname)
+            new = value.pk if field.is_relation and value is not None else value
+
+            if current != new:
+                setattr(instance, attr, value)
+                self.changed_fields.append(attr)
+
+        if self.changed_fields:
+            auto_now_fields = [
+                field.name
+                for field in instance._meta.concrete_fields
+                if getattr(field, "auto_now", False)
+            ]
+            self.save_changed_fields(instance, self.changed_fields + auto_now_fields)
+
+        for attr, value in many_to_many:
+            getattr(instance, attr).set(value)
+
+        return instance
+
+    def save_changed_fields(self, instance, update_fields: list[str]):
+        instance.save(update_fields=update_fields)
+
+
+class VersionedUpdateMixin(UpdateChangedFieldsMixin):
+    """
+    version 필드가 있는 model 의 바뀐 필드를 UPDATE ... WHERE version = n 으로 저장하고 version 을 1 증가.
+    expected_version 은 view 에서 If-Match 헤더로 설정하며(config.concurrency),
+    저장 시점의 version 이 다르면 PreconditionFailed(412).
+    queryset 의 update 로 저장하므로 pre_save, post_save signal 은 발생하지 않음.
+    """
+
+    expected_version: int | None = None
+
+    def save_changed_fields(self, instance, update_fields: list[str]):
+        queryset = type(instance)._base_manager.filter(pk=instance.pk)
+        if self.expected_version is not None:
+            queryset = queryset.filter(version=self.expected_version)
+
+        values = {}
+        for name in update_fields:
+            field = instance._meta.get_field(name)
+            values[field.attname] = field.pre_save(instance, add=False)  # auto_now 갱신
+
+        if not queryset.update(**values, version=F("version") + 1):
+            raise PreconditionFailed
+
+        if self.expected_version is not None:
+            instance.version = self.expected_version + 1
+        else:
+            instance.refresh_from_db(fields=["version"])
+
+
+class RepresentationCacheMixin:
+    """
+    ModelSerializer 의 직렬화 결과를 객체 단위로 cache 에 저장.
+    key 는 (model, pk, updated_date) 로, 수정되면 새 key 를 사용하므로 따로 삭제하지 않음.
+    목록은 CachedListSerializer 에서 get_many 로 한번에 조회하여 cache 에 없는 객체만 직렬화함.
+
+    다른 객체에 따라 값이 바뀌는 필드(작성자 username, 댓글 등)는 uncached_fields 에 지정하여
+    cache 하지 않고 매번 직렬화함.
+    """
+
+    uncached_fields: tuple[str, ...] = ()
+
+    def to_representation(self, instance):
+        return self.to_representations([instance])[0]
+
+    def to_representations(self, instances: list) -> list[dict]:
+        fields = list(self._readable_fields)
+        cached_fields, uncached_fields = [], []
+        for field in fields:
+            if field.field_name in self.uncached_fields:
+                uncached_fields.append(field)
+            else:
+                cached_fields.append(field)
+
+        keys = [
+            self.get_representation_cache_key(instance, cached_fields)
+            for instance in instances
+        ]
+        cached = cache.get_many([key for key in keys if key is not None])
+
+        missing = {}
+        representations = []
+        for instance, key in zip(instances, keys):
+            data = cached.get(key)
+            if data is None:
+                data = self.serialize_fields(instance, cached_fields)
+                if key is not None:
+                    missing[key] = data
+
+            data = {**data, **self.serialize_fields(instance, uncached_fields)}
+            representations.append(
+                {field.field_name: data[field.field_name] for field in fields}
+            )
+
+        if missing:
+            cache.set_many(missing, settings.REPRESENTATION_CACHE_TIMEOUT)
+
+        metrics.record_cache("representation", True, len(cached))
+        metrics.record_cache("representation", False, len(missing))
+        return representations
+
+    def get_representation_cache_key(self, instance, fields) -> str | None:
+        updated_date = getattr(instance, "updated_date", None)
+        if instance.pk is None or updated_date is None:  # 저장되지 않은 객체
+            return None
+
+        # 같은 model 이라도 직렬화하는 필드가 다르면 다른 key 를 사용
+        field_names = ",".join(f.field_name for f in fields)
+        digest = hashlib.md5(field_names.encode()).hexdigest()[:8]
+        label = instance._meta.label_lower
+        return (
+            f"representation:{label}:{digest}:{instance.pk}:{updated_date.timestamp()}"
+        )
+
+    @staticmethod
+    def serialize_fields(instance, fields) -> dict:
+        # Serializer.to_representation 과 같은 방식으로 지정한 필드만 직렬화
+        data = {}
+        for field in fields:
+            attribute = field.get_attribute(instance)
+            if isinstance(attribute, PKOnlyObject):
+                check_for_none = attribute.pk
+            else:
+                check_for_none = attribute
+
+            if check_for_none is None:
+                data[field.field_name] = None
+            else:
+                data[field.field_name] = field.to_representation(attribute)
+
+        return data
+
+
+class CachedListSerializer(serializers.ListSerializer):
+    """
+    RepresentationCacheMixin 을 사용하는 serializer 의 목록 직렬화 (Meta.list_serializer_class)
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        return self.child.to_representations(list(iterable))
+
+
+class SubRequestSerializer(serializers.Serializer):
+    method = serializers.ChoiceField(choices=["GET"], default="GET")
+    path = serializers.CharField(
+        help_text="API 경로와 query string (예: /api/v1/boards/posts/1)"
+    )
+
+    def validate_path(self, value: str) -> str:
+        if not value.startswith(settings.API_PATH_PREFIX):
+            raise serializers.ValidationError("API 경로만 요청할 수 있습니다.")
+
+        return value
+
+
+class SubResponseSerializer(serializers.Serializer):
+    path = serializers.CharField()
+    status = serializers.IntegerField()
+    body = serializers.JSONField()
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    requests = SubRequestSerializer(many=True, allow_empty=False)
+
+    def validate_requests(self, value: list) -> list:
+        if len(value) > settings.BATCH_MAX_REQUESTS:
+            raise serializers.ValidationError(
+                f"한번에 최대 {settings.BATCH_MAX_REQUESTS}개의 요청을 보낼 수 있습니다."
+            )
+
+        return value
+
+
+class BatchResponseSerializer(serializers.Serializer):
+    responses = SubResponseSerializer(many=True)
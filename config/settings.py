@@ -3,6 +3,7 @@ from pathlib import Path
 
 from celery.schedules import crontab
 from decouple import Csv, config
+from kombu import Queue
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -29,21 +30,61 @@ INSTALLED_APPS = [
     "django_celery_results",
     "drf_spectacular",
     # My-App
+    "config",  # management commands (config/management)
     "accounts",
     "boards",
 ]
 
 
 MIDDLEWARE = [
+    "config.middleware.MetricsMiddleware",
+    "config.middleware.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "config.middleware.APICompressionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "config.middleware.SingleFlightMiddleware",
+    "config.middleware.PathScopedMiddleware",
+    "config.middleware.QueryOriginMiddleware",
+]
+
+# API 요청을 제외한 admin, docs 요청에만 적용하는 middleware (config.middleware 참고)
+API_PATH_PREFIX = "/api/v1/"
+PATH_SCOPED_MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# API 응답 압축 (config.middleware.APICompressionMiddleware)
+API_COMPRESSION_MIN_SIZE = 1024  # byte
+API_COMPRESSION_CACHE_TIMEOUT = 60 * 10  # 압축된 응답을 cache 에 저장하는 시간(초)
+
+# 동시에 들어온 동일한 익명 GET API 요청을 하나로 처리 (config.middleware.SingleFlightMiddleware)
+SINGLE_FLIGHT_ENABLED = config("SINGLE_FLIGHT_ENABLED", default=True, cast=bool)
+SINGLE_FLIGHT_TIMEOUT = 5  # 먼저 들어온 요청의 처리 결과를 기다리는 시간(초)
+# cache lock 으로 여러 프로세스 사이에서도 합침 (redis, memcached 등 공유 cache 필요)
+SINGLE_FLIGHT_CACHE_LOCK = config("SINGLE_FLIGHT_CACHE_LOCK", default=False, cast=bool)
+SINGLE_FLIGHT_RESULT_TIMEOUT = 1  # 다른 프로세스와 공유하는 처리 결과를 cache 에 저장하는 시간(초)
+
+# 게시글, 댓글 직렬화 결과를 객체 단위로 cache 에 저장하는 시간(초) (config.serializers.RepresentationCacheMixin)
+REPRESENTATION_CACHE_TIMEOUT = config(
+    "REPRESENTATION_CACHE_TIMEOUT", default=60 * 60, cast=int
+)
+
+# /metrics 를 조회할 수 있는 IP (config.metrics)
+METRICS_ALLOWED_IPS = config("METRICS_ALLOWED_IPS", default="127.0.0.1", cast=Csv())
+
+# 요청 프로파일링 (config.profiling)
+PROFILING_ENABLED = config("PROFILING_ENABLED", default=False, cast=bool)
+PROFILING_SAMPLE_RATE = config("PROFILING_SAMPLE_RATE", default=0.0, cast=float)
+PROFILING_TOKEN_MAX_AGE = 60 * 60  # X-Profile-Token 유효 시간(초)
+PROFILING_SPOOL_DIR = config("PROFILING_SPOOL_DIR", default=str(BASE_DIR / "profiles"))
+
+# admin 에 필요한 middleware 는 PATH_SCOPED_MIDDLEWARE 에 포함되어 있음
+SILENCED_SYSTEM_CHECKS = ["admin.E408", "admin.E409", "admin.E410"]
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -71,6 +112,22 @@ DATABASES = {
     }
 }
 
+# 느린 쿼리 로그 기준 시간(초), 빈 값일 경우 사용하지 않음 (config.slow_queries)
+SLOW_QUERY_THRESHOLD = config(
+    "SLOW_QUERY_THRESHOLD", default="0.5", cast=lambda v: float(v) if v else None
+)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "config": {"handlers": ["console"], "level": "INFO"},
+    },
+}
+
 # 커스텀 유저 모델 {app_name}.{model_name}
 AUTH_USER_MODEL = "accounts.User"
 
@@ -115,6 +172,19 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 10,
 }
 
+# ?ids= 로 한번에 조회할 수 있는 최대 게시글, 댓글 수
+BOARDS_MULTI_GET_MAX_IDS = 100
+
+# Idempotency-Key 헤더가 있는 생성 요청의 응답 저장 (config.idempotency)
+# 응답을 보관하는 기간 (config.celery.purge_idempotency_keys)
+IDEMPOTENCY_KEY_TTL = timedelta(days=1)
+
+# batch API(/api/v1/batch)로 한번에 보낼 수 있는 최대 하위 요청 수 (config.views.BatchAPIView)
+BATCH_MAX_REQUESTS = 20
+
+# ASGI 로 배포할 경우 게시글 조회(GET) API 를 async view 로 처리
+BOARDS_ASYNC_READS = config("BOARDS_ASYNC_READS", default=False, cast=bool)
+
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),
@@ -131,8 +201,38 @@ CELERY_RESULT_BACKEND = config("CELERY_RESULT_BACKEND")
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_TASK_TRACK_STARTED = True
+# 기본 backend_cleanup 은 만료된 결과를 한번에 삭제하므로 사용하지 않고
+# purge_task_results 로 나누어 삭제함
+CELERY_RESULT_EXPIRES = None
+TASK_RESULT_RETENTION = timedelta(days=1)
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
+# celery queue
+# mail: SMTP I/O 위주의 짧은 task (높은 concurrency, prefetch)
+# maintenance: DB 를 오래 사용하는 정리 task (concurrency 1, prefetch 1, acks_late)
+# board_events: 쓰기마다 발행되는 outbox 처리 task (정리 task 뒤에서 대기하지 않도록 분리)
+# queue 별 worker 실행 옵션은 docker-compose.yml 의 celery-worker-* 참고
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_QUEUES = (
+    Queue("default"),
+    Queue("mail"),
+    Queue("maintenance"),
+    Queue("board_events"),
+)
+CELERY_TASK_ROUTES = {
+    "accounts.tasks.send_verification_mail": {"queue": "mail"},
+    "accounts.tasks.send_pending_verification_mails": {"queue": "mail"},
+    "accounts.tasks.clean_expiry_token": {"queue": "maintenance"},
+    "config.celery.purge_task_results": {"queue": "maintenance"},
+    "config.celery.purge_idempotency_keys": {"queue": "maintenance"},
+    "boards.tasks.purge_board_tombstones": {"queue": "maintenance"},
+    "boards.tasks.process_board_events": {"queue": "board_events"},
+}
+
+# task 발행 (config.publisher.BufferedTaskPublisher)
+TASK_PUBLISHER_FLUSH_INTERVAL = 0.05  # task 를 모아서 발행하는 간격(초)
+TASK_PUBLISHER_MAX_BATCH_SIZE = 100  # 한번에 발행하는 최대 task 수
+
 # celery scheduler (celery beat)
 CELERY_BEAT_SCHEDULE = {
     "clean_expiry_token": {
@@ -140,6 +240,31 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": crontab(minute="0", hour="*"),  # 매시간 정각 주기로 실행
         "args": (),
     },
+    "send_pending_verification_mails": {
+        "task": "accounts.tasks.send_pending_verification_mails",
+        "schedule": crontab(minute="*/5"),  # 5분 주기로 실행 (전송되지 않은 메일 처리)
+        "args": (),
+    },
+    "process_board_events": {
+        "task": "boards.tasks.process_board_events",
+        "schedule": crontab(minute="*"),  # 1분 주기로 실행 (처리되지 않은 이벤트 처리)
+        "args": (),
+    },
+    "purge_task_results": {
+        "task": "config.celery.purge_task_results",
+        "schedule": crontab(minute="30", hour="4"),  # 매일 04:30 에 실행
+        "args": (),
+    },
+    "purge_idempotency_keys": {
+        "task": "config.celery.purge_idempotency_keys",
+        "schedule": crontab(minute="45", hour="4"),  # 매일 04:45 에 실행
+        "args": (),
+    },
+    "purge_board_tombstones": {
+        "task": "boards.tasks.purge_board_tombstones",
+        "schedule": crontab(minute="0", hour="5"),  # 매일 05:00 에 실행
+        "args": (),
+    },
 }
 
 # 도메인
@@ -153,6 +278,51 @@ EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = True
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 
+# 인증 메일 batch 전송 (accounts.tasks.send_pending_verification_mails)
+VERIFICATION_MAIL_BATCH_SIZE = 50  # 한번에 전송하는 메일 수
+VERIFICATION_MAIL_CLAIM_TIMEOUT = timedelta(minutes=10)  # 전송 실패로 간주하는 시간
+
+# 게시글, 댓글 변경 이벤트 outbox (boards.events)
+BOARD_EVENT_BATCH_SIZE = 100  # 한번에 처리하는 이벤트 수
+BOARD_EVENT_CLAIM_TIMEOUT = timedelta(minutes=5)  # 처리 실패로 간주하는 시간
+BOARD_EVENT_HANDLERS = [
+    "boards.events.record_event_metrics",
+    "boards.events.publish_comment_events",
+]
+
+# 게시글 별 새 댓글 stream (boards.streams, SSE)
+# 여러 프로세스로 배포할 경우 broker 를 사용하는 boards.streams.KombuBackend 사용
+BOARD_STREAM_BACKEND = config(
+    "BOARD_STREAM_BACKEND", default="boards.streams.InMemoryBackend"
+)
+BOARD_STREAM_QUEUE_SIZE = 100  # 연결 별로 전달하지 못한 메시지를 보관하는 최대 수
+BOARD_STREAM_HEARTBEAT = 15  # keepalive 전송 간격(초)
+BOARD_STREAM_MAX_DURATION = 60 * 5  # 하나의 연결을 유지하는 최대 시간(초)
+BOARD_STREAM_RETRY = 3000  # client 재연결 대기 시간(ms)
+# 댓글 발행(KombuBackend) 재시도 정책 (kombu retry_policy, 최대 약 1초 대기)
+BOARD_STREAM_PUBLISH_RETRY_POLICY = {
+    "max_retries": 3,
+    "interval_start": 0,
+    "interval_step": 0.2,
+    "interval_max": 0.5,
+}
+
+# 게시글, 댓글 변경 피드 (boards.changes)
+BOARD_CHANGES_PAGE_SIZE = 100  # 한번에 반환하는 게시글, 댓글, 삭제 기록의 최대 수
+BOARD_CHANGES_SETTLE_TIME = timedelta(seconds=1)  # commit 이 늦은 변경을 놓치지 않기 위한 지연
+BOARD_TOMBSTONE_RETENTION = timedelta(days=30)  # 삭제 기록 보관 기간 (이전 token 은 만료)
+
+# 게시글, 댓글 내보내기에서 한번에 조회하는 row 수 (boards.exports)
+BOARD_EXPORT_BATCH_SIZE = 2000
+
+# 사용자 가져오기 (accounts.imports)
+USER_IMPORT_CHUNK_SIZE = 1000  # 하나의 transaction 에서 처리하는 row 수
+USER_IMPORT_BATCH_SIZE = 1000  # 한번의 INSERT 로 저장하는 row 수 (bulk_create)
+
+# 게시글, 댓글 가져오기 (boards.imports)
+BOARD_IMPORT_CHUNK_SIZE = 5000  # 하나의 transaction 에서 처리하는 row 수
+BOARD_IMPORT_BATCH_SIZE = 1000  # 한번의 INSERT 로 저장하는 row 수 (bulk_create)
+
 
 # spectacular
 SPECTACULAR_SETTINGS = {
@@ -171,3 +341,6 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
     "SWAGGER_UI_DIST": "//unpkg.com/swagger-ui-dist@3.38.0",
 }
+
+# 빌드 시점에 생성하는 OpenAPI schema 파일 경로 (entrypoint.sh 참고)
+OPENAPI_SCHEMA_DIR = BASE_DIR / "schema"
@@ -0,0 +1,95 @@
+"""
+동일한 요청의 동시 처리를 하나로 합치는 single-flight (config.middleware.SingleFlightMiddleware).
+
+같은 key 의 요청이 처리되는 동안 들어온 요청은 먼저 들어온 요청(leader)의 처리가 끝나기를 기다렸다가
+그 결과를 공유함. cache miss 시 같은 쿼리가 동시에 여러 번 실행되는 것(thundering herd)을 막음.
+"""
+
+import asyncio
+import threading
+from typing import NamedTuple
+
+from django.http import HttpResponse
+
+
+class ResponseSnapshot(NamedTuple):
+    """
+    여러 요청이 공유하는 응답 (요청마다 새로운 HttpResponse 로 복원하며, cache 에 저장할 수 있음)
+    """
+
+    status: int
+    headers: tuple
+    content: bytes
+
+    @classmethod
+    def from_response(cls, response) -> "ResponseSnapshot | None":
+        # streaming 응답, 쿠키를 설정하는 응답, 서버 오류는 공유하지 않음
+        if response.streaming or response.cookies or response.status_code >= 500:
+            return None
+
+        return cls(response.status_code, tuple(response.items()), response.content)
+
+    def to_response(self) -> HttpResponse:
+        response = HttpResponse(self.content, status=self.status)
+        for header, value in self.headers:
+            response[header] = value
+
+        return response
+
+
+class _Call:
+    def __init__(self, event):
+        self.event = event
+        self.result = None
+
+
+class SingleFlight:
+    """
+    key 별로 하나의 호출만 실행하고, 동시에 호출한 follower 들은 그 결과를 받음.
+    do / ado 는 (결과, leader 여부)를 반환하며, follower 는 timeout 이 지나거나
+    leader 가 실패한 경우 결과로 None 을 받음.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._async_calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn, timeout: float):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call(threading.Event())
+
+        if not is_leader:
+            call.event.wait(timeout)
+            return call.result, False
+
+        try:
+            call.result = fn()
+            return call.result, True
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def ado(self, key: str, fn, timeout: float):
+        # 하나의 event loop 안에서만 호출되므로 lock 이 필요하지 않음
+        call = self._async_calls.get(key)
+        is_leader = call is None
+
+        if not is_leader:
+            try:
+                await asyncio.wait_for(call.event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            return call.result, False
+
+        call = self._async_calls[key] = _Call(asyncio.Event())
+        try:
+            call.result = await fn()
+            return call.result, True
+        finally:
+            del self._async_calls[key]
+            call.event.set()
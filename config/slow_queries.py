@@ -0,0 +1,76 @@
+"""
+느린 쿼리 로그.
+
+모든 DB 연결에 execute wrapper 를 등록하여 settings.SLOW_QUERY_THRESHOLD(초) 보다 오래 걸린 쿼리를
+실행한 view 또는 task, 쿼리를 호출한 프로젝트 코드 위치와 함께 로그로 남김.
+"""
+
+import logging
+import sys
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# 호출 위치에서 제외할 파일
+IGNORED_FILES = (__file__, str(Path(__file__).with_name("middleware.py")))
+
+# 쿼리를 실행한 view(view:<url name>) 또는 task(task:<task name>)
+query_origin: ContextVar[str | None] = ContextVar("query_origin", default=None)
+
+
+def get_caller() -> str | None:
+    """
+    쿼리를 호출한 가장 안쪽의 프로젝트 코드 위치를 반환
+    (Django, DRF 등 라이브러리 코드와 모든 요청을 거치는 middleware 는 제외)
+    """
+
+    base_dir = str(settings.BASE_DIR)
+    frame = sys._getframe(1)
+
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(base_dir)
+            and filename not in IGNORED_FILES
+            and "site-packages" not in filename
+        ):
+            path = Path(filename).relative_to(base_dir)
+            return f"{path}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+        frame = frame.f_back
+
+    return None
+
+
+def log_slow_query(execute, sql, params, many, context):
+    started = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        threshold = settings.SLOW_QUERY_THRESHOLD
+
+        if threshold is not None and duration >= threshold:
+            logger.warning(
+                "slow query %.3fs origin=%s caller=%s params=%d sql=%s",
+                duration,
+                query_origin.get(),
+                get_caller(),
+                len(params or ()),
+                sql,
+            )
+
+
+def install_slow_query_logger(sender, connection, **kwargs):
+    """
+    connection_created signal 로 새로 생성된 DB 연결에 execute wrapper 를 등록
+    """
+
+    if settings.SLOW_QUERY_THRESHOLD is not None:
+        if log_slow_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(log_slow_query)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import (
@@ -7,14 +8,32 @@ from drf_spectacular.views import (
     SpectacularYAMLAPIView,
 )
 
+from config.metrics import metrics_view
+from config.views import BatchAPIView, PrecomputedSchemaView
+
 api_urlpatterns = [
     path("accounts/", include("accounts.urls")),
     path("boards/", include("boards.urls")),
+    path("batch", BatchAPIView.as_view(), name="batch"),
 ]
 
+# DEBUG 일 경우에만 요청마다 schema 를 생성하고, 그 외에는 미리 생성된 파일을 제공
+if settings.DEBUG:
+    schema_json_view = SpectacularJSONAPIView.as_view()
+    schema_yaml_view = SpectacularYAMLAPIView.as_view()
+else:
+    schema_json_view = PrecomputedSchemaView.as_view(
+        schema_file=settings.OPENAPI_SCHEMA_DIR / "openapi.json",
+        content_type="application/vnd.oai.openapi+json",
+    )
+    schema_yaml_view = PrecomputedSchemaView.as_view(
+        schema_file=settings.OPENAPI_SCHEMA_DIR / "openapi.yaml",
+        content_type="application/vnd.oai.openapi",
+    )
+
 docs_urlpatterns = [
-    path("json/", SpectacularJSONAPIView.as_view(), name="schema-json"),
-    path("yaml/", SpectacularYAMLAPIView.as_view(), name="swagger-yaml"),
+    path("json/", schema_json_view, name="schema-json"),
+    path("yaml/", schema_yaml_view, name="swagger-yaml"),
     path(
         "swagger/",
         SpectacularSwaggerView.as_view(url_name="schema-json"),
@@ -31,4 +50,5 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/", include(api_urlpatterns)),
     path("docs/", include(docs_urlpatterns)),
+    path("metrics", metrics_view, name="metrics"),
 ]
@@ -0,0 +1,148 @@
+import copy
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+from django.http import Http404, HttpResponse, QueryDict
+from django.urls import Resolver404, resolve
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+from django.views import View
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from config.serializers import BatchRequestSerializer, BatchResponseSerializer
+
+
+class SchemaFile(NamedTuple):
+    content: bytes
+    etag: str
+
+
+@lru_cache(maxsize=None)
+def load_schema_file(path: Path) -> SchemaFile:
+    """
+    빌드 시점에 생성된 schema 파일을 읽어 ETag 와 함께 프로세스 메모리에 저장
+    """
+
+    try:
+        content = Path(path).read_bytes()
+    except FileNotFoundError:
+        # 예외는 캐시되지 않으므로 schema 파일 생성 후에는 정상적으로 읽음
+        raise Http404("OpenAPI schema 파일이 생성되지 않았습니다.")
+
+    return SchemaFile(content, quote_etag(hashlib.sha256(content).hexdigest()))
+
+
+class PrecomputedSchemaView(View):
+    """
+    `manage.py spectacular --file` 로 미리 생성한 OpenAPI schema 파일을 제공하는 view.
+    매 요청마다 view, serializer 를 분석하지 않고 메모리에 저장된 schema 를 반환함.
+    """
+
+    schema_file = None
+    content_type = None
+
+    def get(self, request, *args, **kwargs):
+        schema = load_schema_file(self.schema_file)
+
+        # If-None-Match 가 일치할 경우 304 Not Modified 응답
+        response = get_conditional_response(request, etag=schema.etag)
+        if response is None:
+            response = HttpResponse(schema.content, content_type=self.content_type)
+
+        response.headers["ETag"] = schema.etag
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
+
+
+@extend_schema(
+    tags=["batch"],
+    request=BatchRequestSerializer,
+    responses=BatchResponseSerializer,
+)
+class BatchAPIView(APIView):
+    """
+    여러 조회(GET) API 요청을 한번의 요청으로 처리하는 API.
+
+    인증(JWT 검증, 사용자 조회)은 batch 요청에서 한번만 수행하고 하위 요청에 그대로 전달함.
+    하위 요청은 DRF view 를 직접 호출하므로 middleware 를 거치지 않으며,
+    각 하위 요청의 권한 검사는 해당 view 에서 수행함.
+    """
+
+    permission_classes = [AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        serializer = BatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        responses = [
+            self.dispatch_sub_request(request, sub_request["path"])
+            for sub_request in serializer.validated_data["requests"]
+        ]
+        return Response({"responses": responses})
+
+    def dispatch_sub_request(self, request, path: str) -> dict:
+        url = urlsplit(path)
+
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            return self.error(path, status.HTTP_404_NOT_FOUND, "Not found.")
+
+        # DRF view 만 지원 (async_read_view 로 감싼 view 도 원래의 DRF view 로 호출)
+        view_class = getattr(match.func, "cls", None)
+        if view_class is None or view_class is BatchAPIView:
+            return self.error(
+                path, status.HTTP_400_BAD_REQUEST, "batch 로 요청할 수 없는 API 입니다."
+            )
+
+        sub_request = copy.copy(request._request)
+        sub_request.method = "GET"
+        sub_request.path = sub_request.path_info = url.path
+        sub_request.META = {
+            **request.META,
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": url.path,
+            "QUERY_STRING": url.query,
+            "HTTP_ACCEPT": "application/json",
+        }
+        sub_request.GET = QueryDict(url.query)
+        sub_request.resolver_match = match
+
+        if request.user.is_authenticated:
+            # batch 요청에서 인증한 사용자를 그대로 사용 (DRF ForcedAuthentication)
+            sub_request._force_auth_user = request.user
+            sub_request._force_auth_token = request.auth
+        else:
+            # 인증 정보를 제거하여 토큰 검증 없이 익명 사용자로 처리 (401 응답은 그대로 유지)
+            sub_request.COOKIES = {
+                name: value
+                for name, value in request.COOKIES.items()
+                if name != "access"
+            }
+            sub_request.META.pop("HTTP_AUTHORIZATION", None)
+
+        view = view_class.as_view(**match.func.initkwargs)
+        response = view(sub_request, *match.args, **match.kwargs)
+
+        if response.streaming:
+            return self.error(
+                path, status.HTTP_400_BAD_REQUEST, "batch 로 요청할 수 없는 API 입니다."
+            )
+
+        response.render()
+        return {
+            "path": path,
+            "status": response.status_code,
+            "body": json.loads(response.content) if response.content else None,
+        }
+
+    def error(self, path: str, status_code: int, detail: str) -> dict:
+        return {"path": path, "status": status_code, "body": {"detail": detail}}
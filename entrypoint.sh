@@ -5,4 +5,17 @@ python3 manage.py migrate
 
 echo 'Finish migrations'
 
+echo 'Generate OpenAPI schema !'
+mkdir -p schema
+python3 manage.py spectacular --format openapi-json --file schema/openapi.json
+python3 manage.py spectacular --format openapi --file schema/openapi.yaml
+
+echo 'Finish OpenAPI schema'
+
+# prometheus_client multiprocess 모드의 이전 실행 기록 삭제
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 exec "$@"
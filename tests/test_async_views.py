@@ -0,0 +1,235 @@
+import asyncio
+from unittest.mock import patch
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import path
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+from boards.views import (
+    PostDetailAPIView,
+    PostListCreateAPIView,
+    async_read_view,
+    post_detail_async_view,
+    post_list_async_view,
+)
+from tests.utils import JWTSetupMixin
+
+BASE_API_URL = "/api/v1/boards"
+
+# BOARDS_ASYNC_READS 설정과 관계없이 async view 를 테스트하기 위한 urlconf
+urlpatterns = [
+    path(
+        "api/v1/boards/posts",
+        async_read_view(post_list_async_view, PostListCreateAPIView.as_view()),
+    ),
+    path(
+        "api/v1/boards/posts/<int:pk>",
+        async_read_view(post_detail_async_view, PostDetailAPIView.as_view()),
+    ),
+]
+
+
+# async posts list test case (READ)
+@override_settings(ROOT_URLCONF="tests.test_async_views")
+class AsyncPostListTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        # 15 dummy posts
+        for i in range(15):
+            PostModel.objects.create(
+                title="dummy-title", contents="dummy-contents", owner=cls.user
+            )
+
+        CommentModel.objects.create(
+            owner=cls.user, post=PostModel.objects.first(), contents="comments"
+        )
+
+    async def test_async_post_list_success(self):
+        """
+        case: async view 로 게시글들의 정보 요청할 경우
+
+        1. 200 Ok 응답.
+        2. 최근 게시글 10개의 정보와 댓글 수(comments)를 반환.
+        3. 다음 페이지의 커서 파라미터를 next에 포함.
+        """
+
+        response = await self.async_client.get(path=f"{BASE_API_URL}/posts")
+
+        posts_list = response.json()["results"]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(posts_list), 10)
+        self.assertEqual(posts_list[0]["owner"], self.user.username)
+        self.assertEqual(posts_list[0]["comments"], 1)
+        self.assertIn("?cursor", response.json()["next"])
+
+    async def test_async_post_multi_get(self):
+        """
+        case: async view 로 ids 파라미터와 함께 여러 게시글의 정보를 요청할 경우
+
+        1. 요청한 id 순서대로 반환하고, 존재하지 않는 id 는 제외.
+        """
+
+        ids = [post.id async for post in PostModel.objects.all()[:2]]
+        response = await self.async_client.get(
+            path=f"{BASE_API_URL}/posts", data={"ids": f"{ids[1]},99999,{ids[0]}"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([post["id"] for post in response.json()], [ids[1], ids[0]])
+
+    async def test_async_post_list_matches_sync(self):
+        """
+        case: 다음 페이지 커서로 요청할 경우
+
+        1. sync view 와 동일한 게시글들을 반환.
+        """
+
+        first_page = await self.async_client.get(path=f"{BASE_API_URL}/posts")
+        response = await self.async_client.get(path=first_page.json()["next"])
+
+        posts_list = response.json()["results"]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(posts_list), 5)
+        self.assertIsNone(response.json()["next"])
+        self.assertIn("?cursor", response.json()["previous"])
+
+    async def test_async_post_list_with_invalid_cursor(self):
+        """
+        case: 유효하지 않은 커서로 게시글들의 정보 요청할 경우
+
+        1. 404 Not Found 응답.
+        """
+
+        response = await self.async_client.get(
+            path=f"{BASE_API_URL}/posts?cursor=123A2B3d"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    async def test_async_post_list_with_invalid_header_token(self):
+        """
+        case: 유효하지 않은 Authorization header 로 요청할 경우
+
+        1. 401 Unauthorized 응답 (sync view 와 동일).
+        """
+
+        response = await self.async_client.get(
+            path=f"{BASE_API_URL}/posts", headers={"Authorization": "Bearer invalid"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+# async posts retrieve/create test case
+@override_settings(ROOT_URLCONF="tests.test_async_views")
+class AsyncPostDetailTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+
+        # 5 comments
+        for i in range(5):
+            CommentModel.objects.create(
+                owner=cls.user, post=cls.user_post, contents="comments"
+            )
+
+    async def test_async_retrieve_post_success(self):
+        """
+        case: async view 로 특정 게시글의 세부 정보를 요청할 경우
+
+        1. 200 Ok 응답.
+        2. sync view 와 동일한 데이터, ETag(version) 헤더를 반환.
+        """
+
+        # 토큰 발급시 OutstandingToken 이 저장되므로 sync 로 실행
+        await sync_to_async(self.api_authentication)(self.async_client, self.user)
+
+        response = await self.async_client.get(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}"
+        )
+
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(data["owner"], self.user.username)
+        self.assertEqual(len(data["comments"]), 5)
+        self.assertEqual(data["comments"][0]["post"], self.user_post.pk)
+        self.assertEqual(response["ETag"], '"1"')
+
+    async def test_async_retrieve_post_reads_cache_outside_event_loop(self):
+        """
+        case: async view 에서 직렬화 결과 cache 를 조회할 경우
+
+        1. sync cache API 는 event loop 가 아닌 thread 에서 호출.
+        """
+
+        calls = []
+        get_many = cache.get_many
+
+        def record_get_many(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                calls.append("event loop")
+            except RuntimeError:
+                calls.append("thread")
+            return get_many(*args, **kwargs)
+
+        with patch.object(cache, "get_many", side_effect=record_get_many):
+            response = await self.async_client.get(
+                path=f"{BASE_API_URL}/posts/{self.user_post.pk}"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(calls)
+        self.assertEqual(set(calls), {"thread"})
+
+    async def test_async_retrieve_nonexistent_post(self):
+        """
+        case: 존재하지 않는 게시글의 세부 정보를 요청할 경우
+
+        1. 404 Not Found 응답.
+        """
+
+        response = await self.async_client.get(path=f"{BASE_API_URL}/posts/99999")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json()["detail"], "찾을 수 없습니다.")
+
+    def test_write_request_is_handled_by_sync_view(self):
+        """
+        case: GET 이외의 요청을 보낼 경우
+
+        1. 기존 DRF view 로 전달되어 201 Created 응답.
+        """
+
+        self.api_authentication(self.client, self.user)
+
+        response = self.client.post(
+            path=f"{BASE_API_URL}/posts",
+            data={"title": "게시글 제목", "contents": "게시글 내용"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["owner"], self.user.username)
@@ -0,0 +1,137 @@
+from unittest import mock
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.authentication import JWTCookieAuthentication
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+from tests.utils import JWTSetupMixin
+
+BATCH_URL = "/api/v1/batch"
+
+
+# batch API test case
+class BatchTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+        cls.user_comment = CommentModel.objects.create(
+            contents="contents", owner=cls.user, post=cls.user_post
+        )
+
+    def batch(self, *paths):
+        return self.client.post(
+            BATCH_URL,
+            data={"requests": [{"method": "GET", "path": path} for path in paths]},
+            format="json",
+        )
+
+    def test_batch_read_requests(self):
+        """
+        case: 여러 조회 요청을 batch 로 요청할 경우
+
+        1. 200 Ok 응답.
+        2. 요청 순서대로 각 요청의 상태 코드와 응답을 반환.
+        """
+
+        response = self.batch(
+            f"/api/v1/boards/posts/{self.user_post.id}",
+            f"/api/v1/boards/comments?ids={self.user_comment.id}",
+            "/api/v1/boards/posts/99999",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        post, comments, missing = response.data["responses"]
+        self.assertEqual(post["status"], status.HTTP_200_OK)
+        self.assertEqual(post["body"]["title"], "title")
+        self.assertEqual(comments["body"][0]["id"], self.user_comment.id)
+        self.assertEqual(missing["status"], status.HTTP_404_NOT_FOUND)
+
+    def test_authenticate_once(self):
+        """
+        case: 인증된 사용자가 batch 로 요청할 경우
+
+        1. JWT 검증과 사용자 조회는 한번만 수행.
+        2. 하위 요청은 batch 요청의 사용자로 인증.
+        """
+
+        self.api_authentication(self.client, self.user)
+
+        with mock.patch.object(
+            JWTCookieAuthentication,
+            "get_validated_token",
+            autospec=True,
+            side_effect=JWTCookieAuthentication.get_validated_token,
+        ) as get_validated_token:
+            response = self.batch(
+                "/api/v1/accounts/users",
+                f"/api/v1/boards/posts/{self.user_post.id}",
+                f"/api/v1/boards/comments/{self.user_comment.id}",
+            )
+
+        self.assertEqual(get_validated_token.call_count, 1)
+
+        user = response.data["responses"][0]
+        self.assertEqual(user["status"], status.HTTP_200_OK)
+        self.assertEqual(user["body"]["username"], self.user.username)
+
+    def test_anonymous_sub_request_permission(self):
+        """
+        case: 인증되지 않은 사용자가 인증이 필요한 API 를 batch 로 요청할 경우
+
+        1. 해당 하위 요청만 401 Unauthorized 응답.
+        """
+
+        response = self.batch(
+            "/api/v1/accounts/users", f"/api/v1/boards/posts/{self.user_post.id}"
+        )
+
+        user, post = response.data["responses"]
+        self.assertEqual(user["status"], status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(post["status"], status.HTTP_200_OK)
+
+    def test_invalid_batch_requests(self):
+        """
+        case: GET 이 아닌 요청, API 가 아닌 경로, 빈 요청 목록일 경우
+
+        1. 400 Bad Request 응답.
+        """
+
+        response = self.client.post(
+            BATCH_URL,
+            data={"requests": [{"method": "POST", "path": "/api/v1/boards/posts"}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.batch("/admin/")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.batch()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unsupported_sub_request(self):
+        """
+        case: batch 로 처리할 수 없는 API(batch, SSE stream)를 요청할 경우
+
+        1. 해당 하위 요청만 400 Bad Request 응답.
+        """
+
+        response = self.batch(
+            BATCH_URL, f"/api/v1/boards/posts/{self.user_post.id}/comments/stream"
+        )
+
+        for sub_response in response.data["responses"]:
+            self.assertEqual(sub_response["status"], status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,266 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import BoardEvent, CommentModel, PostModel
+from boards.streams import CommentStreamHub, InMemoryBackend
+from boards.tasks import process_board_events
+from tests.utils import JWTSetupMixin
+
+BASE_API_URL = "/api/v1/boards"
+
+handled_events = []
+
+
+# process_board_events 가 handler 에 전달한 이벤트를 기록하는 test handler
+def collect_events(post_id, events):
+    handled_events.append((post_id, [(e.model, e.action) for e in events]))
+
+
+def failing_handler(post_id, events):
+    raise RuntimeError("handler failed")
+
+
+# 여러 프로세스에 전달하는 backend (KombuBackend) 를 대신하는 test backend
+class RemoteBackend(InMemoryBackend):
+    in_process = False
+
+    def __init__(self):
+        super().__init__()
+        self.published = []
+
+    def publish(self, channel, message):
+        self.published.append((channel, message["id"]))
+
+
+# 게시글, 댓글 변경 이벤트 outbox test case
+class BoardEventTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+
+    def setUp(self):
+        handled_events.clear()
+        self.api_authentication(self.client, self.user)
+
+    def get_events(self) -> list[tuple]:
+        return list(
+            BoardEvent.objects.order_by("id").values_list(
+                "post_id", "model", "object_id", "action"
+            )
+        )
+
+    @mock.patch("boards.events.task_publisher.publish")
+    def test_record_events(self, publish):
+        """
+        case: 게시글, 댓글을 생성, 수정, 삭제할 경우
+
+        1. 변경과 같은 transaction 에서 이벤트를 outbox 에 저장.
+        2. commit 이후 이벤트 처리 task 를 발행.
+        """
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                path=f"{BASE_API_URL}/comments",
+                data={"post": self.user_post.id, "contents": "contents"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        comment_id = response.data["id"]
+
+        self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.id}",
+            data={"title": "new title"},
+            format="json",
+        )
+        self.client.delete(path=f"{BASE_API_URL}/comments/{comment_id}")
+
+        post_id = self.user_post.id
+        self.assertEqual(
+            self.get_events(),
+            [
+                (post_id, "comment", comment_id, "created"),
+                (post_id, "post", post_id, "updated"),
+                (post_id, "comment", comment_id, "deleted"),
+            ],
+        )
+        publish.assert_called_once_with(process_board_events, coalesce=True)
+
+    def test_no_event_on_noop_update(self):
+        """
+        case: 기존과 같은 내용으로 게시글을 수정하는 경우
+
+        1. 이벤트를 저장하지 않음.
+        """
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.id}",
+            data={"title": "title"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_events(), [])
+
+    def test_no_event_on_failed_write(self):
+        """
+        case: 유효하지 않은 요청으로 변경되지 않은 경우
+
+        1. 이벤트를 저장하지 않음.
+        """
+
+        response = self.client.post(
+            path=f"{BASE_API_URL}/posts", data={"title": ""}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.get_events(), [])
+
+    @override_settings(BOARD_EVENT_HANDLERS=["tests.test_board_events.collect_events"])
+    def test_process_events_in_order_per_post(self):
+        """
+        case: 이벤트 처리 task 를 실행할 경우
+
+        1. 게시글 별로 이벤트를 생성 순서대로 handler 에 전달.
+        2. 처리한 이벤트는 삭제.
+        """
+
+        other_post = PostModel.objects.create(
+            title="other", contents="contents", owner=self.user
+        )
+        comment = CommentModel.objects.create(
+            contents="contents", owner=self.user, post=self.user_post
+        )
+
+        BoardEvent.objects.bulk_create(
+            [
+                BoardEvent(
+                    post_id=self.user_post.id,
+                    model="post",
+                    object_id=self.user_post.id,
+                    action="created",
+                ),
+                BoardEvent(
+                    post_id=other_post.id,
+                    model="post",
+                    object_id=other_post.id,
+                    action="created",
+                ),
+                BoardEvent(
+                    post_id=self.user_post.id,
+                    model="comment",
+                    object_id=comment.id,
+                    action="created",
+                ),
+                BoardEvent(
+                    post_id=self.user_post.id,
+                    model="post",
+                    object_id=self.user_post.id,
+                    action="deleted",
+                ),
+            ]
+        )
+
+        processed = process_board_events.apply(kwargs={"batch_size": 3}).get()
+
+        self.assertEqual(processed, 4)
+        self.assertEqual(BoardEvent.objects.count(), 0)
+
+        events_by_post = {}
+        for post_id, events in handled_events:
+            events_by_post.setdefault(post_id, []).extend(events)
+
+        self.assertEqual(
+            events_by_post[self.user_post.id],
+            [("post", "created"), ("comment", "created"), ("post", "deleted")],
+        )
+        self.assertEqual(events_by_post[other_post.id], [("post", "created")])
+
+    def test_claim_skips_post_in_progress(self):
+        """
+        case: 다른 worker 가 게시글의 이벤트를 처리중인 경우
+
+        1. 처리 순서를 지키기 위해 해당 게시글의 이벤트는 선점하지 않음.
+        2. 선점 시간이 만료된 경우 다시 선점 가능.
+        """
+
+        timeout = timedelta(minutes=5)
+        for action in ("created", "updated"):
+            BoardEvent.objects.create(
+                post_id=self.user_post.id,
+                model="post",
+                object_id=self.user_post.id,
+                action=action,
+            )
+
+        first = BoardEvent.objects.claim(1, timeout)
+        self.assertEqual([event.action for event in first], ["created"])
+        self.assertEqual(BoardEvent.objects.claim(10, timeout), [])
+
+        self.assertEqual(len(BoardEvent.objects.claim(10, timedelta(0))), 2)
+
+    @override_settings(BOARD_EVENT_HANDLERS=["tests.test_board_events.failing_handler"])
+    def test_release_events_on_failure(self):
+        """
+        case: handler 에서 오류가 발생한 경우
+
+        1. 이벤트를 삭제하지 않고 선점을 해제.
+        """
+
+        BoardEvent.objects.create(
+            post_id=self.user_post.id,
+            model="post",
+            object_id=self.user_post.id,
+            action="created",
+        )
+
+        with mock.patch.object(process_board_events, "retry", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                process_board_events.run()
+
+        event = BoardEvent.objects.get()
+        self.assertIsNone(event.claim_token)
+
+    @mock.patch("boards.events.task_publisher.publish")
+    @override_settings(
+        BOARD_STREAM_BACKEND="tests.test_board_events.RemoteBackend",
+        BOARD_EVENT_HANDLERS=["boards.events.publish_comment_events"],
+    )
+    def test_publish_comments_from_outbox(self, publish):
+        """
+        case: 여러 프로세스에 전달하는 댓글 stream backend 를 사용할 경우
+
+        1. 댓글 생성 요청에서는 발행하지 않음.
+        2. 이벤트 처리 task 에서 새 댓글을 게시글의 channel 로 발행.
+        """
+
+        hub = CommentStreamHub()
+        with mock.patch("boards.signals.comment_hub", hub), mock.patch(
+            "boards.events.comment_hub", hub
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    path=f"{BASE_API_URL}/comments",
+                    data={"post": self.user_post.id, "contents": "contents"},
+                    format="json",
+                )
+            self.assertEqual(hub.backend.published, [])
+
+            process_board_events.apply()
+
+        self.assertEqual(
+            hub.backend.published,
+            [(f"comments.{self.user_post.id}", response.data["id"])],
+        )
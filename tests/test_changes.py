@@ -0,0 +1,178 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.changes import encode_token
+from boards.models import BoardTombstone, CommentModel, PostModel
+from boards.tasks import purge_board_tombstones
+
+BASE_API_URL = "/api/v1/boards"
+
+
+# 게시글, 댓글 변경 피드 test case
+@override_settings(BOARD_CHANGES_SETTLE_TIME=timedelta(0))
+class BoardChangesTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+        cls.comment = CommentModel.objects.create(
+            contents="contents", owner=cls.user, post=cls.user_post
+        )
+
+    def get_changes(self, since=None):
+        params = {"since": since} if since else {}
+        return self.client.get(f"{BASE_API_URL}/changes", params)
+
+    def test_initial_sync(self):
+        """
+        case: since 없이 조회할 경우
+
+        1. 처음부터 모든 게시글, 댓글을 반환.
+        2. 다음 조회에 사용할 next token 을 반환.
+        """
+
+        response = self.get_changes()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p["id"] for p in response.data["posts"]], [self.user_post.id])
+        self.assertEqual(
+            [c["id"] for c in response.data["comments"]], [self.comment.id]
+        )
+        self.assertEqual(response.data["deleted"], [])
+        self.assertFalse(response.data["has_more"])
+        self.assertTrue(response.data["next"])
+
+    def test_changes_since_token(self):
+        """
+        case: 이전 응답의 next token 으로 조회할 경우
+
+        1. 이후 생성, 수정된 게시글과 댓글만 반환.
+        2. 삭제된 게시글, 댓글은 deleted 로 반환.
+        3. 게시글 삭제로 함께 삭제된 댓글은 게시글의 삭제 기록만 반환.
+        """
+
+        since = self.get_changes().data["next"]
+
+        new_post = PostModel.objects.create(
+            title="new", contents="contents", owner=self.user
+        )
+        new_comment = CommentModel.objects.create(
+            contents="new", owner=self.user, post=new_post
+        )
+        self.comment.contents = "updated"
+        self.comment.save()
+
+        post_id, new_comment_id = self.user_post.id, new_comment.id
+        self.user_post.delete()  # self.comment 도 함께 삭제
+        new_comment.delete()
+
+        response = self.get_changes(since)
+
+        self.assertEqual([p["id"] for p in response.data["posts"]], [new_post.id])
+        self.assertEqual([c["id"] for c in response.data["comments"]], [])
+        self.assertEqual(
+            [(d["model"], d["id"], d["post"]) for d in response.data["deleted"]],
+            [
+                ("post", post_id, post_id),
+                ("comment", new_comment_id, new_post.id),
+            ],
+        )
+
+        # 변경이 없으면 빈 결과 반환
+        response = self.get_changes(response.data["next"])
+        self.assertEqual(response.data["posts"], [])
+        self.assertEqual(response.data["deleted"], [])
+
+    @override_settings(BOARD_CHANGES_PAGE_SIZE=2)
+    def test_has_more(self):
+        """
+        case: 변경이 한번에 반환하는 수보다 많을 경우
+
+        1. has_more 를 반환하고, next token 으로 나머지 변경을 조회.
+        """
+
+        for i in range(3):
+            PostModel.objects.create(title=f"{i}", contents="contents", owner=self.user)
+
+        first = self.get_changes()
+        self.assertTrue(first.data["has_more"])
+        self.assertEqual(len(first.data["posts"]), 2)
+
+        second = self.get_changes(first.data["next"])
+        self.assertFalse(second.data["has_more"])
+        self.assertEqual(len(second.data["posts"]), 2)
+
+        ids = [p["id"] for p in first.data["posts"] + second.data["posts"]]
+        self.assertEqual(len(set(ids)), 4)
+
+    def test_settle_time(self):
+        """
+        case: commit 지연 시간(BOARD_CHANGES_SETTLE_TIME)이 지나지 않은 변경일 경우
+
+        1. 다음 조회에서 반환.
+        """
+
+        with override_settings(BOARD_CHANGES_SETTLE_TIME=timedelta(minutes=1)):
+            response = self.get_changes()
+
+        self.assertEqual(response.data["posts"], [])
+
+        response = self.get_changes(response.data["next"])
+        self.assertEqual(len(response.data["posts"]), 1)
+
+    def test_invalid_token(self):
+        """
+        case: 유효하지 않은 token 으로 조회할 경우
+
+        1. 400 Bad Request 응답.
+        """
+
+        response = self.get_changes("invalid")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_expired_token(self):
+        """
+        case: 삭제 기록 보관 기간보다 오래된 token 으로 조회할 경우
+
+        1. 410 Gone 응답 (전체 동기화 필요).
+        """
+
+        issued = timezone.now() - timedelta(days=31)
+        response = self.get_changes(encode_token({"issued": issued.isoformat()}))
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_purge_tombstones(self):
+        """
+        case: 보관 기간이 지난 삭제 기록이 있는 경우
+
+        1. 삭제 기록 정리 task 에서 삭제.
+        """
+
+        comment_id = self.comment.id
+        self.comment.delete()
+        old = timezone.now() - timedelta(days=31)
+        with mock.patch("django.utils.timezone.now", return_value=old):
+            CommentModel.objects.create(
+                contents="old", owner=self.user, post=self.user_post
+            ).delete()
+
+        self.assertEqual(purge_board_tombstones.apply().get(), 1)
+        self.assertEqual(
+            list(BoardTombstone.objects.values_list("object_id", flat=True)),
+            [comment_id],
+        )
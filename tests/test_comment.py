@@ -193,6 +193,42 @@ class CommentRetrieveTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data["detail"], "찾을 수 없습니다.")
 
+    def test_comment_multi_get(self):
+        """
+        case: ids 파라미터로 여러 댓글의 정보를 요청할 경우
+
+        1. 200 Ok 응답.
+        2. 요청한 id 순서대로 반환하고, 존재하지 않는 id 는 제외.
+        3. 하나의 쿼리로 작성자와 함께 조회.
+        """
+
+        other_comment = CommentModel.objects.create(
+            contents="other", owner=self.user, post=self.user_post
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                path=f"{BASE_API_URL}/comments",
+                data={"ids": f"{other_comment.pk},{self.user_comment.pk},99999"},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [comment["id"] for comment in response.data],
+            [other_comment.pk, self.user_comment.pk],
+        )
+        self.assertEqual(response.data[0]["owner"], self.user.username)
+
+    def test_comment_multi_get_without_ids(self):
+        """
+        case: ids 파라미터 없이 댓글 목록을 요청할 경우
+
+        1. 400 Bad Request 응답.
+        """
+
+        response = self.client.get(path=f"{BASE_API_URL}/comments")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 # Comments update test case (UPDATE)
 class CommentModifyTestCase(APITestCase, JWTSetupMixin):
@@ -0,0 +1,169 @@
+import gzip
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+from config.middleware import APICompressionMiddleware, parse_accept_encoding
+from tests.utils import JWTSetupMixin
+
+BASE_API_URL = "/api/v1/boards"
+
+
+# API response compression test case
+class APICompressionTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+
+        # 50 comments
+        for i in range(50):
+            CommentModel.objects.create(
+                owner=cls.user, post=cls.user_post, contents="comments"
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_compress_large_response(self):
+        """
+        case: gzip 을 허용하고 큰 응답을 요청할 경우
+
+        1. 200 Ok 응답.
+        2. gzip 으로 압축된 응답과 Vary: Accept-Encoding 을 반환.
+        """
+
+        response = self.client.get(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+            HTTP_ACCEPT_ENCODING="gzip, deflate",
+        )
+
+        data = json.loads(gzip.decompress(response.content))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(len(data["comments"]), 50)
+
+    def test_response_without_accept_encoding(self):
+        """
+        case: Accept-Encoding 없이 요청할 경우
+
+        1. 압축되지 않은 응답과 Vary: Accept-Encoding 을 반환.
+        """
+
+        response = self.client.get(path=f"{BASE_API_URL}/posts/{self.user_post.pk}")
+
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(len(response.json()["comments"]), 50)
+
+    def test_small_response_is_not_compressed(self):
+        """
+        case: API_COMPRESSION_MIN_SIZE 보다 작은 응답을 요청할 경우
+
+        1. 압축하지 않음.
+        """
+
+        response = self.client.get(
+            path=f"{BASE_API_URL}/posts/99999", HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_compressed_content_is_cached(self):
+        """
+        case: 같은 응답을 여러번 요청할 경우
+
+        1. 처음 한번만 압축하고, 이후에는 cache 에 저장된 압축 결과를 반환.
+        """
+
+        with patch.object(
+            APICompressionMiddleware,
+            "compress",
+            autospec=True,
+            side_effect=APICompressionMiddleware.compress,
+        ) as mock_compress:
+            for _ in range(3):
+                response = self.client.get(
+                    path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+                    HTTP_ACCEPT_ENCODING="gzip",
+                )
+                self.assertEqual(response.headers["Content-Encoding"], "gzip")
+
+        self.assertEqual(mock_compress.call_count, 1)
+
+    def test_parse_accept_encoding(self):
+        """
+        case: Accept-Encoding header 에 q 값이 포함된 경우
+
+        1. q=0 인 encoding 은 제외.
+        """
+
+        accepted = parse_accept_encoding("gzip;q=0, zstd, br;q=0.5")
+        self.assertEqual(accepted, {"zstd", "br"})
+
+    def test_authenticated_response_is_not_cached(self):
+        """
+        case: 인증된 요청의 응답을 압축할 경우
+
+        1. 사용자 별로 다른 응답이므로 압축 결과를 cache 에서 조회, 저장하지 않음.
+        """
+
+        self.api_authentication(self.client, self.user)
+
+        with patch("config.middleware.cache") as mock_cache:
+            response = self.client.get(
+                path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+                HTTP_ACCEPT_ENCODING="gzip",
+            )
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        mock_cache.get.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    def test_select_zstd_when_available(self):
+        """
+        case: zstandard 가 설치된 경우
+
+        1. zstd 를 허용하는 요청은 zstd 로 압축.
+        2. zstd 를 허용하지 않는 요청은 gzip 으로 압축.
+        """
+
+        zstandard = SimpleNamespace(
+            ZstdCompressor=lambda level: SimpleNamespace(compress=lambda c: b"zstd")
+        )
+        content = b"{}" * 1024
+
+        factory = RequestFactory()
+        with patch("config.middleware.zstandard", zstandard):
+            middleware = APICompressionMiddleware(lambda r: HttpResponse(content))
+            response = middleware(
+                factory.get("/api/v1/ping", HTTP_ACCEPT_ENCODING="gzip, zstd")
+            )
+            self.assertEqual(response.headers["Content-Encoding"], "zstd")
+            self.assertEqual(response.content, b"zstd")
+
+            response = middleware(
+                factory.get("/api/v1/ping", HTTP_ACCEPT_ENCODING="gzip")
+            )
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), content)
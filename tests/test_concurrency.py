@@ -0,0 +1,269 @@
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+from boards.serializers import PostDetailSerializer
+from config.concurrency import PreconditionFailed
+from tests.utils import JWTSetupMixin
+
+BASE_API_URL = "/api/v1/boards"
+
+
+# If-Match 를 이용한 낙관적 동시성 제어 test case (config.concurrency)
+class OptimisticConcurrencyTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+        cls.user_comment = CommentModel.objects.create(
+            contents="contents", owner=cls.user, post=cls.user_post
+        )
+
+    def setUp(self):
+        self.api_authentication(self.client, self.user)
+
+    def test_retrieve_post_etag(self):
+        """
+        case: 게시글을 조회할 경우
+
+        1. 200 OK 응답.
+        2. response 데이터에 version 포함, ETag 헤더는 version.
+        """
+
+        response = self.client.get(f"{BASE_API_URL}/posts/{self.user_post.pk}")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["version"], 1)
+        self.assertEqual(response["ETag"], '"1"')
+
+    def test_modify_post_with_matching_if_match(self):
+        """
+        case: 조회한 version 과 같은 If-Match 로 게시글을 수정할 경우
+
+        1. 200 OK 응답.
+        2. version 이 1 증가하고, ETag 헤더도 새 version.
+        """
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+            data={"title": "new title"},
+            format="json",
+            HTTP_IF_MATCH='"1"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["version"], 2)
+        self.assertEqual(response["ETag"], '"2"')
+
+        self.user_post.refresh_from_db()
+        self.assertEqual(self.user_post.title, "new title")
+        self.assertEqual(self.user_post.version, 2)
+
+    def test_modify_post_with_stale_if_match(self):
+        """
+        case: 그 사이 다른 요청에서 수정된 게시글을 이전 version 의 If-Match 로 수정할 경우
+
+        1. 412 Precondition Failed 응답.
+        2. 게시글은 수정되지 않음.
+        """
+
+        PostModel.objects.filter(pk=self.user_post.pk).update(version=2)
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+            data={"title": "new title"},
+            format="json",
+            HTTP_IF_MATCH='"1"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+        self.user_post.refresh_from_db()
+        self.assertEqual(self.user_post.title, "title")
+
+    def test_modify_post_without_changes_with_stale_if_match(self):
+        """
+        case: 바뀐 필드가 없는 수정 요청이라도 If-Match 가 현재 version 과 다를 경우
+
+        1. 412 Precondition Failed 응답.
+        """
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+            data={"title": "title"},
+            format="json",
+            HTTP_IF_MATCH='"3"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_modify_post_with_weak_etag(self):
+        """
+        case: 압축된 응답의 weak ETag(W/"n") 로 게시글을 수정할 경우
+
+        1. 200 OK 응답.
+        """
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+            data={"title": "new title"},
+            format="json",
+            HTTP_IF_MATCH='W/"1"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_modify_post_with_invalid_if_match(self):
+        """
+        case: version 형식이 아닌 If-Match 로 게시글을 수정할 경우
+
+        1. 412 Precondition Failed 응답.
+        """
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+            data={"title": "new title"},
+            format="json",
+            HTTP_IF_MATCH='"abc"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+    def test_modify_post_without_if_match(self):
+        """
+        case: If-Match 없이 게시글을 수정할 경우
+
+        1. 200 OK 응답 (마지막 요청의 내용으로 저장).
+        2. version 은 현재 version 에서 1 증가.
+        """
+
+        PostModel.objects.filter(pk=self.user_post.pk).update(version=5)
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+            data={"title": "new title"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["version"], 6)
+
+    def test_modify_post_version_read_only(self):
+        """
+        case: version 필드를 직접 변경하려는 경우
+
+        1. 200 OK 응답.
+        2. version 필드는 무시하고 1 증가.
+        """
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+            data={"title": "new title", "version": 100},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["version"], 2)
+
+    def test_conditional_update_after_concurrent_modify(self):
+        """
+        case: 조회(version 확인) 이후 저장 전에 다른 요청에서 수정된 경우
+
+        1. UPDATE ... WHERE version = n 에서 수정되는 row 가 없어 PreconditionFailed.
+        2. 다른 요청의 수정 내용이 유지됨.
+        """
+
+        post = PostModel.objects.get(pk=self.user_post.pk)
+        PostModel.objects.filter(pk=post.pk).update(title="other", version=2)
+
+        serializer = PostDetailSerializer(
+            post, data={"title": "new title"}, partial=True
+        )
+        serializer.expected_version = 1
+        serializer.is_valid(raise_exception=True)
+
+        with self.assertRaises(PreconditionFailed):
+            serializer.save()
+
+        post.refresh_from_db()
+        self.assertEqual(post.title, "other")
+
+    def test_delete_post_with_stale_if_match(self):
+        """
+        case: 이전 version 의 If-Match 로 게시글을 삭제할 경우
+
+        1. 412 Precondition Failed 응답.
+        2. 게시글은 삭제되지 않음.
+        """
+
+        PostModel.objects.filter(pk=self.user_post.pk).update(version=2)
+
+        response = self.client.delete(
+            f"{BASE_API_URL}/posts/{self.user_post.pk}", HTTP_IF_MATCH='"1"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertTrue(PostModel.objects.filter(pk=self.user_post.pk).exists())
+
+    def test_delete_post_with_matching_if_match(self):
+        """
+        case: 현재 version 의 If-Match 로 게시글을 삭제할 경우
+
+        1. 204 No Content 응답.
+        """
+
+        response = self.client.delete(
+            f"{BASE_API_URL}/posts/{self.user_post.pk}", HTTP_IF_MATCH='"1"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(PostModel.objects.filter(pk=self.user_post.pk).exists())
+
+    def test_modify_comment_with_stale_if_match(self):
+        """
+        case: 이전 version 의 If-Match 로 댓글을 수정할 경우
+
+        1. 412 Precondition Failed 응답.
+        2. 댓글은 수정되지 않음.
+        """
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/comments/{self.user_comment.pk}",
+            data={"contents": "new contents"},
+            format="json",
+            HTTP_IF_MATCH='"0"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+        self.user_comment.refresh_from_db()
+        self.assertEqual(self.user_comment.contents, "contents")
+
+    def test_modify_comment_with_matching_if_match(self):
+        """
+        case: 현재 version 의 If-Match 로 댓글을 수정할 경우
+
+        1. 200 OK 응답.
+        2. version 이 1 증가.
+        """
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/comments/{self.user_comment.pk}",
+            data={"contents": "new contents"},
+            format="json",
+            HTTP_IF_MATCH='"1"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["version"], 2)
+        self.assertEqual(response["ETag"], '"2"')
@@ -0,0 +1,197 @@
+import csv
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+from tests.utils import JWTSetupMixin
+
+BASE_API_URL = "/api/v1/boards"
+
+
+# 게시글, 댓글 내보내기 test case (boards.exports)
+class BoardExportTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser(
+            username="admin",
+            password="password",
+            email="admin@gmail.com",
+            fullname="admin",
+        )
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.posts = [
+            PostModel.objects.create(
+                title=f"제목 {i}", contents="내용,\n줄바꿈", owner=cls.user
+            )
+            for i in range(5)
+        ]
+        cls.comment = CommentModel.objects.create(
+            contents="댓글", owner=cls.user, post=cls.posts[0]
+        )
+
+    def export(self, path):
+        response = self.client.get(f"{BASE_API_URL}/export/{path}")
+        content = b"".join(response.streaming_content).decode()
+        return response, content
+
+    def test_export_posts_ndjson(self):
+        """
+        case: 관리자가 게시글을 NDJSON 으로 내보낼 경우
+
+        1. 200 OK 응답 (streaming).
+        2. 한 줄에 하나의 게시글을 id 순서로 반환.
+        """
+
+        self.api_authentication(self.client, self.admin)
+        response, content = self.export("posts.ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([row["id"] for row in rows], [post.pk for post in self.posts])
+        self.assertEqual(rows[0]["owner"], self.user.username)
+        self.assertEqual(rows[0]["contents"], "내용,\n줄바꿈")
+
+    def test_export_comments_csv(self):
+        """
+        case: 관리자가 댓글을 CSV 로 내보낼 경우
+
+        1. 200 OK 응답.
+        2. 첫 줄은 열 이름, 이후 한 줄에 하나의 댓글을 반환.
+        """
+
+        self.api_authentication(self.client, self.admin)
+        response, content = self.export("comments.csv")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('filename="comments.csv"', response["Content-Disposition"])
+
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["post"], str(self.posts[0].pk))
+        self.assertEqual(rows[0]["created_date"], self.comment.created_date.isoformat())
+
+    @override_settings(BOARD_EXPORT_BATCH_SIZE=2)
+    def test_export_in_keyset_batches(self):
+        """
+        case: 전체 row 수가 batch 크기보다 많을 경우
+
+        1. id 기준 keyset 조회를 batch 수만큼 수행 (OFFSET 사용하지 않음).
+        2. 모든 게시글을 중복 없이 반환.
+        """
+
+        self.api_authentication(self.client, self.admin)
+
+        with CaptureQueriesContext(connection) as queries:
+            _, content = self.export("posts.csv")
+
+        selects = [
+            query["sql"]
+            for query in queries
+            if "boards_postmodel" in query["sql"] and query["sql"].startswith("SELECT")
+        ]
+        self.assertEqual(len(selects), 3)
+        self.assertFalse(any("OFFSET" in sql for sql in selects))
+
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual([int(row["id"]) for row in rows], [p.pk for p in self.posts])
+
+    async def test_export_under_asgi(self):
+        """
+        case: ASGI 로 내보낼 경우
+
+        1. batch 단위로 전달하는 async iterator 로 응답.
+        """
+
+        await sync_to_async(self.api_authentication)(self.async_client, self.admin)
+
+        with override_settings(BOARD_EXPORT_BATCH_SIZE=2):
+            response = await self.async_client.get(
+                f"{BASE_API_URL}/export/posts.ndjson"
+            )
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+
+        self.assertEqual(len(chunks), 3)
+        rows = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+        self.assertEqual([row["id"] for row in rows], [post.pk for post in self.posts])
+
+    def test_export_with_not_admin(self):
+        """
+        case: 관리자가 아닌 사용자, 인증되지 않은 사용자가 내보내기를 요청할 경우
+
+        1. 403 Forbidden, 401 Unauthorized 응답.
+        """
+
+        response = self.client.get(f"{BASE_API_URL}/export/posts.csv")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.api_authentication(self.client, self.user)
+        response = self.client.get(
+            f"{BASE_API_URL}/export/posts.csv", HTTP_ACCEPT="text/csv"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    def test_export_unknown_model(self):
+        """
+        case: 지원하지 않는 model, 형식을 요청할 경우
+
+        1. 404 Not Found 응답.
+        """
+
+        self.api_authentication(self.client, self.admin)
+
+        response = self.client.get(f"{BASE_API_URL}/export/users.csv")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(f"{BASE_API_URL}/export/posts.xml")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_boards_command(self):
+        """
+        case: manage.py export_boards 로 내보낼 경우
+
+        1. --output 이 없으면 표준 출력으로, 있으면 파일로 저장.
+        """
+
+        stdout = StringIO()
+        call_command("export_boards", "comments", stdout=stdout)
+        self.assertEqual(json.loads(stdout.getvalue())["id"], self.comment.pk)
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            output = Path(output_dir) / "posts.csv"
+            call_command(
+                "export_boards",
+                "posts",
+                "--format=csv",
+                f"--output={output}",
+                "--batch-size=2",
+                stderr=StringIO(),
+            )
+
+            with output.open(newline="", encoding="utf-8") as file:
+                rows = list(csv.DictReader(file))
+
+        self.assertEqual(len(rows), len(self.posts))
+        self.assertEqual(rows[0]["contents"], "내용,\n줄바꿈")
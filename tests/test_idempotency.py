@@ -0,0 +1,210 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import IntegrityError
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+from config.celery import purge_idempotency_keys
+from config.models import IdempotencyKey
+from tests.utils import JWTSetupMixin
+
+BASE_API_URL = "/api/v1"
+
+
+# Idempotency-Key test case
+class IdempotencyKeyTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+
+    def setUp(self):
+        self.api_authentication(self.client, self.user)
+
+    def create_post(self, key="key-1", **data):
+        return self.client.post(
+            path=f"{BASE_API_URL}/boards/posts",
+            data={"title": "게시글 제목", "contents": "게시글 내용", **data},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_replay_post_create(self):
+        """
+        case: 같은 Idempotency-Key 로 게시글 생성을 재시도할 경우
+
+        1. 게시글은 한번만 생성.
+        2. 처음과 같은 201 Created 응답을 반환하고 Idempotent-Replayed 헤더를 추가.
+        3. 재시도 요청은 검증, 저장 쿼리를 실행하지 않음.
+        """
+
+        first = self.create_post()
+
+        with self.assertNumQueries(2):  # 사용자 인증, 저장된 응답 조회
+            retry = self.create_post()
+
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertNotIn("Idempotent-Replayed", first)
+        self.assertEqual(PostModel.objects.filter(title="게시글 제목").count(), 1)
+
+    def test_different_keys(self):
+        """
+        case: 다른 Idempotency-Key 또는 Idempotency-Key 없이 요청할 경우
+
+        1. 각각 새로운 게시글을 생성.
+        """
+
+        self.create_post(key="key-1")
+        self.create_post(key="key-2")
+        self.client.post(
+            path=f"{BASE_API_URL}/boards/posts",
+            data={"title": "게시글 제목", "contents": "게시글 내용"},
+            format="json",
+        )
+
+        self.assertEqual(PostModel.objects.filter(title="게시글 제목").count(), 3)
+
+    def test_reuse_key_with_different_body(self):
+        """
+        case: 같은 Idempotency-Key 를 다른 내용의 요청에 사용할 경우
+
+        1. 422 Unprocessable Entity 응답.
+        """
+
+        self.create_post()
+        response = self.create_post(title="다른 제목")
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.data["detail"].code, "idempotency_key_reused")
+
+    def test_key_in_use(self):
+        """
+        case: 같은 Idempotency-Key 의 요청을 저장할 수 없고 저장된 응답도 없을 경우
+
+        1. 409 Conflict 응답.
+        """
+
+        with patch.object(IdempotencyKey.objects, "create", side_effect=IntegrityError):
+            response = self.create_post()
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(PostModel.objects.filter(title="게시글 제목").exists())
+
+    def test_not_store_failed_request(self):
+        """
+        case: 첫 요청이 검증에 실패한 경우
+
+        1. 응답을 저장하지 않고, 재시도시 다시 처리.
+        """
+
+        response = self.create_post(title="")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.create_post(title="")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn("Idempotent-Replayed", response)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_concurrent_retry_in_other_process(self):
+        """
+        case: 다른 프로세스에서 같은 Idempotency-Key 의 요청을 먼저 저장한 경우
+
+        1. unique 제약으로 key 저장에 실패하면 먼저 저장된 응답을 반환.
+        """
+
+        first = self.create_post()
+        stored = IdempotencyKey.objects.get()
+
+        # 조회 시점에는 없었지만 저장 시점에는 다른 프로세스가 저장한 상황
+        with patch.object(IdempotencyKey.objects, "filter") as mock_filter:
+            mock_filter.return_value.first.side_effect = [None, stored]
+            retry = self.create_post()
+
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(PostModel.objects.filter(title="게시글 제목").count(), 1)
+
+    def test_expired_key(self):
+        """
+        case: 보관 기간이 지난 Idempotency-Key 로 요청할 경우
+
+        1. 새로운 요청으로 처리.
+        2. purge_idempotency_keys 는 보관 기간이 지난 key 만 삭제.
+        """
+
+        self.create_post(key="expired")
+        IdempotencyKey.objects.update(created_date=timezone.now() - timedelta(days=2))
+
+        response = self.create_post(key="expired")
+        self.assertNotIn("Idempotent-Replayed", response)
+        self.assertEqual(PostModel.objects.filter(title="게시글 제목").count(), 2)
+
+        IdempotencyKey.objects.create(key="old", fingerprint="")
+        IdempotencyKey.objects.filter(key="old").update(
+            created_date=timezone.now() - timedelta(days=2)
+        )
+
+        self.assertEqual(purge_idempotency_keys(batch_size=1), 1)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+    def test_replay_comment_create(self):
+        """
+        case: 같은 Idempotency-Key 로 댓글 생성을 재시도할 경우
+
+        1. 댓글은 한번만 생성.
+        """
+
+        for _ in range(2):
+            response = self.client.post(
+                path=f"{BASE_API_URL}/boards/comments",
+                data={"post": self.user_post.id, "contents": "댓글"},
+                format="json",
+                HTTP_IDEMPOTENCY_KEY="comment-key",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response["Idempotent-Replayed"], "true")
+        self.assertEqual(CommentModel.objects.count(), 1)
+
+    @patch("accounts.serializers.task_publisher.publish")  # 테스트시에는 모의 이메일 전송
+    def test_replay_user_registration(self, mock_publish):
+        """
+        case: 같은 Idempotency-Key 로 회원가입을 재시도할 경우
+
+        1. 사용자는 한번만 생성하고, 재시도 요청은 처음 응답을 반환.
+        """
+
+        self.client.cookies.clear()
+        data = {
+            "username": "newuser",
+            "password": "password",
+            "email": "newuser@gmail.com",
+            "fullname": "newuser",
+        }
+
+        for _ in range(2):
+            response = self.client.post(
+                path=f"{BASE_API_URL}/accounts/users",
+                data=data,
+                format="json",
+                HTTP_IDEMPOTENCY_KEY="signup-key",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response["Idempotent-Replayed"], "true")
+        self.assertEqual(User.objects.filter(username="newuser").count(), 1)
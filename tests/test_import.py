@@ -0,0 +1,227 @@
+import json
+import tempfile
+from datetime import datetime, timezone
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from boards import exports
+from boards.models import CommentModel, PostModel
+
+
+# manage.py import_boards test case (boards.imports)
+class ImportBoardsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+        cls.other = User.objects.create_user(
+            username="other",
+            password="password",
+            email="other@gmail.com",
+            fullname="other",
+            is_active=True,
+        )
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "boards.ndjson"
+
+    def write_lines(self, *lines):
+        with self.path.open("w", encoding="utf-8") as file:
+            for line in lines:
+                file.write(line if isinstance(line, str) else json.dumps(line))
+                file.write("\n")
+
+    def import_boards(self, model, *args):
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "import_boards", model, str(self.path), *args, stdout=stdout, stderr=stderr
+        )
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_import_posts(self):
+        """
+        case: 게시글 NDJSON 을 가져올 경우
+
+        1. 검증에 성공한 row 만 저장하고, 실패한 row 는 byte 위치와 오류를 출력.
+        2. 작성자는 username 으로 조회하고, created_date 가 있으면 작성일을 유지.
+        """
+
+        created_date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self.write_lines(
+            {"owner": "kimjihong", "title": "제목", "contents": "내용"},
+            {
+                "owner": "other",
+                "title": "예전 글",
+                "contents": "내용",
+                "created_date": created_date.isoformat(),
+            },
+            {"owner": "unknown", "title": "제목", "contents": "내용"},
+            {"owner": "kimjihong", "contents": "제목 없음"},
+            "{broken",
+        )
+
+        stdout, stderr = self.import_boards("posts")
+
+        self.assertIn("posts 2개를 저장했습니다. (저장하지 못한 row 3개)", stdout)
+        self.assertIn("존재하지 않는 사용자입니다.", stderr)
+        self.assertIn("title", stderr)
+        self.assertIn("JSON 형식 오류", stderr)
+
+        posts = PostModel.objects.order_by("id")
+        self.assertEqual([post.owner for post in posts], [self.user, self.other])
+        self.assertEqual(posts[1].created_date, created_date)
+        self.assertGreater(posts[1].updated_date, created_date)
+
+    def test_import_comments(self):
+        """
+        case: 댓글 NDJSON 을 가져올 경우
+
+        1. 존재하는 게시글의 댓글만 저장.
+        """
+
+        post = PostModel.objects.create(title="title", contents="c", owner=self.user)
+        self.write_lines(
+            {"post": post.pk, "owner": "other", "contents": "댓글"},
+            {"post": post.pk + 100, "owner": "other", "contents": "댓글"},
+        )
+
+        _, stderr = self.import_boards("comments")
+
+        self.assertIn("존재하지 않는 게시글입니다.", stderr)
+        self.assertEqual(CommentModel.objects.get().post, post)
+
+    def test_import_in_chunks_with_batched_owner_lookup(self):
+        """
+        case: chunk 크기보다 많은 row 를 가져올 경우
+
+        1. chunk 마다 진행 상황(offset)을 출력.
+        2. 작성자는 처음 보는 username 만 chunk 단위로 한번에 조회.
+        """
+
+        self.write_lines(
+            *[
+                {"owner": username, "title": f"제목 {i}", "contents": "내용"}
+                for i, username in enumerate(["kimjihong", "other"] * 3)
+            ]
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            _, stderr = self.import_boards("posts", "--chunk-size=2")
+
+        user_queries = [q for q in queries if 'FROM "accounts_user"' in q["sql"]]
+        self.assertEqual(len(user_queries), 1)
+        self.assertEqual(stderr.count("offset="), 3)
+        self.assertEqual(PostModel.objects.count(), 6)
+
+    def test_resume_from_offset(self):
+        """
+        case: 출력된 offset 으로 이어서 가져올 경우
+
+        1. offset 이후의 row 만 저장.
+        2. 줄의 시작 위치가 아닌 offset 은 CommandError.
+        """
+
+        self.write_lines(
+            *[
+                {"owner": "kimjihong", "title": f"제목 {i}", "contents": "내용"}
+                for i in range(3)
+            ]
+        )
+        offset = len(self.path.read_bytes().splitlines(keepends=True)[0])
+
+        self.import_boards("posts", f"--offset={offset}")
+        self.assertEqual(
+            list(PostModel.objects.order_by("id").values_list("title", flat=True)),
+            ["제목 1", "제목 2"],
+        )
+
+        with self.assertRaises(CommandError):
+            self.import_boards("posts", f"--offset={offset + 1}")
+
+    def test_import_exported_posts_again(self):
+        """
+        case: 내보낸(boards.exports) 게시글을 다시 가져올 경우
+
+        1. id 를 유지하여 저장.
+        2. 이미 있는 id 의 row 는 건너뜀 (다시 실행해도 중복 저장하지 않음).
+        """
+
+        posts = [
+            PostModel.objects.create(title=f"제목 {i}", contents="c", owner=self.user)
+            for i in range(3)
+        ]
+        self.path.write_text("".join(exports.export("posts", "ndjson")))
+        PostModel.objects.filter(pk=posts[1].pk).delete()
+
+        stdout, _ = self.import_boards("posts")
+
+        self.assertIn("posts 1개를 저장했습니다.", stdout)
+        restored = PostModel.objects.get(pk=posts[1].pk)
+        self.assertEqual(restored.title, "제목 1")
+        self.assertEqual(restored.created_date, posts[1].created_date)
+        self.assertEqual(PostModel.objects.count(), 3)
+
+    def test_import_rows_with_and_without_id(self):
+        """
+        case: id 가 있는 row 와 없는 row 를 같은 chunk 로 가져올 경우
+
+        1. id 가 있는 row 는 id 를 유지하고, 없는 row 는 겹치지 않는 새 id 로 저장.
+        """
+
+        self.write_lines(
+            {"id": 100, "owner": "kimjihong", "title": "가져온 글", "contents": "내용"},
+            {"owner": "kimjihong", "title": "새 글", "contents": "내용"},
+        )
+
+        stdout, _ = self.import_boards("posts")
+
+        self.assertIn("posts 2개를 저장했습니다.", stdout)
+        self.assertEqual(PostModel.objects.get(pk=100).title, "가져온 글")
+        self.assertGreater(PostModel.objects.get(title="새 글").pk, 100)
+
+    def test_skip_existing_and_duplicated_ids_in_mixed_chunk(self):
+        """
+        case: id 가 없는 row 와 이미 있는 id, chunk 안에서 중복된 id 의 row 를 함께 가져올 경우
+
+        1. 이미 있거나 중복된 id 의 row 만 오류로 출력하고 건너뜀.
+        2. 작성일은 INSERT 한번으로 저장 (UPDATE 없음).
+        """
+
+        created_date = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        post = PostModel.objects.create(title="기존 글", contents="c", owner=self.user)
+        self.write_lines(
+            {"owner": "kimjihong", "title": "새 글", "contents": "내용"},
+            {"id": post.pk, "owner": "kimjihong", "title": "중복", "contents": "내용"},
+            {
+                "id": 100,
+                "owner": "kimjihong",
+                "title": "가져온 글",
+                "contents": "내용",
+                "created_date": created_date.isoformat(),
+            },
+            {"id": 100, "owner": "kimjihong", "title": "중복", "contents": "내용"},
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            stdout, stderr = self.import_boards("posts")
+
+        self.assertIn("posts 2개를 저장했습니다. (저장하지 못한 row 2개)", stdout)
+        self.assertEqual(stderr.count("이미 존재하는 id 입니다."), 2)
+        self.assertFalse(PostModel.objects.filter(title="중복").exists())
+        self.assertEqual(PostModel.objects.get(pk=100).created_date, created_date)
+        self.assertFalse(
+            any(q["sql"].startswith("UPDATE") for q in queries.captured_queries)
+        )
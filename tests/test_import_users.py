@@ -0,0 +1,117 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from accounts.models import User, VerificationMail
+from accounts.tasks import send_pending_verification_mails
+
+
+# manage.py import_users test case (accounts.imports)
+class ImportUsersTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "users.ndjson"
+
+    def write_users(self, *users):
+        with self.path.open("w", encoding="utf-8") as file:
+            for user in users:
+                file.write(json.dumps(user) + "\n")
+
+    def import_users(self, *args):
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "import_users", str(self.path), *args, stdout=stdout, stderr=stderr
+        )
+        return stdout.getvalue(), stderr.getvalue()
+
+    @staticmethod
+    def make_user(username, **data):
+        return {
+            "username": username,
+            "email": f"{username}@GMAIL.COM",
+            "fullname": username,
+            "password": f"{username}-password",
+            **data,
+        }
+
+    def test_import_users(self):
+        """
+        case: 사용자 NDJSON 을 활성화된 사용자로 가져올 경우
+
+        1. 검증에 성공한 사용자만 hashing 된 비밀번호로 저장.
+        2. 이미 있는 username, 파일 안에서 중복된 username, 잘못된 email 은 저장하지 않음.
+        """
+
+        self.write_users(
+            self.make_user("user1"),
+            self.make_user("user2"),
+            self.make_user("user1"),
+            self.make_user("kimjihong"),
+            self.make_user("user3", email="invalid"),
+        )
+
+        stdout, stderr = self.import_users("--processes=1", "--active")
+
+        self.assertIn("users 2개를 저장했습니다. (저장하지 못한 row 3개)", stdout)
+        self.assertEqual(stderr.count("이미 존재하는 사용자입니다."), 2)
+        self.assertIn("email", stderr)
+
+        user = User.objects.get(username="user1")
+        self.assertTrue(user.is_active)
+        self.assertEqual(user.email, "user1@gmail.com")
+        self.assertTrue(user.check_password("user1-password"))
+        self.assertFalse(VerificationMail.objects.exists())
+
+    def test_hash_passwords_in_process_pool(self):
+        """
+        case: 여러 process 에서 비밀번호를 hashing 할 경우
+
+        1. 모든 사용자의 비밀번호가 각자의 비밀번호로 hashing 되어 저장.
+        """
+
+        self.write_users(*[self.make_user(f"user{i}") for i in range(4)])
+
+        self.import_users("--processes=2", "--chunk-size=3")
+
+        for i in range(4):
+            user = User.objects.get(username=f"user{i}")
+            self.assertFalse(user.is_active)
+            self.assertTrue(user.check_password(f"user{i}-password"))
+
+    @patch("accounts.imports.task_publisher.publish")
+    def test_import_users_with_verification(self, mock_publish):
+        """
+        case: 가져온 사용자에게 인증 메일을 전송할 경우
+
+        1. 사용자 별 인증 메일을 저장하고, chunk 마다 batch 전송 task 를 한번 발행.
+        2. 인증 링크로 사용자를 활성화할 수 있음.
+        """
+
+        self.write_users(*[self.make_user(f"user{i}") for i in range(3)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.import_users("--processes=1", "--chunk-size=2", "--send-verification")
+
+        self.assertEqual(VerificationMail.objects.count(), 3)
+        self.assertEqual(mock_publish.call_count, 2)
+        mock_publish.assert_called_with(send_pending_verification_mails, coalesce=True)
+
+        mail = VerificationMail.objects.get(username="user0")
+        self.client.get(mail.verification_url)
+        self.assertTrue(User.objects.get(username="user0").is_active)
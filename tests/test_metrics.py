@@ -0,0 +1,96 @@
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import PostModel
+from config.metrics import get_registry
+from tests.utils import JWTSetupMixin
+
+
+# metrics endpoint test case
+class MetricsTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+
+    def get_sample(self, name: str, **labels) -> float:
+        return get_registry().get_sample_value(name, labels) or 0
+
+    def test_record_request_metrics(self):
+        """
+        case: API 를 요청할 경우
+
+        1. url name 별 요청 처리 시간, 응답 크기, DB 쿼리 수를 기록.
+        2. JWT 검증 시간을 기록.
+        """
+
+        labels = {"view": "post-detail"}
+        before_count = self.get_sample(
+            "http_request_duration_seconds_count", method="GET", **labels
+        )
+        before_queries = self.get_sample("http_request_db_queries_sum", **labels)
+        before_jwt = self.get_sample("jwt_validation_duration_seconds_count")
+
+        self.api_authentication(self.client, self.user)
+        response = self.client.get(path=f"/api/v1/boards/posts/{self.user_post.pk}")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.get_sample(
+                "http_request_duration_seconds_count", method="GET", **labels
+            ),
+            before_count + 1,
+        )
+        self.assertGreaterEqual(
+            self.get_sample(
+                "http_requests_total", method="GET", status="200", **labels
+            ),
+            1,
+        )
+        self.assertGreater(
+            self.get_sample("http_request_db_queries_sum", **labels), before_queries
+        )
+        self.assertGreater(self.get_sample("http_response_size_bytes_sum", **labels), 0)
+        self.assertEqual(
+            self.get_sample("jwt_validation_duration_seconds_count"), before_jwt + 1
+        )
+
+    def test_metrics_endpoint(self):
+        """
+        case: 내부에서 /metrics 를 요청할 경우
+
+        1. 200 Ok 응답.
+        2. Prometheus text 형식으로 metrics 를 반환.
+        """
+
+        self.client.get(path="/api/v1/boards/posts")
+        response = self.client.get(path="/metrics")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        self.assertIn(
+            b'http_request_duration_seconds_count{method="GET",view="post-list"}',
+            response.content,
+        )
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"])
+    def test_metrics_endpoint_from_external_ip(self):
+        """
+        case: 허용되지 않은 IP 에서 /metrics 를 요청할 경우
+
+        1. 404 Not Found 응답.
+        """
+
+        response = self.client.get(path="/metrics")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
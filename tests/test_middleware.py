@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+from django.test import Client, TestCase
+from rest_framework import status
+
+BASE_API_URL = "/api/v1"
+
+
+# path scoped middleware test case
+class PathScopedMiddlewareTestCase(TestCase):
+    def setUp(self):
+        self.csrf_client = Client(enforce_csrf_checks=True)
+
+    def test_admin_request_with_full_middleware(self):
+        """
+        case: admin 페이지를 요청할 경우
+
+        1. 200 Ok 응답.
+        2. session, csrf, clickjacking middleware 가 적용됨.
+        """
+
+        response = self.client.get(path="/admin/login/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("csrftoken", response.cookies)
+        self.assertEqual(response.headers["X-Frame-Options"], "DENY")
+
+    def test_admin_request_without_csrf_token(self):
+        """
+        case: csrf 토큰 없이 admin 로그인을 요청할 경우
+
+        1. 403 Forbidden 응답 (csrf middleware 적용).
+        """
+
+        response = self.csrf_client.post(
+            path="/admin/login/", data={"username": "dummy", "password": "dummy"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    async def test_async_admin_request_with_full_middleware(self):
+        """
+        case: ASGI 로 admin 페이지를 요청할 경우
+
+        1. 200 Ok 응답.
+        2. session, csrf, clickjacking middleware 가 적용됨.
+        """
+
+        response = await self.async_client.get(path="/admin/login/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("csrftoken", response.cookies)
+        self.assertEqual(response.headers["X-Frame-Options"], "DENY")
+
+    def test_api_request_skips_scoped_middleware(self):
+        """
+        case: API 를 요청할 경우
+
+        1. 200 Ok 응답.
+        2. session, csrf, clickjacking middleware 가 적용되지 않음.
+        """
+
+        response = self.client.get(path=f"{BASE_API_URL}/boards/posts")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("X-Frame-Options", response.headers)
+        self.assertNotIn("Cookie", response.headers["Vary"])
+        self.assertEqual(len(response.cookies), 0)
+
+    @patch("accounts.serializers.task_publisher.publish")  # 테스트시에는 모의 이메일 전송
+    def test_api_request_without_csrf_token(self, mock_publish):
+        """
+        case: csrf 토큰 없이 API 를 요청할 경우
+
+        1. 201 Created 응답 (JWT 인증을 사용하므로 csrf 검사하지 않음).
+        """
+
+        response = self.csrf_client.post(
+            path=f"{BASE_API_URL}/accounts/users",
+            data={
+                "username": "kimjihong",
+                "password": "password",
+                "email": "kinjihong9598@gmail.com",
+                "fullname": "kimjihong",
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -164,6 +166,43 @@ class PostListPaginationTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response_error_code, "not_found")
 
+    def test_post_multi_get(self):
+        """
+        case: ids 파라미터로 여러 게시글의 정보를 요청할 경우
+
+        1. 200 Ok 응답.
+        2. 요청한 id 순서대로 반환하고, 존재하지 않는 id 는 제외.
+        3. 하나의 쿼리로 작성자, 댓글 수와 함께 조회.
+        """
+
+        ids = list(PostModel.objects.values_list("id", flat=True)[:3])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                path=f"{BASE_API_URL}/posts",
+                data={"ids": f"{ids[2]},99999,{ids[0]},{ids[1]}"},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [post["id"] for post in response.data], [ids[2], ids[0], ids[1]]
+        )
+        self.assertEqual(response.data[0]["comments"], 0)
+
+    def test_post_multi_get_with_invalid_ids(self):
+        """
+        case: ids 파라미터가 정수가 아니거나 최대 개수를 넘는 경우
+
+        1. 400 Bad Request 응답.
+        """
+
+        response = self.client.get(path=f"{BASE_API_URL}/posts", data={"ids": "1,a"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        ids = ",".join(str(i) for i in range(1, 102))
+        response = self.client.get(path=f"{BASE_API_URL}/posts", data={"ids": ids})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 # posts retrieve test case (READ)
 class PostRetrieveTestCase(APITestCase):
@@ -284,6 +323,52 @@ class PostModifyTestCase(APITestCase, JWTSetupMixin):
             self.assertEqual(response.data[partical_field], "patch-test")
             self.assertNotEqual(before_updated_date, response.data["updated_date"])
 
+    def test_modify_only_changed_fields(self):
+        """
+        case: 게시글의 일부 필드만 변경하는 경우
+
+        1. 변경된 필드와 updated_date 만 UPDATE.
+        """
+
+        self.api_authentication(self.client, self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.put(
+                path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+                data={"title": "new-title", "contents": "contents"},
+                format="json",
+            )
+
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"title"', updates[0])
+        self.assertIn('"updated_date"', updates[0])
+        self.assertNotIn('"contents"', updates[0])
+
+    def test_modify_post_without_changes(self):
+        """
+        case: 기존과 같은 내용으로 게시글을 수정하는 경우
+
+        1. 200 Ok 응답.
+        2. UPDATE 를 실행하지 않고 updated_date 도 유지.
+        """
+
+        self.api_authentication(self.client, self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(
+                path=f"{BASE_API_URL}/posts/{self.user_post.pk}",
+                data={"title": "title", "contents": "contents"},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any(q["sql"].startswith("UPDATE") for q in queries))
+
+        before_updated_date = self.user_post.updated_date
+        self.user_post.refresh_from_db()
+        self.assertEqual(self.user_post.updated_date, before_updated_date)
+
     def test_modfiy_post_with_unauthorized(self):
         """
         case: 인증되지 않은 사용자가 게시글을 수정하려는 경우
@@ -398,6 +483,37 @@ class PostDeleteTestCase(APITestCase, JWTSetupMixin):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(PostModel.objects.filter(pk=self.user_post.pk).exists())
 
+    def test_delete_post_without_prefetching_comments(self):
+        """
+        case: 댓글이 있는 게시글을 삭제하는 경우
+
+        1. 204 No Content 응답.
+        2. 조회가 아니므로 댓글(댓글 작성자)을 prefetch 하지 않음.
+        """
+
+        CommentModel.objects.create(
+            post=self.user_post, contents="contents", owner=self.user
+        )
+
+        self.api_authentication(self.client, self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(
+                path=f"{BASE_API_URL}/posts/{self.user_post.pk}"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        comment_table = CommentModel._meta.db_table
+        self.assertFalse(
+            [
+                q["sql"]
+                for q in queries
+                if q["sql"].startswith("SELECT")
+                and f'FROM "{comment_table}" INNER JOIN' in q["sql"]
+            ]
+        )
+
     def test_delete_other_users_post(self):
         """
         case: 다른 사용자의 게시글을 삭제하려는 경우
@@ -0,0 +1,134 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import PostModel
+from config.profiling import make_token
+
+
+# 요청 프로파일링 test case
+class ProfilingTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+
+    def setUp(self):
+        self.spool_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.spool_dir.cleanup)
+
+        self.url = f"/api/v1/boards/posts/{self.user_post.id}"
+
+    def get_profiles(self) -> list[Path]:
+        return sorted(Path(self.spool_dir.name).iterdir())
+
+    def test_profile_signed_header(self):
+        """
+        case: 서명된 X-Profile-Token 헤더로 요청할 경우
+
+        1. 프로파일 결과와 view 이름, 처리 시간을 spool 디렉토리에 저장.
+        2. 응답에 X-Profile-Id 헤더를 추가.
+        """
+
+        with override_settings(
+            PROFILING_ENABLED=True, PROFILING_SPOOL_DIR=self.spool_dir.name
+        ):
+            response = self.client.get(self.url, HTTP_X_PROFILE_TOKEN=make_token())
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        profile_id = response["X-Profile-Id"]
+        self.assertEqual(
+            [path.name for path in self.get_profiles()],
+            [f"{profile_id}.json", f"{profile_id}.prof"],
+        )
+
+        metadata = json.loads(self.get_profiles()[0].read_text())
+        self.assertEqual(metadata["view"], "post-detail")
+        self.assertEqual(metadata["trigger"], "header")
+        self.assertEqual(metadata["status"], status.HTTP_200_OK)
+        self.assertGreater(metadata["duration"], 0)
+
+    def test_invalid_token(self):
+        """
+        case: 서명이 올바르지 않은 헤더로 요청할 경우
+
+        1. 프로파일링하지 않음.
+        """
+
+        with override_settings(
+            PROFILING_ENABLED=True, PROFILING_SPOOL_DIR=self.spool_dir.name
+        ):
+            response = self.client.get(self.url, HTTP_X_PROFILE_TOKEN="profile:forged")
+
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(self.get_profiles(), [])
+
+    def test_sample_rate(self):
+        """
+        case: 샘플링 비율이 설정된 경우
+
+        1. 헤더 없이도 샘플링된 요청을 프로파일링.
+        """
+
+        with override_settings(
+            PROFILING_ENABLED=True,
+            PROFILING_SAMPLE_RATE=1.0,
+            PROFILING_SPOOL_DIR=self.spool_dir.name,
+        ):
+            response = self.client.get(self.url)
+
+        metadata = json.loads(self.get_profiles()[0].read_text())
+        self.assertEqual(metadata["trigger"], "sample")
+        self.assertIn("X-Profile-Id", response)
+
+    def test_disabled(self):
+        """
+        case: 프로파일링이 비활성화된 경우
+
+        1. 서명된 헤더가 있어도 프로파일링하지 않음.
+        """
+
+        with override_settings(
+            PROFILING_ENABLED=False, PROFILING_SPOOL_DIR=self.spool_dir.name
+        ):
+            response = self.client.get(self.url, HTTP_X_PROFILE_TOKEN=make_token())
+
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(self.get_profiles(), [])
+
+    def test_profile_token_command(self):
+        """
+        case: profile_token 명령어를 실행할 경우
+
+        1. 서명된 헤더 값을 출력.
+        """
+
+        out = StringIO()
+        call_command("profile_token", stdout=out)
+        header, token = out.getvalue().strip().split(": ")
+
+        self.assertEqual(header, "X-Profile-Token")
+
+        with override_settings(
+            PROFILING_ENABLED=True, PROFILING_SPOOL_DIR=self.spool_dir.name
+        ):
+            response = self.client.get(self.url, HTTP_X_PROFILE_TOKEN=token)
+
+        self.assertIn("X-Profile-Id", response)
@@ -0,0 +1,70 @@
+import time
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from config.publisher import BufferedTaskPublisher
+
+
+# buffered task publisher test case
+class BufferedTaskPublisherTestCase(SimpleTestCase):
+    def setUp(self):
+        self.task = MagicMock()
+        self.task.name = "accounts.tasks.dummy"
+
+        patcher = patch("config.publisher.app.producer_or_acquire")
+        self.mock_producer_or_acquire = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.producer = self.mock_producer_or_acquire.return_value.__enter__()
+        self.publisher = BufferedTaskPublisher(flush_interval=0.2, max_batch_size=100)
+
+    def test_publish_in_background_batch(self):
+        """
+        case: 짧은 시간 동안 여러 task 를 발행할 경우
+
+        1. publish 는 broker 에 바로 발행하지 않음.
+        2. background 스레드에서 하나의 producer 로 모아서 발행.
+        """
+
+        for i in range(3):
+            self.publisher.publish(self.task, args=(i,))
+
+        self.task.apply_async.assert_not_called()
+
+        for _ in range(50):
+            if self.task.apply_async.call_count == 3:
+                break
+            time.sleep(0.02)
+
+        self.assertEqual(self.task.apply_async.call_count, 3)
+        self.assertEqual(self.mock_producer_or_acquire.call_count, 1)
+        self.task.apply_async.assert_any_call((2,), {}, producer=self.producer)
+
+    def test_coalesce_same_task(self):
+        """
+        case: coalesce=True 로 같은 task 를 여러번 발행할 경우
+
+        1. 같은 batch 안에서는 한번만 발행.
+        2. 인자가 다르거나 coalesce=False 인 task 는 모두 발행.
+        """
+
+        batch = [self.publisher.make_message(self.task, coalesce=True)] * 3
+        batch.append(self.publisher.make_message(self.task, (1,), coalesce=True))
+        batch.append(self.publisher.make_message(self.task))
+
+        self.publisher._publish_batch(batch)
+
+        self.assertEqual(self.task.apply_async.call_count, 3)
+
+    def test_publish_failure_is_logged(self):
+        """
+        case: broker 에 연결할 수 없는 경우
+
+        1. 예외를 발생시키지 않고 로그를 남김.
+        """
+
+        self.mock_producer_or_acquire.side_effect = ConnectionError
+
+        with self.assertLogs("config.publisher", level="ERROR"):
+            self.publisher._publish_batch([self.publisher.make_message(self.task)])
@@ -0,0 +1,160 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+from boards.serializers import PostListSerializer
+from config.metrics import get_registry
+from config.serializers import RepresentationCacheMixin
+from tests.utils import JWTSetupMixin
+
+BASE_API_URL = "/api/v1/boards"
+
+
+# 게시글, 댓글 직렬화 결과 cache test case (config.serializers.RepresentationCacheMixin)
+class RepresentationCacheTestCase(APITestCase, JWTSetupMixin):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.posts = [
+            PostModel.objects.create(title="title", contents="contents", owner=cls.user)
+            for _ in range(3)
+        ]
+        cls.comment = CommentModel.objects.create(
+            contents="contents", owner=cls.user, post=cls.posts[0]
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_uses_cached_representation(self):
+        """
+        case: 조회한 게시글이 수정되지 않은 상태에서 다시 조회할 경우
+
+        1. updated_date 가 같으면 cache 된 직렬화 결과를 사용.
+        """
+
+        self.client.get(f"{BASE_API_URL}/posts")
+
+        # updated_date 를 바꾸지 않고 수정하면 cache 된 결과가 그대로 반환됨
+        PostModel.objects.filter(pk=self.posts[0].pk).update(title="changed")
+
+        response = self.client.get(f"{BASE_API_URL}/posts")
+        titles = {post["id"]: post["title"] for post in response.data["results"]}
+        self.assertEqual(titles[self.posts[0].pk], "title")
+
+    def test_modified_post_is_serialized_again(self):
+        """
+        case: 조회한 게시글을 수정 API 로 수정한 이후 다시 조회할 경우
+
+        1. updated_date 가 바뀌어 수정된 내용을 반환.
+        """
+
+        self.client.get(f"{BASE_API_URL}/posts/{self.posts[0].pk}")
+
+        self.api_authentication(self.client, self.user)
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/posts/{self.posts[0].pk}",
+            data={"title": "new title"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(f"{BASE_API_URL}/posts/{self.posts[0].pk}")
+        self.assertEqual(response.data["title"], "new title")
+
+    def test_detail_reuses_list_cache(self):
+        """
+        case: 목록에서 조회한 게시글의 세부 정보를 조회할 경우
+
+        1. 목록 조회에서 cache 된 게시글의 직렬화 결과를 사용.
+        """
+
+        self.client.get(f"{BASE_API_URL}/posts")
+        PostModel.objects.filter(pk=self.posts[0].pk).update(title="changed")
+
+        response = self.client.get(f"{BASE_API_URL}/posts/{self.posts[0].pk}")
+        self.assertEqual(response.data["title"], "title")
+
+    def test_uncached_fields_are_serialized(self):
+        """
+        case: 작성자 username, 댓글 수, 댓글이 게시글 수정 없이 바뀐 이후 다시 조회할 경우
+
+        1. uncached_fields 는 cache 하지 않으므로 바뀐 값을 반환.
+        """
+
+        self.client.get(f"{BASE_API_URL}/posts")
+        self.client.get(f"{BASE_API_URL}/posts/{self.posts[0].pk}")
+
+        User.objects.filter(pk=self.user.pk).update(username="changed")
+        CommentModel.objects.create(
+            contents="new comment", owner=self.user, post=self.posts[0]
+        )
+
+        response = self.client.get(f"{BASE_API_URL}/posts")
+        post = next(p for p in response.data["results"] if p["id"] == self.posts[0].pk)
+        self.assertEqual(post["owner"], "changed")
+        self.assertEqual(post["comments"], 2)
+
+        response = self.client.get(f"{BASE_API_URL}/posts/{self.posts[0].pk}")
+        self.assertEqual(response.data["owner"], "changed")
+        self.assertEqual(len(response.data["comments"]), 2)
+        self.assertEqual(response.data["comments"][1]["owner"], "changed")
+
+    def test_only_missing_objects_are_serialized(self):
+        """
+        case: 일부 게시글만 cache 되어 있는 상태에서 목록을 직렬화할 경우
+
+        1. cache 에 없는 게시글만 cache 대상 필드를 직렬화.
+        2. cache 된 결과와 직렬화한 결과를 합쳐 목록 순서대로 반환.
+        """
+
+        queryset = PostModel.objects.select_related("owner").order_by("id")
+        PostListSerializer(self.posts[0]).data  # 첫번째 게시글만 cache
+
+        serialize_fields = patch.object(
+            PostListSerializer,
+            "serialize_fields",
+            wraps=RepresentationCacheMixin.serialize_fields,
+        )
+        with serialize_fields as mock_serialize_fields:
+            data = PostListSerializer(queryset, many=True).data
+
+        serialized = [
+            call.args[0].pk
+            for call in mock_serialize_fields.call_args_list
+            if any(field.field_name == "title" for field in call.args[1])
+        ]
+        self.assertEqual(serialized, [self.posts[1].pk, self.posts[2].pk])
+        self.assertEqual([post["id"] for post in data], [p.pk for p in self.posts])
+        self.assertEqual(list(data[0]), list(PostListSerializer().fields))
+
+    def test_record_cache_metrics(self):
+        """
+        case: 일부 게시글만 cache 되어 있는 상태에서 목록을 직렬화할 경우
+
+        1. cache 된 게시글 수만큼 hit, 나머지는 miss 로 기록 (cache="representation").
+        """
+
+        def get_sample(result):
+            labels = {"cache": "representation", "result": result}
+            return get_registry().get_sample_value("cache_requests_total", labels) or 0
+
+        PostListSerializer(self.posts[0]).data  # 첫번째 게시글만 cache
+        before_hits, before_misses = get_sample("hit"), get_sample("miss")
+
+        queryset = PostModel.objects.select_related("owner")
+        PostListSerializer(queryset, many=True).data
+
+        self.assertEqual(get_sample("hit"), before_hits + 1)
+        self.assertEqual(get_sample("miss"), before_misses + 2)
@@ -0,0 +1,71 @@
+import tempfile
+from pathlib import Path
+
+from django.core.management import call_command
+from django.http import Http404
+from django.test import RequestFactory, SimpleTestCase
+from rest_framework import status
+
+from config.views import PrecomputedSchemaView, load_schema_file
+
+
+# precomputed OpenAPI schema test case
+class PrecomputedSchemaTestCase(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.schema_file = Path(temp_dir.name) / "openapi.json"
+
+        load_schema_file.cache_clear()
+        self.addCleanup(load_schema_file.cache_clear)
+
+        self.view = PrecomputedSchemaView.as_view(
+            schema_file=self.schema_file,
+            content_type="application/vnd.oai.openapi+json",
+        )
+
+    def test_serve_precomputed_schema(self):
+        """
+        case: manage.py spectacular 로 생성된 schema 파일을 요청할 경우
+
+        1. 200 Ok 응답.
+        2. 파일 내용과 ETag 를 반환.
+        """
+
+        call_command("spectacular", format="openapi-json", file=str(self.schema_file))
+
+        response = self.view(self.factory.get("/docs/json/"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, self.schema_file.read_bytes())
+        self.assertTrue(response.headers["ETag"].startswith('"'))
+
+    def test_serve_schema_with_matching_etag(self):
+        """
+        case: 이전에 받은 ETag 로 다시 요청할 경우
+
+        1. 304 Not Modified 응답.
+        2. 파일은 처음 한번만 읽음 (프로세스 메모리에 저장).
+        """
+
+        self.schema_file.write_bytes(b'{"openapi": "3.0.3"}')
+
+        etag = self.view(self.factory.get("/docs/json/")).headers["ETag"]
+        self.schema_file.unlink()
+
+        response = self.view(self.factory.get("/docs/json/", HTTP_IF_NONE_MATCH=etag))
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_serve_schema_without_file(self):
+        """
+        case: schema 파일이 생성되지 않은 경우
+
+        1. 404 Not Found.
+        """
+
+        with self.assertRaises(Http404):
+            self.view(self.factory.get("/docs/json/"))
@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from config.metrics import get_registry
+from config.middleware import SingleFlightMiddleware
+from config.singleflight import ResponseSnapshot
+
+URL = "/api/v1/boards/posts/1"
+
+
+# 동일한 요청을 하나로 합치는 middleware test case
+class SingleFlightMiddlewareTestCase(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+        cache.clear()
+
+    def get_response(self, request):
+        # 요청이 처리되는 동안 다른 요청이 들어오도록 release 될 때까지 대기
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return JsonResponse({"calls": self.calls})
+
+    def run_concurrently(self, middleware, requests: list) -> list:
+        responses = [None] * len(requests)
+
+        def run(index):
+            responses[index] = middleware(requests[index])
+
+        threads = [
+            threading.Thread(target=run, args=(i,)) for i in range(len(requests))
+        ]
+        threads[0].start()
+        self.started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+
+        time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+        return responses
+
+    def test_coalesce_anonymous_get(self):
+        """
+        case: 동일한 익명 GET 요청이 동시에 들어온 경우
+
+        1. 요청은 한번만 처리되고, 모든 요청이 같은 응답을 받음.
+        2. 각 요청은 서로 다른 응답 객체를 받음.
+        """
+
+        middleware = SingleFlightMiddleware(self.get_response)
+        responses = self.run_concurrently(
+            middleware, [self.factory.get(URL) for _ in range(5)]
+        )
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(
+            {response.content for response in responses}, {b'{"calls": 1}'}
+        )
+        self.assertEqual(len({id(response) for response in responses}), 5)
+        self.assertEqual(responses[1]["Content-Type"], "application/json")
+
+    def test_not_coalesce_authenticated_request(self):
+        """
+        case: 인증된 요청, GET 이 아닌 요청, API 가 아닌 요청일 경우
+
+        1. 합치지 않음.
+        """
+
+        middleware = SingleFlightMiddleware(self.get_response)
+
+        self.factory.cookies["access"] = "token"
+        self.assertIsNone(middleware.get_key(self.factory.get(URL)))
+        del self.factory.cookies["access"]
+
+        self.assertIsNone(
+            middleware.get_key(self.factory.get(URL, HTTP_AUTHORIZATION="Bearer a"))
+        )
+        self.assertIsNone(middleware.get_key(self.factory.post(URL)))
+        self.assertIsNone(middleware.get_key(self.factory.get("/admin/")))
+
+        self.assertNotEqual(
+            middleware.get_key(self.factory.get(URL)),
+            middleware.get_key(self.factory.get(f"{URL}?page=2")),
+        )
+
+    @override_settings(ALLOWED_HOSTS=["testserver", ".example.com"])
+    def test_not_coalesce_different_host_or_scheme(self):
+        """
+        case: 같은 경로를 다른 host, scheme 으로 요청할 경우
+
+        1. 응답의 절대 주소(next, previous)가 다르므로 합치지 않음.
+        """
+
+        middleware = SingleFlightMiddleware(self.get_response)
+        key = middleware.get_key(self.factory.get(URL))
+
+        self.assertNotEqual(
+            key, middleware.get_key(self.factory.get(URL, HTTP_HOST="a.example.com"))
+        )
+        self.assertNotEqual(key, middleware.get_key(self.factory.get(URL, secure=True)))
+
+    def test_not_share_response_with_cookies(self):
+        """
+        case: 쿠키를 설정하는 응답일 경우
+
+        1. 응답을 공유하지 않고 각 요청이 직접 처리.
+        """
+
+        def get_response(request):
+            response = self.get_response(request)
+            response.set_cookie("name", "value")
+            return response
+
+        middleware = SingleFlightMiddleware(get_response)
+        self.run_concurrently(middleware, [self.factory.get(URL) for _ in range(3)])
+
+        self.assertEqual(self.calls, 3)
+
+    @override_settings(SINGLE_FLIGHT_CACHE_LOCK=True)
+    def test_wait_for_other_process(self):
+        """
+        case: 다른 프로세스에서 같은 요청을 처리중인 경우 (SINGLE_FLIGHT_CACHE_LOCK)
+
+        1. 직접 처리하지 않고 다른 프로세스가 cache 에 저장한 결과를 받음.
+        """
+
+        middleware = SingleFlightMiddleware(self.get_response)
+        lock_key, result_key = middleware.get_cache_keys(
+            middleware.get_key(self.factory.get(URL))
+        )
+        labels = {"cache": "singleflight", "result": "hit"}
+        before_hits = get_registry().get_sample_value("cache_requests_total", labels)
+
+        # 다른 프로세스가 lock 을 잡고 처리한 뒤 결과를 저장
+        cache.add(lock_key, 1)
+        snapshot = ResponseSnapshot.from_response(HttpResponse(b"other process"))
+        timer = threading.Timer(0.05, cache.set, args=(result_key, snapshot))
+        timer.start()
+
+        response = middleware(self.factory.get(URL))
+        timer.join()
+
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(response.content, b"other process")
+        self.assertEqual(
+            get_registry().get_sample_value("cache_requests_total", labels),
+            (before_hits or 0) + 1,
+        )
+
+    @override_settings(SINGLE_FLIGHT_CACHE_LOCK=True)
+    def test_release_cache_lock(self):
+        """
+        case: leader 가 처리를 마친 경우 (SINGLE_FLIGHT_CACHE_LOCK)
+
+        1. lock 을 해제하고 다른 프로세스가 사용할 수 있도록 결과를 cache 에 저장.
+        """
+
+        self.release.set()
+        middleware = SingleFlightMiddleware(self.get_response)
+        middleware(self.factory.get(URL))
+
+        lock_key, result_key = middleware.get_cache_keys(
+            middleware.get_key(self.factory.get(URL))
+        )
+        self.assertNotIn(lock_key, cache)
+        self.assertEqual(cache.get(result_key).content, b'{"calls": 1}')
+
+    def test_coalesce_async(self):
+        """
+        case: ASGI 환경에서 동일한 익명 GET 요청이 동시에 들어온 경우
+
+        1. 요청은 한번만 처리되고, 모든 요청이 같은 응답을 받음.
+        """
+
+        async def get_response(request):
+            self.calls += 1
+            await asyncio.sleep(0.05)
+            return JsonResponse({"calls": self.calls})
+
+        middleware = SingleFlightMiddleware(get_response)
+
+        async def run():
+            return await asyncio.gather(
+                *[middleware(self.factory.get(URL)) for _ in range(5)]
+            )
+
+        responses = async_to_sync(run)()
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(
+            {response.content for response in responses}, {b'{"calls": 1}'}
+        )
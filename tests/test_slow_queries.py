@@ -0,0 +1,66 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import PostModel
+from config.celery import purge_task_results
+
+LOGGER = "config.slow_queries"
+
+
+# 느린 쿼리 로그 test case
+class SlowQueryLogTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.user_post = PostModel.objects.create(
+            title="title", contents="contents", owner=cls.user
+        )
+
+    @override_settings(SLOW_QUERY_THRESHOLD=0)
+    def test_log_view_query(self):
+        """
+        case: view 에서 기준 시간보다 오래 걸린 쿼리가 실행될 경우
+
+        1. 쿼리, 실행 시간, 파라미터 수와 함께 view 의 url name, 호출한 프로젝트 코드 위치를 기록.
+        """
+
+        with self.assertLogs(LOGGER, "WARNING") as logs:
+            self.client.get("/api/v1/boards/posts")
+
+        output = "\n".join(logs.output)
+        self.assertIn("origin=view:post-list", output)
+        self.assertIn("caller=boards/paginations.py", output)
+        self.assertIn("params=0", output)
+        self.assertIn('FROM "boards_postmodel"', output)
+
+    @override_settings(SLOW_QUERY_THRESHOLD=0)
+    def test_log_task_query(self):
+        """
+        case: task 에서 기준 시간보다 오래 걸린 쿼리가 실행될 경우
+
+        1. task 이름을 기록.
+        """
+
+        with self.assertLogs(LOGGER, "WARNING") as logs:
+            purge_task_results.apply()
+
+        self.assertIn("origin=task:config.celery.purge_task_results", logs.output[0])
+
+    @override_settings(SLOW_QUERY_THRESHOLD=None)
+    def test_disabled(self):
+        """
+        case: 기준 시간이 설정되지 않은 경우
+
+        1. 쿼리를 기록하지 않음.
+        """
+
+        with self.assertNoLogs(LOGGER):
+            self.client.get(f"/api/v1/boards/posts/{self.user_post.id}")
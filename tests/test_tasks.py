@@ -0,0 +1,313 @@
+import time
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPException
+from unittest.mock import MagicMock, patch
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from django_celery_results.models import TaskResult
+
+from accounts.models import VerificationMail
+from accounts.tasks import (
+    clean_expiry_token,
+    send_pending_verification_mails,
+    send_verification_mail,
+)
+from config.celery import app, purge_task_results, record_task_queue_wait
+from config.metrics import get_registry
+
+
+@app.task(name="tests.failing_task")
+def failing_task():
+    raise ValueError("failing task")
+
+
+# celery task result test case
+class TaskResultTestCase(TestCase):
+    def test_fire_and_forget_tasks_ignore_result(self):
+        """
+        case: 결과를 사용하지 않는 task 인 경우
+
+        1. TaskResult 가 저장되지 않도록 ignore_result 설정.
+        """
+
+        self.assertTrue(send_verification_mail.ignore_result)
+        self.assertTrue(send_pending_verification_mails.ignore_result)
+        self.assertTrue(clean_expiry_token.ignore_result)
+        self.assertTrue(purge_task_results.ignore_result)
+
+    def test_purge_expired_task_results(self):
+        """
+        case: 보관 기간이 지난 task 결과가 있는 경우
+
+        1. 보관 기간이 지난 결과만 batch_size 개씩 나누어 삭제.
+        2. 삭제한 결과의 개수를 반환.
+        """
+
+        for i in range(5):
+            TaskResult.objects.create(task_id=f"expired-{i}", status="SUCCESS")
+        TaskResult.objects.create(task_id="recent", status="SUCCESS")
+
+        # date_done 은 auto_now 이므로 update 로 변경
+        TaskResult.objects.filter(task_id__startswith="expired").update(
+            date_done=timezone.now() - timedelta(days=2)
+        )
+
+        deleted = purge_task_results(batch_size=2)
+
+        self.assertEqual(deleted, 5)
+        self.assertQuerysetEqual(
+            TaskResult.objects.values_list("task_id", flat=True), ["recent"]
+        )
+
+
+# batch verification mail test case
+class VerificationMailBatchTestCase(TestCase):
+    def setUp(self):
+        for i in range(5):
+            VerificationMail.objects.create(
+                username=f"user-{i}",
+                email=f"user-{i}@gmail.com",
+                verification_url=f"http://localhost:8000/activate/{i}",
+            )
+
+    def test_send_pending_mails_over_single_connection(self):
+        """
+        case: 전송 대기중인 인증 메일이 있는 경우
+
+        1. batch_size 개씩 나누어 모든 메일을 전송.
+        2. SMTP 연결은 한번만 생성.
+        3. 전송한 메일은 대기 목록에서 삭제.
+        """
+
+        with patch(
+            "accounts.tasks.get_connection", wraps=get_connection
+        ) as mock_get_connection:
+            sent = send_pending_verification_mails(batch_size=2)
+
+        self.assertEqual(sent, 5)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(mail.outbox[0].to, ["user-0@gmail.com"])
+        self.assertIn("http://localhost:8000/activate/0", mail.outbox[0].body)
+        self.assertEqual(mock_get_connection.call_count, 1)
+        self.assertFalse(VerificationMail.objects.exists())
+
+    def test_send_without_pending_mails(self):
+        """
+        case: 전송 대기중인 인증 메일이 없는 경우
+
+        1. SMTP 연결을 생성하지 않음.
+        """
+
+        VerificationMail.objects.all().delete()
+
+        with patch("accounts.tasks.get_connection") as mock_get_connection:
+            sent = send_pending_verification_mails()
+
+        self.assertEqual(sent, 0)
+        mock_get_connection.assert_not_called()
+
+    def test_skip_mails_claimed_by_other_worker(self):
+        """
+        case: 다른 worker 가 선점한 메일이 있는 경우
+
+        1. 선점되지 않은 메일만 전송.
+        """
+
+        claimed = VerificationMail.objects.claim(2, timedelta(minutes=10))
+
+        sent = send_pending_verification_mails()
+
+        self.assertEqual(sent, 3)
+        self.assertQuerysetEqual(
+            VerificationMail.objects.order_by("id"), claimed, transform=lambda x: x
+        )
+
+    def test_release_mails_on_smtp_error(self):
+        """
+        case: SMTP 오류로 전송에 실패한 경우
+
+        1. 예외를 다시 발생시켜 재시도 (autoretry_for).
+        2. 선점한 메일을 해제하여 다음 재시도에서 전송할 수 있어야함.
+        """
+
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=SMTPException,
+        ):
+            with self.assertRaises(SMTPException):
+                send_pending_verification_mails(batch_size=2)
+
+        self.assertEqual(VerificationMail.objects.count(), 5)
+        self.assertFalse(
+            VerificationMail.objects.filter(claim_token__isnull=False).exists()
+        )
+
+    def test_not_resend_mails_sent_before_smtp_error(self):
+        """
+        case: batch 의 일부 메일을 전송한 뒤 SMTP 오류가 발생한 경우
+
+        1. 전송한 메일은 삭제하고, 전송하지 못한 메일만 선점을 해제.
+        2. 재시도하면 전송하지 못한 메일만 전송.
+        """
+
+        send_messages = EmailBackend.send_messages
+        calls = []
+
+        def fail_third_mail(backend, messages):
+            calls.append(messages)
+            if len(calls) == 3:
+                raise SMTPException
+            return send_messages(backend, messages)
+
+        with patch.object(EmailBackend, "send_messages", fail_third_mail):
+            with self.assertRaises(SMTPException):
+                send_pending_verification_mails(batch_size=5)
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(VerificationMail.objects.count(), 3)
+        self.assertFalse(
+            VerificationMail.objects.filter(claim_token__isnull=False).exists()
+        )
+
+        self.assertEqual(send_pending_verification_mails(), 3)
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            [f"user-{i}@gmail.com" for i in range(5)],
+        )
+
+
+# celery task routing test case
+class TaskRoutingTestCase(SimpleTestCase):
+    def publish(self, task, *args):
+        """
+        in-memory broker 로 task 를 발행하고 각 queue 에 전달된 task 이름을 반환
+        """
+
+        with app.connection_for_write("memory://") as connection:
+            task.apply_async(args=args, connection=connection)
+
+            published = {}
+            for queue_name in ("default", "mail", "maintenance"):
+                with connection.SimpleQueue(queue_name) as queue:
+                    published[queue_name] = [
+                        queue.get(timeout=1).headers["task"] for _ in range(len(queue))
+                    ]
+
+        return published
+
+    def test_route_mail_task(self):
+        """
+        case: 인증 메일 task 를 발행할 경우
+
+        1. mail queue 로만 전달.
+        """
+
+        published = self.publish(
+            send_verification_mail, "kimjihong", "kinjihong9598@gmail.com", "url"
+        )
+
+        self.assertEqual(published["mail"], [send_verification_mail.name])
+        self.assertEqual(published["maintenance"], [])
+        self.assertEqual(published["default"], [])
+
+        published = self.publish(send_pending_verification_mails)
+        self.assertEqual(published["mail"], [send_pending_verification_mails.name])
+
+    def test_route_maintenance_tasks(self):
+        """
+        case: 정리 task 를 발행할 경우
+
+        1. maintenance queue 로만 전달.
+        2. 작업이 끝난 뒤 ack (acks_late).
+        """
+
+        for task in (clean_expiry_token, purge_task_results):
+            published = self.publish(task)
+
+            self.assertEqual(published["maintenance"], [task.name])
+            self.assertEqual(published["mail"], [])
+            self.assertTrue(task.acks_late)
+
+        self.assertFalse(send_verification_mail.acks_late)
+
+
+# celery task metrics test case
+class TaskMetricsTestCase(TestCase):
+    def get_sample(self, name: str, **labels) -> float:
+        return get_registry().get_sample_value(name, labels) or 0
+
+    def test_add_published_at_header(self):
+        """
+        case: task 를 broker 로 발행할 경우
+
+        1. 발행 시각(published_at)을 header 에 추가.
+        """
+
+        with app.connection_for_write("memory://") as connection:
+            clean_expiry_token.apply_async(connection=connection)
+
+            with connection.SimpleQueue("maintenance") as queue:
+                message = queue.get(timeout=1)
+
+        self.assertAlmostEqual(message.headers["published_at"], time.time(), delta=5)
+
+    def test_record_queue_wait(self):
+        """
+        case: 발행된 task 가 worker 에서 실행될 경우
+
+        1. 발행부터 실행 시작까지 걸린 시간을 task 이름 별로 기록.
+        """
+
+        task = MagicMock()
+        task.name = "tests.dummy_task"
+        task.request.published_at = time.time() - 5
+        task.request.eta = None
+
+        before = self.get_sample(
+            "celery_task_queue_wait_seconds_sum", task="tests.dummy_task"
+        )
+        record_task_queue_wait(task_id="dummy", task=task)
+
+        self.assertGreaterEqual(
+            self.get_sample("celery_task_queue_wait_seconds_sum", task=task.name),
+            before + 5,
+        )
+
+    def test_record_runtime_and_failure(self):
+        """
+        case: task 가 성공하거나 실패할 경우
+
+        1. task 이름, 상태 별로 실행 시간을 기록.
+        2. 실패한 경우 실패 수를 기록.
+        3. task_metrics 명령어로 요약을 출력.
+        """
+
+        labels = {"task": purge_task_results.name, "state": "SUCCESS"}
+        before_success = self.get_sample("celery_task_runtime_seconds_count", **labels)
+        before_failures = self.get_sample(
+            "celery_task_failures_total", task=failing_task.name
+        )
+
+        purge_task_results.apply()
+        failing_task.apply()
+
+        self.assertEqual(
+            self.get_sample("celery_task_runtime_seconds_count", **labels),
+            before_success + 1,
+        )
+        self.assertEqual(
+            self.get_sample("celery_task_failures_total", task=failing_task.name),
+            before_failures + 1,
+        )
+
+        out = StringIO()
+        call_command("task_metrics", stdout=out)
+
+        self.assertIn(purge_task_results.name, out.getvalue())
+        self.assertIn(failing_task.name, out.getvalue())
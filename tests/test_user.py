@@ -1,6 +1,8 @@
 from http.cookies import SimpleCookie
-from unittest.mock import ANY, patch
+from unittest.mock import patch
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.token_blacklist.models import (
@@ -8,7 +10,8 @@ from rest_framework_simplejwt.token_blacklist.models import (
     OutstandingToken,
 )
 
-from accounts.models import User
+from accounts.models import User, VerificationMail
+from accounts.tasks import send_pending_verification_mails
 from tests.utils import JWTSetupMixin
 
 BASE_API_URL = "/api/v1/accounts"
@@ -16,8 +19,8 @@ BASE_API_URL = "/api/v1/accounts"
 
 # Email verification test
 class EmailVerificationTestCase(APITestCase):
-    @patch("accounts.tasks.send_verification_mail.delay")  # 테스트시에는 모의 이메일 전송
-    def setUp(self, mock_send_verification_mail):
+    @patch("accounts.serializers.task_publisher.publish")  # 테스트시에는 모의 이메일 전송
+    def setUp(self, mock_publish):
         self.client.post(
             path=f"{BASE_API_URL}/users",
             data={
@@ -28,7 +31,7 @@ class EmailVerificationTestCase(APITestCase):
             },
         )
 
-        self.verification_url = mock_send_verification_mail.call_args[0][2]
+        self.verification_url = VerificationMail.objects.get().verification_url
 
     def test_email_verification(self):
         """
@@ -45,6 +48,27 @@ class EmailVerificationTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertTrue(user.is_active)
 
+    def test_email_verification_updates_is_active_only(self):
+        """
+        case: email 인증 링크로 요청한 경우
+
+        1. is_active 필드만 UPDATE.
+        2. 이미 인증된 계정은 UPDATE 하지 않음.
+        """
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(path=self.verification_url)
+
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertRegex(updates[0], r'SET "is_active" = \S+ WHERE')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path=self.verification_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any(q["sql"].startswith("UPDATE") for q in queries))
+
 
 # CREATE test case
 class UserRegistrationTestCase(APITestCase):
@@ -74,10 +98,8 @@ class UserRegistrationTestCase(APITestCase):
             "fullname": "kimjihong",
         }
 
-    @patch("accounts.tasks.send_verification_mail.delay")  # 테스트시에는 모의 이메일 전송
-    def test_registration_and_send_email_verification(
-        self, mock_send_verification_mail
-    ):
+    @patch("accounts.serializers.task_publisher.publish")  # 테스트시에는 모의 이메일 전송
+    def test_registration_and_send_email_verification(self, mock_publish):
         """
         case: 정상적으로 새로운 user 가 생성된 경우
 
@@ -87,7 +109,12 @@ class UserRegistrationTestCase(APITestCase):
         4. 생성된 사용자의 Email로 인증 메일을 보내야함.
         """
 
-        response = self.client.post(path=f"{BASE_API_URL}/users", data=self.new_user)
+        # 사용자 정보가 commit 된 이후에 task 발행
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                path=f"{BASE_API_URL}/users", data=self.new_user
+            )
+            mock_publish.assert_not_called()
 
         new_user = User.objects.get(id=2)
         self.new_user_info.pop("password")
@@ -97,8 +124,11 @@ class UserRegistrationTestCase(APITestCase):
         self.assertFalse(new_user.is_active)
 
         # 인증 메일 전송 확인(실제로는 보내지 않음.)
-        mock_send_verification_mail.assert_called_once_with(
-            self.new_user["username"], self.new_user["email"], ANY
+        verification_mail = VerificationMail.objects.get()
+        self.assertEqual(verification_mail.username, self.new_user["username"])
+        self.assertEqual(verification_mail.email, self.new_user["email"])
+        mock_publish.assert_called_once_with(
+            send_pending_verification_mails, coalesce=True
         )
 
     def test_registration_unique_username_validate(self):
@@ -349,6 +379,48 @@ class UserModifyTestCase(APITestCase, JWTSetupMixin):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertNotEqual(user_instance.password, self.update_user["password"])
 
+    def test_modify_same_password(self):
+        """
+        case: 기존과 같은 비밀번호로 수정하는 경우
+
+        1. 200 OK 응답.
+        2. 비밀번호 hash 를 다시 저장하지 않음.
+        """
+
+        self.api_authentication(self.client, self.user)
+        before_password = User.objects.get(id=1).password
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/users", data={"password": "password"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(User.objects.get(id=1).password, before_password)
+
+    def test_modify_user_without_changes(self):
+        """
+        case: 기존과 같은 값으로 사용자 정보를 수정하는 경우
+
+        1. 200 OK 응답.
+        2. 저장하지 않았으므로 로그아웃하지 않음.
+           - refresh token 을 blacklist 에 추가하지 않음
+           - refresh, access token cookie 를 삭제하지 않음
+        """
+
+        refresh_token, _ = self.api_authentication(self.client, self.user)
+
+        response = self.client.patch(
+            path=f"{BASE_API_URL}/users",
+            data={"username": self.user.username, "password": "password"},
+        )
+
+        refresh_id = OutstandingToken.objects.get(token=refresh_token).id
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(BlacklistedToken.objects.filter(token_id=refresh_id).exists())
+        self.assertNotIn("refresh", response.cookies)
+        self.assertNotIn("access", response.cookies)
+
 
 # DELETE test case
 class UserDeleteTestCase(APITestCase, JWTSetupMixin):
@@ -0,0 +1,131 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from accounts.models import User
+from boards.models import CommentModel, PostModel
+
+BASE_API_URL = "/api/v1/boards"
+
+
+# manage.py warm_caches test case
+class WarmCachesTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="kimjihong",
+            password="password",
+            email="kinjihong9598@gmail.com",
+            fullname="kimjihong",
+            is_active=True,
+        )
+
+        cls.posts = [
+            PostModel.objects.create(title="title", contents="contents", owner=cls.user)
+            for _ in range(12)
+        ]
+        cls.comment = CommentModel.objects.create(
+            contents="contents", owner=cls.user, post=cls.posts[0]
+        )
+
+    def setUp(self):
+        cache.clear()
+
+        # 테스트는 같은 프로세스에서 요청하므로 LocMemCache 를 공유 cache 로 간주
+        patcher = patch(
+            "config.management.commands.warm_caches.Command.is_shared_cache",
+            return_value=True,
+        )
+        self.mock_is_shared_cache = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def warm_caches(self, *args):
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "warm_caches", "--concurrency", "1", *args, stdout=stdout, stderr=stderr
+        )
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_warm_list_pages(self):
+        """
+        case: 게시글 목록 첫 페이지를 미리 cache 할 경우
+
+        1. 첫 페이지의 게시글은 cache 된 직렬화 결과를 반환.
+        2. 다음 페이지의 게시글은 cache 하지 않음.
+        """
+
+        stdout, _ = self.warm_caches("--pages", "1", "--most-commented", "0")
+        self.assertIn("게시글 목록 1 페이지: 게시글 10개", stdout)
+
+        # updated_date 를 바꾸지 않고 수정하면 cache 된 게시글은 이전 결과를 반환
+        PostModel.objects.update(title="changed")
+
+        response = self.client.get(f"{BASE_API_URL}/posts")
+        self.assertEqual(
+            {post["title"] for post in response.data["results"]}, {"title"}
+        )
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            {post["title"] for post in response.data["results"]}, {"changed"}
+        )
+
+    def test_warm_most_commented_posts(self):
+        """
+        case: 댓글이 많은 게시글을 미리 cache 할 경우
+
+        1. 댓글이 있는 게시글의 세부 정보(게시글, 댓글)는 cache 된 직렬화 결과를 반환.
+        """
+
+        stdout, _ = self.warm_caches("--pages", "0", "--most-commented", "5")
+        self.assertIn(f"게시글 {self.posts[0].pk} 세부 정보: 댓글 1개", stdout)
+        self.assertNotIn(f"게시글 {self.posts[1].pk} 세부 정보", stdout)
+
+        PostModel.objects.update(title="changed")
+        CommentModel.objects.update(contents="changed")
+
+        response = self.client.get(f"{BASE_API_URL}/posts/{self.posts[0].pk}")
+        self.assertEqual(response.data["title"], "title")
+        self.assertEqual(response.data["comments"][0]["contents"], "contents")
+
+    def test_warm_schema_files(self):
+        """
+        case: 미리 생성된 schema 파일이 있는 경우와 없는 경우
+
+        1. 있는 schema 파일은 읽어서 크기를 출력.
+        2. 없는 schema 파일은 오류를 출력하고 나머지 작업은 계속 수행.
+        """
+
+        with tempfile.TemporaryDirectory() as schema_dir:
+            (Path(schema_dir) / "openapi.json").write_text("{}")
+
+            with override_settings(OPENAPI_SCHEMA_DIR=Path(schema_dir)):
+                stdout, stderr = self.warm_caches("--pages", "1")
+
+        self.assertIn("schema openapi.json: 2 bytes", stdout)
+        self.assertIn("schema openapi.yaml", stderr)
+        self.assertIn("게시글 목록 1 페이지", stdout)
+
+    def test_process_local_cache(self):
+        """
+        case: 기본 cache 가 프로세스 안에만 저장되는 경우
+
+        1. --base-url 이 없으면 CommandError.
+        2. --base-url 이 있으면 직렬화 결과는 cache 하지 않고 서버에 요청.
+        """
+
+        self.mock_is_shared_cache.return_value = False
+
+        with self.assertRaises(CommandError):
+            self.warm_caches()
+
+        stdout, stderr = self.warm_caches("--base-url", "http://127.0.0.1:1")
+        self.assertNotIn("게시글 목록 1 페이지", stdout)
+        self.assertIn("프로세스 안에만 저장", stderr)
+        self.assertIn("HTTP 게시글 목록", stderr)